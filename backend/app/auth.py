@@ -2,11 +2,16 @@
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
+import time
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from app.models.user import User
-from app.database import get_db
+from app.database import get_db, replicas
+from app.utils.ttl_cache import TTLCache
+from app.utils.hashing_executor import hashing_executor
 import os
 
 
@@ -31,7 +36,56 @@ def _ensure_bcrypt_about() -> None:
 
 # Password hashing
 _ensure_bcrypt_about()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Hashing profile. New hashes use AUTH_HASH_SCHEME with these costs; stored
+# hashes made with another scheme or cost still verify and are flagged by
+# password_needs_update() so login can rehash them.
+AUTH_HASH_SCHEME = os.getenv("AUTH_HASH_SCHEME", "bcrypt").lower()  # "bcrypt" or "argon2id"
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+ARGON2_MEMORY_KIB = int(os.getenv("ARGON2_MEMORY_KIB", "65536"))
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "4"))
+
+
+def _argon2_available() -> bool:
+    try:
+        import argon2  # noqa: F401  (argon2-cffi, optional)
+        return True
+    except ImportError:
+        return False
+
+
+def build_crypt_context(
+    scheme: str = AUTH_HASH_SCHEME,
+    bcrypt_rounds: int = BCRYPT_ROUNDS,
+    argon2_memory_kib: int = ARGON2_MEMORY_KIB,
+    argon2_time_cost: int = ARGON2_TIME_COST,
+    argon2_parallelism: int = ARGON2_PARALLELISM,
+) -> CryptContext:
+    schemes = ["bcrypt"]
+    settings = {
+        "bcrypt__rounds": bcrypt_rounds,
+        # Pin the cost both ways so lowering it also rehashes on login.
+        "bcrypt__min_rounds": bcrypt_rounds,
+        "bcrypt__max_rounds": bcrypt_rounds,
+    }
+    if _argon2_available():
+        schemes.append("argon2")
+        settings.update({
+            "argon2__type": "ID",
+            "argon2__memory_cost": argon2_memory_kib,
+            "argon2__time_cost": argon2_time_cost,
+            "argon2__parallelism": argon2_parallelism,
+        })
+        if scheme == "argon2id":
+            schemes.reverse()
+    elif scheme == "argon2id":
+        print("⚠️ AUTH_HASH_SCHEME=argon2id needs argon2-cffi; falling back to bcrypt")
+    # The first scheme hashes; the rest are deprecated, i.e. verify-then-upgrade.
+    return CryptContext(schemes=schemes, deprecated="auto", **settings)
+
+
+pwd_context = build_crypt_context()
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -39,37 +93,211 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+def password_needs_update(hashed_password: str) -> bool:
+    """True when the stored hash uses an old scheme or cost (no hashing involved)."""
+    return pwd_context.needs_update(hashed_password)
+
+# Awaitable variants for request handlers: bcrypt runs on the bounded
+# hashing pool instead of the event loop / shared request threadpool.
+async def hash_password_async(password: str) -> str:
+    return await hashing_executor.run(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await hashing_executor.run(verify_password, plain_password, hashed_password)
+
 # JWT creation
 SECRET_KEY = os.getenv("SECRET_KEY", "your_secret_key_here")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
-def create_access_token(user_id: int, expires_delta: int = ACCESS_TOKEN_EXPIRE_MINUTES):
+def create_access_token(user_id: int, expires_delta: int = ACCESS_TOKEN_EXPIRE_MINUTES, role: str = None):
     to_encode = {"user_id": user_id}  # include user_id
+    if role:
+        to_encode["role"] = role  # informational for clients; the server uses the cached principal
     expire = datetime.utcnow() + timedelta(minutes=expires_delta)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-# OAuth2 dependency
+# -------------------------
+# Principal cache
+# -------------------------
+class Principal:
+    """The parts of a User that routes need, without an ORM session."""
+
+    __slots__ = ("id", "role", "email", "full_name")
+
+    def __init__(self, id: int, role: str, email: str, full_name: str):
+        self.id = id
+        self.role = role
+        self.email = email
+        self.full_name = full_name
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(user.id, user.role, user.email, user.full_name)
+
+
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+
+principal_cache = TTLCache(USER_CACHE_TTL_SECONDS, USER_CACHE_MAX_ENTRIES)
+
+
+def invalidate_user(user_id: int) -> None:
+    principal_cache.pop(user_id)
+
+
+# Any User insert/update/delete (registration, password reset, role change,
+# scripts) drops the cached principal once the transaction commits. A
+# request that read the old row before the commit may finish after the
+# drop; load_principal's cache ticket is revoked by the drop, so that
+# request does not re-cache the old row.
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _queue_principal_invalidation(mapper, connection, target):
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_user_ids", set()).add(target.id)
+    else:
+        invalidate_user(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session):
+    for user_id in session.info.pop("changed_user_ids", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session):
+    session.info.pop("changed_user_ids", None)
+
+
+# -------------------------
+# Principal resolution
+# -------------------------
+# Single auth stack for every router. Tokens carry the user id in "user_id"
+# (create_access_token) or, from the retired app.utils.auth_utils helpers, in
+# "sub"; both are accepted.
+DECODED_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("DECODED_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+
+# Keyed by the whole token string (header, claims and signature), never by
+# the signature alone, and kept no longer than the token's own expiry.
+token_cache = TTLCache(ACCESS_TOKEN_EXPIRE_MINUTES * 60, DECODED_TOKEN_CACHE_MAX_ENTRIES)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+
+def decode_user_id(token: str) -> int:
+    """User id from a valid access token; raises JWTError otherwise."""
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    raw_id = payload.get("user_id", payload.get("sub"))
+    try:
+        user_id = int(raw_id)
+    except (TypeError, ValueError):
+        raise JWTError("Token has no user id")
+
+    expires_at = None
+    if payload.get("exp") is not None:
+        expires_at = time.monotonic() + (payload["exp"] - time.time())
+    token_cache.set(token, user_id, expires_at=expires_at)
+    return user_id
+
+
+def load_principal(db: Session, user_id: int) -> Optional[Principal]:
+    """Cached principal for a user id; None if the user no longer exists."""
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    # Reserve before reading: an invalidation after this point revokes the
+    # ticket, and the row read here is then not cached.
+    ticket = principal_cache.reserve(user_id)
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None:
+            return None
+        principal = Principal.from_user(user)
+        principal_cache.set(user_id, principal, ticket=ticket)
+        return principal
+    finally:
+        principal_cache.release(user_id, ticket)
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Principal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("user_id")
-        if user_id is None:
-            raise credentials_exception
+        user_id = decode_user_id(token)
     except JWTError:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    principal = load_principal(db, user_id)
+    if principal is None:
         raise credentials_exception
-    return user
+    return principal
+
+
+def require_role(required_role: str):
+    """Dependency to check if user has required role"""
+    def role_checker(current_user: Principal = Depends(get_current_user)):
+        if str(current_user.role).lower() != required_role.lower():
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Access denied. {required_role.capitalize()} role required."
+            )
+        return current_user
+    return role_checker
+
+
+# -------------------------
+# Read-your-writes (read replicas)
+# -------------------------
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware:
+    """Pin a user's reads to the primary right after they send a write.
+
+    Puts the caller's user id on ``request.state.user_id`` for get_read_db
+    and, for non-GET requests, records the write via replicas.note_write()
+    before the response goes out. A no-op without read replicas.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not replicas.enabled:
+            return await self.app(scope, receive, send)
+
+        user_id = None
+        authorization = dict(scope["headers"]).get(b"authorization", b"").decode("latin-1")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                user_id = decode_user_id(token)
+            except JWTError:
+                pass
+        scope.setdefault("state", {})["user_id"] = user_id
+        if user_id is None or scope["method"] in _SAFE_METHODS:
+            return await self.app(scope, receive, send)
+
+        async def send_noting_write(message):
+            if message["type"] == "http.response.start":
+                replicas.note_write(user_id)
+            await send(message)
 
+        # Noted on arrival (reads racing the write) and again when the
+        # response starts, so the window runs from the commit.
+        replicas.note_write(user_id)
+        await self.app(scope, receive, send_noting_write)
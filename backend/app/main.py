@@ -1,6 +1,9 @@
 # app/main.py
 from fastapi import FastAPI
-from app.database import Base, engine, SessionLocal
+from app.database import engine, async_engine, async_pool_metrics, replicas
+from app.migrations import ensure_schema
+from app.auth import ReadYourWritesMiddleware
+from app.utils.pool_metrics import pool_metrics
 from app.routes.auth_routes import router as auth_router
 from app.routes.profile_routes import router as profile_router
 from app.routes.demo_routes import router as demo_router
@@ -19,7 +22,12 @@ import app.models.booking
 import app.models.payment
 import app.models.feedback  # NEW
 import app.models.message
+import app.models.conversation
 from fastapi.middleware.cors import CORSMiddleware
+from app.utils.pagination import PAGINATION_HEADERS
+from app.utils.match_worker import MATCH_WORKER_ENABLED, match_worker
+from app.utils.hashing_executor import hashing_executor
+from app.utils.chat_hub import chat_hub
 
 # -------------------------
 # Create FastAPI instance
@@ -40,7 +48,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=PAGINATION_HEADERS,
 )
+app.add_middleware(ReadYourWritesMiddleware)
 
 # -------------------------
 # Include Routers
@@ -55,6 +65,54 @@ app.include_router(payment_router)
 app.include_router(feedback_router)  # NEW
 app.include_router(chat_router)
 
+# -------------------------
+# Background re-matching worker
+# -------------------------
+@app.on_event("startup")
+def _start_match_worker():
+    if MATCH_WORKER_ENABLED:
+        match_worker.start()
+
+@app.on_event("shutdown")
+def _drain_match_worker():
+    match_worker.shutdown()
+
+# -------------------------
+# Password hashing pool
+# -------------------------
+@app.on_event("shutdown")
+def _stop_hashing_pool():
+    hashing_executor.shutdown()
+
+# -------------------------
+# Async DB engine
+# -------------------------
+@app.on_event("shutdown")
+async def _dispose_async_engine():
+    await async_engine.dispose()
+
+# -------------------------
+# Read-replica health probe
+# -------------------------
+@app.on_event("startup")
+def _start_replica_probe():
+    replicas.start_probing()
+
+@app.on_event("shutdown")
+def _stop_replica_probe():
+    replicas.stop_probing()
+
+# -------------------------
+# Real-time chat hub
+# -------------------------
+@app.on_event("startup")
+async def _start_chat_hub():
+    await chat_hub.start()
+
+@app.on_event("shutdown")
+async def _stop_chat_hub():
+    await chat_hub.stop()
+
 # -------------------------
 # Root & Demo API
 # -------------------------
@@ -62,122 +120,20 @@ app.include_router(chat_router)
 def read_root():
     return {"status": "FastAPI running"}
 
+@app.get("/health/db")
+def db_pool_health():
+    stats = pool_metrics.snapshot(engine)
+    stats["async"] = async_pool_metrics.snapshot(async_engine.sync_engine)
+    if replicas.enabled:
+        stats["read_replicas"] = replicas.status()
+    return stats
+
 @app.get("/api/tasks")
 def get_tasks():
     return [{"id": 1, "title": "Learn FastAPI"}, {"id": 2, "title": "Deploy React"}]
 
 # -------------------------
-# Create all tables
-# -------------------------
-Base.metadata.create_all(bind=engine)
-
-# -------------------------
-# Auto-migrate: Add password reset columns if they don't exist
-# -------------------------
-def _add_password_reset_columns():
-    """Add missing columns to users table if they don't exist"""
-    from sqlalchemy import text, inspect
-    
-    try:
-        inspector = inspect(engine)
-        columns = [col['name'] for col in inspector.get_columns('users')]
-        
-        with engine.connect() as conn:
-            if 'full_name' not in columns:
-                print("Adding full_name column...")
-                conn.execute(text("ALTER TABLE users ADD COLUMN full_name VARCHAR"))
-                conn.commit()
-                print("✅ Added full_name column")
-            
-            if 'reset_token' not in columns:
-                print("Adding reset_token column...")
-                conn.execute(text("ALTER TABLE users ADD COLUMN reset_token VARCHAR"))
-                conn.commit()
-                print("✅ Added reset_token column")
-            
-            if 'reset_token_expiry' not in columns:
-                print("Adding reset_token_expiry column...")
-                conn.execute(text("ALTER TABLE users ADD COLUMN reset_token_expiry TIMESTAMP"))
-                conn.commit()
-                print("✅ Added reset_token_expiry column")
-    except Exception as e:
-        print(f"Migration check: {str(e)}")
-
-_add_password_reset_columns()
-
-
-# -------------------------
-# Auto-migrate: Add booking closeout + payout gating columns
-# -------------------------
-def _add_session_closeout_columns():
-    """Add missing columns for session closeout and payout gating.
-
-    This repo doesn't use Alembic; keep production resilient by adding
-    new columns when the app boots.
-    """
-    from sqlalchemy import text, inspect
-
-    try:
-        inspector = inspect(engine)
-        booking_columns = {col["name"] for col in inspector.get_columns("bookings")}
-        payment_columns = {col["name"] for col in inspector.get_columns("payments")}
-
-        with engine.connect() as conn:
-            # bookings
-            if "meeting_link" not in booking_columns:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN meeting_link VARCHAR"))
-                conn.commit()
-                print("✅ Added bookings.meeting_link")
-            if "session_summary" not in booking_columns:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN session_summary TEXT"))
-                conn.commit()
-                print("✅ Added bookings.session_summary")
-            if "session_summary_submitted_at" not in booking_columns:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN session_summary_submitted_at TIMESTAMP"))
-                conn.commit()
-                print("✅ Added bookings.session_summary_submitted_at")
-            if "mentee_consent" not in booking_columns:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN mentee_consent BOOLEAN"))
-                conn.commit()
-                print("✅ Added bookings.mentee_consent")
-            if "mentee_consent_at" not in booking_columns:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN mentee_consent_at TIMESTAMP"))
-                conn.commit()
-                print("✅ Added bookings.mentee_consent_at")
-            if "mentee_consent_note" not in booking_columns:
-                conn.execute(text("ALTER TABLE bookings ADD COLUMN mentee_consent_note VARCHAR"))
-                conn.commit()
-                print("✅ Added bookings.mentee_consent_note")
-
-            # payments
-            if "payout_released" not in payment_columns:
-                conn.execute(text("ALTER TABLE payments ADD COLUMN payout_released BOOLEAN DEFAULT FALSE"))
-                conn.commit()
-                print("✅ Added payments.payout_released")
-            if "payout_released_at" not in payment_columns:
-                conn.execute(text("ALTER TABLE payments ADD COLUMN payout_released_at TIMESTAMP"))
-                conn.commit()
-                print("✅ Added payments.payout_released_at")
-    except Exception as e:
-        print(f"Session closeout migration check: {str(e)}")
-
-
-_add_session_closeout_columns()
-
-# -------------------------
-# Seed demo note
-# -------------------------
-def _seed_demo_note():
-    db = SessionLocal()
-    try:
-        from app.models.note import Note
-        exists = db.query(Note).first()
-        if not exists:
-            demo = Note(title="Welcome", content="This is a seeded demo note.")
-            db.add(demo)
-            db.commit()
-    finally:
-        db.close()
-
-_seed_demo_note()
+# Schema version check (migrations live in app/migrations)
+# -------------------------
+ensure_schema(engine)
 
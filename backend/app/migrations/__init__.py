@@ -0,0 +1,38 @@
+# app/migrations/__init__.py
+"""
+Versioned schema migrations.
+
+Each module in app/migrations/versions is one migration, named
+``NNNN_description.py`` and applied in version order. It defines
+``upgrade(conn)``, which runs inside a transaction, and its docstring is
+recorded as the description. The schema_version table holds one row per
+applied migration. Model changes (new tables, columns, indexes) need a new
+migration: 0001_baseline only runs once per database.
+
+    python -m app.migrations upgrade   # apply pending migrations
+    python -m app.migrations status    # list applied / pending
+
+migrate() holds an advisory lock (Postgres), so when several workers boot
+at once only one applies migrations and the others wait, then find nothing
+to do. App startup calls ensure_schema(): a single version query, plus a
+migrate() only when the database is behind (unless DB_AUTO_MIGRATE=false).
+"""
+from app.migrations.runner import (
+    DB_AUTO_MIGRATE,
+    current_version,
+    discover,
+    ensure_schema,
+    latest_version,
+    migrate,
+    status,
+)
+
+__all__ = [
+    "DB_AUTO_MIGRATE",
+    "current_version",
+    "discover",
+    "ensure_schema",
+    "latest_version",
+    "migrate",
+    "status",
+]
@@ -0,0 +1,35 @@
+# app/migrations/__main__.py
+"""
+Command-line entry point:
+
+    python -m app.migrations upgrade [--target N]
+    python -m app.migrations status
+"""
+import argparse
+
+from app.database import engine
+from app.migrations.runner import current_version, latest_version, migrate, status
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.migrations", description="Database schema migrations")
+    commands = parser.add_subparsers(dest="command")
+    upgrade = commands.add_parser("upgrade", help="apply pending migrations")
+    upgrade.add_argument("--target", type=int, default=None, help="stop after this version")
+    commands.add_parser("status", help="list applied and pending migrations")
+    args = parser.parse_args(argv)
+
+    if args.command == "upgrade":
+        applied = migrate(engine, target=args.target)
+        print(f"Schema at version {current_version(engine)} ({len(applied)} migration(s) applied)")
+    elif args.command == "status":
+        for row in status(engine):
+            mark = "x" if row["applied"] else " "
+            print(f"[{mark}] {row['version']:04d}  {row['description']}")
+        print(f"\nCurrent version {current_version(engine)}, latest {latest_version()}")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
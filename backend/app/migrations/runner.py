@@ -0,0 +1,128 @@
+# app/migrations/runner.py
+import importlib
+import os
+import pkgutil
+import re
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, exc, select, text
+from sqlalchemy.engine import Engine
+
+import app.migrations.versions as versions_package
+
+DB_AUTO_MIGRATE = os.getenv("DB_AUTO_MIGRATE", "true").lower() == "true"
+
+# Arbitrary constant shared by every worker: pg_advisory_lock key for migrate()
+MIGRATION_LOCK_KEY = 72_431_001
+
+_VERSION_RE = re.compile(r"^(\d{4})_(\w+)$")
+
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    description: str
+    upgrade: Callable
+
+
+def discover() -> List[Migration]:
+    """All migrations in app/migrations/versions, in version order."""
+    migrations: Dict[int, Migration] = {}
+    for info in pkgutil.iter_modules(versions_package.__path__):
+        match = _VERSION_RE.match(info.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise RuntimeError(f"Duplicate migration version {version:04d}: {info.name}")
+        module = importlib.import_module(f"{versions_package.__name__}.{info.name}")
+        description = (module.__doc__ or match.group(2)).strip().splitlines()[0]
+        migrations[version] = Migration(version, info.name, description, module.upgrade)
+    return [migrations[v] for v in sorted(migrations)]
+
+
+def latest_version() -> int:
+    migrations = discover()
+    return migrations[-1].version if migrations else 0
+
+
+def current_version(engine: Engine) -> int:
+    """Highest applied migration; 0 for a database that has never been migrated."""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(schema_version.c.version).order_by(
+                schema_version.c.version.desc()).limit(1)).scalar() or 0
+    except exc.DBAPIError:
+        return 0  # no schema_version table yet
+
+
+def _applied(engine: Engine) -> set:
+    with engine.connect() as conn:
+        return set(conn.execute(select(schema_version.c.version)).scalars())
+
+
+@contextmanager
+def _migration_lock(engine: Engine):
+    """Session-level advisory lock on Postgres; SQLite already serialises writers."""
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+
+def migrate(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """Apply pending migrations up to ``target`` (default: latest); returns those applied."""
+    schema_version.create(bind=engine, checkfirst=True)
+    applied_now = []
+    with _migration_lock(engine):
+        applied = _applied(engine)  # re-read under the lock: another worker may have migrated
+        for migration in discover():
+            if migration.version in applied or (target is not None and migration.version > target):
+                continue
+            print(f"Applying migration {migration.version:04d} ({migration.description})...")
+            with engine.begin() as conn:
+                migration.upgrade(conn)
+                conn.execute(schema_version.insert().values(
+                    version=migration.version, name=migration.name, applied_at=datetime.utcnow(),
+                ))
+            applied_now.append(migration)
+            print(f"✅ Applied migration {migration.version:04d}")
+    return applied_now
+
+
+def status(engine: Engine) -> List[dict]:
+    applied = _applied(engine) if current_version(engine) else set()
+    return [
+        {"version": m.version, "name": m.name, "description": m.description, "applied": m.version in applied}
+        for m in discover()
+    ]
+
+
+def ensure_schema(engine: Engine) -> None:
+    """Startup check: one version query, migrating only when the database is behind."""
+    current, latest = current_version(engine), latest_version()
+    if current >= latest:
+        return
+    if not DB_AUTO_MIGRATE:
+        print(f"⚠️ Database schema is at version {current}, code expects {latest}. "
+              f"Run: python -m app.migrations upgrade")
+        return
+    try:
+        migrate(engine)
+    except Exception as e:
+        print(f"⚠️ Schema migration failed: {str(e)}")
@@ -0,0 +1,13 @@
+"""Create all tables from the models"""
+import importlib
+import pkgutil
+
+import app.models
+from app.database import Base
+
+
+def upgrade(conn):
+    # Import every model module so Base.metadata is complete.
+    for info in pkgutil.iter_modules(app.models.__path__):
+        importlib.import_module(f"app.models.{info.name}")
+    Base.metadata.create_all(bind=conn)
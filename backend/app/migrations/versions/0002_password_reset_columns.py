@@ -0,0 +1,12 @@
+"""Add users.full_name and password reset columns"""
+from sqlalchemy import inspect, text
+
+
+def upgrade(conn):
+    columns = {col["name"] for col in inspect(conn).get_columns("users")}
+    if "full_name" not in columns:
+        conn.execute(text("ALTER TABLE users ADD COLUMN full_name VARCHAR"))
+    if "reset_token" not in columns:
+        conn.execute(text("ALTER TABLE users ADD COLUMN reset_token VARCHAR"))
+    if "reset_token_expiry" not in columns:
+        conn.execute(text("ALTER TABLE users ADD COLUMN reset_token_expiry TIMESTAMP"))
@@ -0,0 +1,25 @@
+"""Add booking closeout and payout gating columns"""
+from sqlalchemy import inspect, text
+
+BOOKING_COLUMNS = [
+    ("meeting_link", "VARCHAR"),
+    ("session_summary", "TEXT"),
+    ("session_summary_submitted_at", "TIMESTAMP"),
+    ("mentee_consent", "BOOLEAN"),
+    ("mentee_consent_at", "TIMESTAMP"),
+    ("mentee_consent_note", "VARCHAR"),
+]
+
+PAYMENT_COLUMNS = [
+    ("payout_released", "BOOLEAN DEFAULT FALSE"),
+    ("payout_released_at", "TIMESTAMP"),
+]
+
+
+def upgrade(conn):
+    inspector = inspect(conn)
+    for table, columns in (("bookings", BOOKING_COLUMNS), ("payments", PAYMENT_COLUMNS)):
+        existing = {col["name"] for col in inspector.get_columns(table)}
+        for name, ddl in columns:
+            if name not in existing:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
@@ -0,0 +1,7 @@
+"""Add booking indexes declared after the table was first created"""
+from app.models.booking import Booking
+
+
+def upgrade(conn):
+    for index in Booking.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
@@ -0,0 +1,15 @@
+"""Collapse duplicate mentor matches and add the (mentee_id, mentor_id) unique index"""
+from sqlalchemy import inspect, text
+
+from app.models.mentee_intake import MentorMatch
+
+
+def upgrade(conn):
+    existing = {ix["name"] for ix in inspect(conn).get_indexes("mentor_matches")}
+    if "ux_mentor_matches_mentee_mentor" not in existing:
+        conn.execute(text(
+            "DELETE FROM mentor_matches WHERE id NOT IN "
+            "(SELECT MIN(id) FROM mentor_matches GROUP BY mentee_id, mentor_id)"
+        ))
+    for index in MentorMatch.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
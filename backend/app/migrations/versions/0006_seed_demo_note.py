@@ -0,0 +1,9 @@
+"""Seed the demo note"""
+from sqlalchemy import select
+
+from app.models.note import Note
+
+
+def upgrade(conn):
+    if conn.execute(select(Note.id).limit(1)).first() is None:
+        conn.execute(Note.__table__.insert().values(title="Welcome", content="This is a seeded demo note."))
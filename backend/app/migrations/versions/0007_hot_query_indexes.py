@@ -0,0 +1,11 @@
+"""Add composite indexes for the bookings, availability, feedback, mentorship and payment route queries"""
+from app.models.booking import Availability, BlockedDate, Booking
+from app.models.feedback import SessionFeedback
+from app.models.mentorship import Mentorship, MentorshipRequest
+from app.models.payment import Payment
+
+
+def upgrade(conn):
+    for model in (Booking, Availability, BlockedDate, SessionFeedback, Mentorship, MentorshipRequest, Payment):
+        for index in model.__table__.indexes:
+            index.create(bind=conn, checkfirst=True)
@@ -0,0 +1,44 @@
+"""Add the conversations table and backfill it from mentorships, bookings and messages"""
+from sqlalchemy import case, func, insert, select, union
+
+from app.models.booking import Booking
+from app.models.conversation import Conversation
+from app.models.mentorship import Mentorship
+from app.models.message import Message
+from app.utils.conversations import CONVERSATION_PREVIEW_CHARS
+
+
+def _pair(a, b):
+    return case((a < b, a), else_=b), case((a < b, b), else_=a)
+
+
+def upgrade(conn):
+    Conversation.__table__.create(bind=conn, checkfirst=True)
+    existing = set(conn.execute(select(Conversation.user_low_id, Conversation.user_high_id)).all())
+
+    linked = union(
+        select(*_pair(Mentorship.mentor_id, Mentorship.mentee_id)),
+        select(*_pair(Booking.mentor_id, Booking.mentee_id)),
+    )
+    allowed = {(low, high) for low, high in conn.execute(linked) if low != high}
+
+    low, high = _pair(Message.sender_id, Message.recipient_id)
+    last_ids = select(func.max(Message.id)).group_by(low, high)
+    last_messages = {
+        (min(m.sender_id, m.recipient_id), max(m.sender_id, m.recipient_id)): m
+        # Named columns only: later migrations add columns to messages.
+        for m in conn.execute(select(
+            Message.id, Message.sender_id, Message.recipient_id, Message.content, Message.created_at,
+        ).where(Message.id.in_(last_ids)))
+    }
+
+    for pair in sorted((allowed | set(last_messages)) - existing):
+        msg = last_messages.get(pair)
+        conn.execute(insert(Conversation).values(
+            user_low_id=pair[0],
+            user_high_id=pair[1],
+            chat_allowed=pair in allowed,
+            last_message_id=msg.id if msg else None,
+            last_message_at=msg.created_at if msg else None,
+            last_message_preview=msg.content[:CONVERSATION_PREVIEW_CHARS] if msg else None,
+        ))
@@ -0,0 +1,20 @@
+"""Add messages.pair_low_id / pair_high_id, backfill them and index (pair, id)"""
+from sqlalchemy import inspect, text
+
+from app.models.message import Message
+
+
+def upgrade(conn):
+    columns = {col["name"] for col in inspect(conn).get_columns("messages")}
+    if "pair_low_id" not in columns:
+        conn.execute(text("ALTER TABLE messages ADD COLUMN pair_low_id INTEGER"))
+    if "pair_high_id" not in columns:
+        conn.execute(text("ALTER TABLE messages ADD COLUMN pair_high_id INTEGER"))
+    conn.execute(text(
+        "UPDATE messages SET "
+        "pair_low_id = CASE WHEN sender_id < recipient_id THEN sender_id ELSE recipient_id END, "
+        "pair_high_id = CASE WHEN sender_id < recipient_id THEN recipient_id ELSE sender_id END "
+        "WHERE pair_low_id IS NULL"
+    ))
+    for index in Message.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
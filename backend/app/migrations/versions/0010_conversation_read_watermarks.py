@@ -0,0 +1,14 @@
+"""Add per-side read watermarks to conversations"""
+from sqlalchemy import inspect, text
+
+
+def upgrade(conn):
+    columns = {col["name"] for col in inspect(conn).get_columns("conversations")}
+    for column in ("read_low_message_id", "read_high_message_id"):
+        if column not in columns:
+            conn.execute(text(f"ALTER TABLE conversations ADD COLUMN {column} INTEGER"))
+    # Unread counters started at zero in 0008; start the watermarks at the same point.
+    conn.execute(text(
+        "UPDATE conversations SET read_low_message_id = last_message_id, read_high_message_id = last_message_id "
+        "WHERE read_low_message_id IS NULL AND read_high_message_id IS NULL AND unread_low = 0 AND unread_high = 0"
+    ))
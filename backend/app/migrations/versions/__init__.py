@@ -0,0 +1 @@
+# app/migrations/versions: one module per migration, NNNN_description.py
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Boolean, Time, Date
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Boolean, Time, Date, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -51,6 +51,15 @@ class Booking(Base):
     mentee = relationship("User", foreign_keys=[mentee_id], backref="bookings_as_mentee")
     mentor = relationship("User", foreign_keys=[mentor_id], backref="bookings_as_mentor")
 
+    __table_args__ = (
+        # Conflict detection / availability: one mentor's active bookings on a day
+        Index("ix_bookings_mentor_date_status", "mentor_id", "session_date", "status"),
+        # Mentee's bookings in (session_date, start_time) page order
+        Index("ix_bookings_mentee_date_start", "mentee_id", "session_date", "start_time"),
+        # Stripe webhook: booking for a payment intent
+        Index("ix_bookings_payment_intent_id", "payment_intent_id"),
+    )
+
 
 class Availability(Base):
     """Mentor availability slots"""
@@ -76,6 +85,11 @@ class Availability(Base):
     # Relationship
     mentor = relationship("User", backref="availability_slots")
 
+    __table_args__ = (
+        # Overlap check (mentor, day) and my-slots ordering (day, start)
+        Index("ix_availability_mentor_day_start", "mentor_id", "day_of_week", "start_time"),
+    )
+
 
 class BlockedDate(Base):
     """Mentor blocked dates (holidays, unavailable days)"""
@@ -90,4 +104,9 @@ class BlockedDate(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationship
-    mentor = relationship("User", backref="blocked_dates")
\ No newline at end of file
+    mentor = relationship("User", backref="blocked_dates")
+
+    __table_args__ = (
+        # Exact-date and date-range lookups for one or many mentors
+        Index("ix_blocked_dates_mentor_date", "mentor_id", "blocked_date"),
+    )
\ No newline at end of file
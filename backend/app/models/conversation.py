@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, String, Boolean, Index
+from datetime import datetime
+from app.database import Base
+import app.models.message  # noqa: F401  (last_message_id references messages)
+
+
+class Conversation(Base):
+    """One row per chat pair, kept current on write (see app.utils.conversations).
+
+    The pair is stored ordered, user_low_id < user_high_id. unread_low is the
+    number of messages user_low_id has not read, and unread_high the same
+    for user_high_id. read_low_message_id / read_high_message_id are each
+    side's read watermark: the last message id that side has read.
+    """
+
+    __tablename__ = "conversations"
+    __table_args__ = (
+        Index("ux_conversations_pair", "user_low_id", "user_high_id", unique=True),
+        # A user's conversation list, most recent first, from either side
+        Index("ix_conversations_low_last", "user_low_id", "last_message_at"),
+        Index("ix_conversations_high_last", "user_high_id", "last_message_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_low_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_high_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    # Set once a mentorship or booking links the pair
+    chat_allowed = Column(Boolean, nullable=False, default=False)
+
+    last_message_id = Column(Integer, ForeignKey("messages.id"), nullable=True)
+    last_message_at = Column(DateTime, nullable=True)
+    last_message_preview = Column(String, nullable=True)
+
+    unread_low = Column(Integer, nullable=False, default=0)
+    unread_high = Column(Integer, nullable=False, default=0)
+    read_low_message_id = Column(Integer, nullable=True)
+    read_high_message_id = Column(Integer, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
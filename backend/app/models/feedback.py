@@ -1,5 +1,5 @@
 # app/models/feedback.py
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -35,3 +35,8 @@ class SessionFeedback(Base):
     booking = relationship("Booking", backref="feedback")
     mentee = relationship("User", foreign_keys=[mentee_id], backref="feedback_given")
     mentor = relationship("User", foreign_keys=[mentor_id], backref="feedback_received")
+
+    __table_args__ = (
+        # Mentor's ratings and feedback, newest first
+        Index("ix_session_feedback_mentor_created", "mentor_id", "created_at"),
+    )
@@ -2,7 +2,7 @@
 """
 AI Agent Intake and Matching Models
 """
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, JSON, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -51,6 +51,10 @@ class MenteeIntake(Base):
 class MentorMatch(Base):
     """AI-generated mentor recommendations for mentees"""
     __tablename__ = "mentor_matches"
+    __table_args__ = (
+        # One row per pair; match results are upserted on it.
+        Index("ux_mentor_matches_mentee_mentor", "mentee_id", "mentor_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     mentee_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -67,4 +71,29 @@ class MentorMatch(Base):
     
     # Relationships
     mentee = relationship("User", foreign_keys=[mentee_id], backref="recommended_mentors")
-    mentor = relationship("User", foreign_keys=[mentor_id], backref="mentee_matches")
\ No newline at end of file
+    mentor = relationship("User", foreign_keys=[mentor_id], backref="mentee_matches")
+
+class MatchJob(Base):
+    """Queued recomputation of MentorMatch rows (see app.utils.match_worker).
+
+    kind "mentee": rematch one mentee (target_id = mentee user id)
+    kind "mentor": find mentees affected by a mentor profile change
+    """
+    __tablename__ = "match_jobs"
+    __table_args__ = (
+        Index("ix_match_jobs_status_run_after", "status", "run_after"),
+        Index("ix_match_jobs_kind_target", "kind", "target_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False)
+    target_id = Column(Integer, nullable=False)
+
+    status = Column(String, default="pending", nullable=False)  # pending, running, done, failed
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text)
+
+    run_after = Column(DateTime, default=datetime.utcnow, nullable=False)
+    locked_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
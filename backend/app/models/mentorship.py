@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -18,6 +18,12 @@ class MentorshipRequest(Base):
     mentee = relationship("User", foreign_keys=[mentee_id], backref="sent_requests")
     mentor = relationship("User", foreign_keys=[mentor_id], backref="received_requests")
 
+    __table_args__ = (
+        # Sent / received request lists, paged by (created_at, id)
+        Index("ix_mentorship_requests_mentee_created", "mentee_id", "created_at"),
+        Index("ix_mentorship_requests_mentor_created", "mentor_id", "created_at"),
+    )
+
 
 class Mentorship(Base):
     __tablename__ = "mentorships"
@@ -32,3 +38,10 @@ class Mentorship(Base):
     # Relationships
     mentor = relationship("User", foreign_keys=[mentor_id], backref="mentorships_as_mentor")
     mentee = relationship("User", foreign_keys=[mentee_id], backref="mentorships_as_mentee")
+
+    __table_args__ = (
+        # Pair lookups (chat eligibility, duplicate check) and mentor's list
+        Index("ix_mentorships_mentor_mentee_status", "mentor_id", "mentee_id", "status"),
+        # Mentee's list
+        Index("ix_mentorships_mentee_status", "mentee_id", "status"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Index, event
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -8,6 +8,11 @@ class Message(Base):
     """In-app chat message between a mentee and mentor."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # One conversation's history in id order, from either side: every
+        # page (newest, before=, after=) is a single range scan.
+        Index("ix_messages_pair_id", "pair_low_id", "pair_high_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     sender_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -15,5 +20,15 @@ class Message(Base):
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    # min / max of (sender_id, recipient_id), set on insert
+    pair_low_id = Column(Integer, nullable=True)
+    pair_high_id = Column(Integer, nullable=True)
+
     sender = relationship("User", foreign_keys=[sender_id], backref="messages_sent")
     recipient = relationship("User", foreign_keys=[recipient_id], backref="messages_received")
+
+
+@event.listens_for(Message, "before_insert")
+def _set_pair_key(mapper, connection, target):
+    target.pair_low_id = min(target.sender_id, target.recipient_id)
+    target.pair_high_id = max(target.sender_id, target.recipient_id)
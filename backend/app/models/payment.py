@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -38,6 +38,11 @@ class Payment(Base):
     # Relationships
     booking = relationship("Booking", backref="payment")
 
+    __table_args__ = (
+        # Payment for a booking, and the bookings -> payments join in history
+        Index("ix_payments_booking_id", "booking_id"),
+    )
+
 
 class MentorBalance(Base):
     """Mentor earnings balance"""
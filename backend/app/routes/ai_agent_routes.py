@@ -7,16 +7,19 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.auth import get_current_user
 from app.models.user import User
-from app.models.mentee_intake import MenteeIntake, MentorMatch
-from app.models.profile import MentorProfile
+from app.models.mentee_intake import MatchJob, MenteeIntake
 from app.schemas.intake_schema import (
     AIConversationRequest,
     AIConversationResponse,
     MenteeIntakeCreate,
     MenteeIntakeOut,
-    MentorMatchOut
+    MentorMatchOut,
+    MatchJobOut
 )
-from app.utils.ai_agent import EnhancedIntakeAgent, calculate_enhanced_match_score
+from app.utils.ai_agent import EnhancedIntakeAgent, IntakeFeatures
+from app.utils.mentor_index import mentor_index
+from app.utils.match_cache import intake_version, match_cache, save_matches
+from app.utils.match_worker import enqueue_match_job, precomputed_matches
 from typing import List
 from datetime import datetime
 
@@ -95,6 +98,8 @@ def create_or_update_intake(
         existing.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(existing)
+        match_cache.invalidate_mentee(current_user.id)
+        enqueue_match_job(db, "mentee", current_user.id)
         return existing
     
     new_intake = MenteeIntake(
@@ -104,6 +109,8 @@ def create_or_update_intake(
     db.add(new_intake)
     db.commit()
     db.refresh(new_intake)
+    match_cache.invalidate_mentee(current_user.id)
+    enqueue_match_job(db, "mentee", current_user.id)
     
     return new_intake
 
@@ -127,6 +134,23 @@ def get_my_intake(
     return intake
 
 
+def _match_out(mentor, score: int, reasons: List[str]) -> dict:
+    """MentorMatchOut fields from a MentorProfile or MentorFeatures"""
+    return {
+        "mentor_id": mentor.user_id,
+        "mentor_name": mentor.full_name,
+        "mentor_domains": mentor.domains or "General",
+        "mentor_skills": mentor.skills or "Various",
+        "mentor_experience": mentor.years_experience or 0,
+        "mentor_bio": mentor.bio or "",
+        "mentor_rate": mentor.hourly_rate or 0,
+        "mentor_availability": mentor.availability or "Not specified",
+        "is_verified": mentor.is_verified,
+        "match_score": score,
+        "match_reasons": reasons
+    }
+
+
 @router.get("/matches", response_model=List[MentorMatchOut])
 def get_ai_mentor_matches(
     limit: int = 5,
@@ -151,54 +175,53 @@ def get_ai_mentor_matches(
             detail="Please complete the AI intake process first to get personalized matches"
         )
     
-    mentors = db.query(MentorProfile).all()
+    precomputed = precomputed_matches(db, intake, limit, min_score)
+    if precomputed:
+        return [
+            _match_out(mentor, match.match_score, match.match_reasons or [])
+            for match, mentor in precomputed
+        ]
     
-    if not mentors:
+    # Live scoring fallback
+    index = mentor_index.ensure_fresh(db)
+    version = intake_version(intake)
+    catalog_version = index.version
+    top = match_cache.get(current_user.id, version, catalog_version, limit, min_score)
+    
+    if not index.features:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No mentors available at the moment"
         )
     
-    matches = []
-    for mentor in mentors:
-        score, reasons, metadata = calculate_enhanced_match_score(intake, mentor)
-        
-        if score >= min_score:
-            matches.append({
-                "mentor_id": mentor.user_id,
-                "mentor_name": mentor.full_name,
-                "mentor_domains": mentor.domains or "General",
-                "mentor_skills": mentor.skills or "Various",
-                "mentor_experience": mentor.years_experience or 0,
-                "mentor_bio": mentor.bio or "",
-                "mentor_rate": mentor.hourly_rate or 0,
-                "mentor_availability": mentor.availability or "Not specified",
-                "is_verified": mentor.is_verified,
-                "match_score": score,
-                "match_reasons": reasons
-            })
-    
-    matches.sort(key=lambda x: x["match_score"], reverse=True)
-    
-    for match in matches[:limit]:
-        existing_match = db.query(MentorMatch).filter(
-            MentorMatch.mentee_id == current_user.id,
-            MentorMatch.mentor_id == match["mentor_id"]
-        ).first()
-        
-        if not existing_match:
-            new_match = MentorMatch(
-                mentee_id=current_user.id,
-                mentor_id=match["mentor_id"],
-                match_score=match["match_score"],
-                match_reasons=match["match_reasons"],
-                match_metadata={}
-            )
-            db.add(new_match)
+    if top is None:
+        features = IntakeFeatures(intake)
+        top = index.top_matches(features, limit, min_score)
+        save_matches(db, current_user.id, top)
+        db.commit()
+        match_cache.put(current_user.id, version, features, catalog_version, limit, min_score, top)
     
-    db.commit()
+    return [_match_out(mentor, score, reasons) for score, reasons, metadata, mentor in top]
+
+
+@router.get("/matches/status", response_model=MatchJobOut)
+def get_match_job_status(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Status of the latest background re-matching job for the current mentee"""
+    job = db.query(MatchJob).filter(
+        MatchJob.kind == "mentee",
+        MatchJob.target_id == current_user.id
+    ).order_by(MatchJob.id.desc()).first()
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No matching job found"
+        )
     
-    return matches[:limit]
+    return job
 
 
 @router.delete("/intake/me", status_code=status.HTTP_204_NO_CONTENT)
@@ -214,5 +237,7 @@ def delete_my_intake(
     if intake:
         db.delete(intake)
         db.commit()
+        match_cache.invalidate_mentee(current_user.id)
+        enqueue_match_job(db, "mentee", current_user.id)
     
     return None
\ No newline at end of file
@@ -1,12 +1,16 @@
 # app/routes/auth_routes.py
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Response
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import Optional, cast
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db, get_async_db
 from app.models.user import User
 from app.schemas import UserCreate, UserResponse, UserLogin, Token, ForgotPasswordRequest, ResetPasswordRequest, MessageResponse
-from app.auth import hash_password, verify_password, create_access_token, get_current_user
+from app.auth import hash_password_async, verify_password_async, password_needs_update, create_access_token, get_current_user
+from app.utils.hashing_executor import hashing_executor
+from app.utils.pagination import PageParams, paginate
 from app.utils.email_service import send_welcome_email, send_password_reset_email, generate_reset_token, get_reset_token_expiry
 
 router = APIRouter(tags=["auth"])
@@ -15,9 +19,9 @@ router = APIRouter(tags=["auth"])
 # Register User
 # -------------------------
 @router.post("/register", response_model=UserResponse)
-async def register_user(user: UserCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+async def register_user(user: UserCreate, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_async_db)):
     # Check if email already exists
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    existing_user = (await db.execute(select(User).filter(User.email == user.email))).scalars().first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -29,11 +33,11 @@ async def register_user(user: UserCreate, background_tasks: BackgroundTasks, db:
         email=user.email,
         full_name=user.full_name,
         role=user.role.lower(),
-        password=hash_password(user.password)
+        password=await hash_password_async(user.password)
     )
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     # Send welcome email in background
     background_tasks.add_task(
@@ -48,24 +52,43 @@ async def register_user(user: UserCreate, background_tasks: BackgroundTasks, db:
 # -------------------------
 # Login User
 # -------------------------
+async def _rehash_password(user_id: int, old_hash: str, plain_password: str) -> None:
+    """Upgrade a hash made with an old scheme/cost; skipped if the password changed meanwhile.
+
+    Hashes on the bounded hashing pool; when the pool is full the upgrade
+    is skipped and retried on a later login.
+    """
+    try:
+        new_hash = await hash_password_async(plain_password)
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(User).where(User.id == user_id, User.password == old_hash).values(password=new_hash)
+            )
+            await db.commit()
+    except Exception as e:
+        print(f"Password rehash failed for user {user_id}: {str(e)}")
+
 @router.post("/login", response_model=Token)
-def login_user(user_credentials: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_credentials.email).first()
+async def login_user(user_credentials: UserLogin, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_async_db)):
+    user = (await db.execute(select(User).filter(User.email == user_credentials.email))).scalars().first()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    if not verify_password(user_credentials.password, cast(str, user.password)):
+    if not await verify_password_async(user_credentials.password, cast(str, user.password)):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    token = create_access_token(cast(int, user.id))
+    if password_needs_update(cast(str, user.password)):
+        background_tasks.add_task(_rehash_password, cast(int, user.id), cast(str, user.password), user_credentials.password)
+
+    token = create_access_token(cast(int, user.id), role=cast(str, user.role).lower())
     return {"access_token": token, "token_type": "bearer", "role": cast(str, user.role).lower()}
 
 # -------------------------
 # Forgot Password
 # -------------------------
 @router.post("/forgot-password", response_model=MessageResponse)
-async def forgot_password(request: ForgotPasswordRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == request.email).first()
+async def forgot_password(request: ForgotPasswordRequest, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_async_db)):
+    user = (await db.execute(select(User).filter(User.email == request.email))).scalars().first()
     
     # Always return success to prevent email enumeration attacks
     if not user:
@@ -75,7 +98,7 @@ async def forgot_password(request: ForgotPasswordRequest, background_tasks: Back
     reset_token = generate_reset_token()
     setattr(user, 'reset_token', reset_token)
     setattr(user, 'reset_token_expiry', get_reset_token_expiry())
-    db.commit()
+    await db.commit()
     
     # Send reset email in background
     background_tasks.add_task(
@@ -91,8 +114,8 @@ async def forgot_password(request: ForgotPasswordRequest, background_tasks: Back
 # Reset Password
 # -------------------------
 @router.post("/reset-password", response_model=MessageResponse)
-def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.reset_token == request.token).first()
+async def reset_password(request: ResetPasswordRequest, db: AsyncSession = Depends(get_async_db)):
+    user = (await db.execute(select(User).filter(User.reset_token == request.token))).scalars().first()
     
     if not user:
         raise HTTPException(
@@ -109,19 +132,34 @@ def reset_password(request: ResetPasswordRequest, db: Session = Depends(get_db))
         )
     
     # Update password and clear reset token
-    setattr(user, 'password', hash_password(request.new_password))
+    setattr(user, 'password', await hash_password_async(request.new_password))
     setattr(user, 'reset_token', None)
     setattr(user, 'reset_token_expiry', None)
-    db.commit()
+    await db.commit()
     
     return {"message": "Password has been reset successfully"}
 
+# -------------------------
+# Password hashing pool metrics
+# -------------------------
+@router.get("/hashing/metrics")
+def get_hashing_metrics():
+    return hashing_executor.metrics()
+
 # -------------------------
 # List all users (for testing)
 # -------------------------
 @router.get("/users", response_model=list[UserResponse])
-def list_users(db: Session = Depends(get_db)):
-    return db.query(User).all()
+def list_users(
+    response: Response,
+    role: Optional[str] = None,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db),
+):
+    query = db.query(User)
+    if role:
+        query = query.filter(User.role == role.lower())
+    return paginate(query, [(User.id, False)], page, response)
 
 # -------------------------
 # Get current user info (for debugging)
@@ -1,20 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import text
 from datetime import datetime, date, time, timedelta
+from collections import defaultdict
 from typing import Optional
 from pydantic import ValidationError
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.auth import get_current_user
 from app.models.user import User
 from app.models.booking import Booking, Availability, BlockedDate
 from app.models.profile import MentorProfile
 from app.models.payment import Payment, MentorBalance
+from app.utils.pagination import PageParams, paginate
+from app.utils.slot_engine import compute_available_slots
 from app.schemas.booking_schema import (
     BookingCreate, BookingOut, BookingWithDetails, BookingStatusUpdate,
     AvailabilityCreate, AvailabilityOut, AvailabilityUpdate,
     BlockedDateCreate, BlockedDateOut,
-    AvailableSlot, AvailableSlotsResponse
+    AvailableSlotsResponse, MultiMentorAvailabilityResponse
 )
 from pydantic import BaseModel, Field
 
@@ -103,6 +106,19 @@ def _safe_booking_out_dict(booking: Booking) -> dict:
         }
 
 
+def _booking_with_details(booking: Booking) -> BookingWithDetails:
+    """Build a BookingWithDetails from a booking and its loaded mentor/mentee."""
+    mentor = booking.mentor
+    mentee = booking.mentee
+
+    booking_dict = _safe_booking_out_dict(booking)
+    booking_dict["mentor_name"] = getattr(mentor, "full_name", None) or "Unknown"
+    booking_dict["mentee_name"] = getattr(mentee, "full_name", None) or "Unknown"
+    booking_dict["mentor_email"] = getattr(mentor, "email", None) or ""
+    booking_dict["mentee_email"] = getattr(mentee, "email", None) or ""
+    return BookingWithDetails(**booking_dict)
+
+
 # ============= HELPER FUNCTIONS =============
 
 def calculate_end_time(start_time: time, duration_minutes: int) -> time:
@@ -112,6 +128,26 @@ def calculate_end_time(start_time: time, duration_minutes: int) -> time:
     return end_dt.time()
 
 
+def lock_mentor_day(db: Session, mentor_id: int, session_date: date) -> None:
+    """Serialize booking writes for one mentor/day until the transaction ends.
+
+    PostgreSQL uses a transaction-scoped advisory lock keyed on
+    (mentor_id, day), so workers booking different mentors or days never
+    wait on each other. SQLite has a single writer, so the fallback simply
+    takes the database write lock up front with a no-op UPDATE.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(:mentor_id, :day)"),
+            {"mentor_id": mentor_id, "day": session_date.toordinal()},
+        )
+    elif dialect == "sqlite":
+        db.execute(text("UPDATE bookings SET id = id WHERE 0 = 1"))
+    else:
+        db.query(User.id).filter(User.id == mentor_id).with_for_update().first()
+
+
 def check_booking_conflict(
     db: Session,
     mentor_id: int,
@@ -120,24 +156,23 @@ def check_booking_conflict(
     end_time: time,
     exclude_booking_id: Optional[int] = None
 ) -> bool:
-    """Check if proposed booking conflicts with existing bookings"""
-    query = db.query(Booking).filter(
+    """Check if proposed booking conflicts with existing bookings.
+
+    Runs as a single range query on ix_bookings_mentor_date_status. Call
+    lock_mentor_day first when the result guards an insert.
+    """
+    query = db.query(Booking.id).filter(
         Booking.mentor_id == mentor_id,
         Booking.session_date == session_date,
-        Booking.status.in_(["requested", "confirmed"])  # Only active bookings
+        Booking.status.in_(["requested", "confirmed"]),  # Only active bookings
+        Booking.start_time < end_time,
+        Booking.end_time > start_time,
     )
     
     if exclude_booking_id:
         query = query.filter(Booking.id != exclude_booking_id)
     
-    existing_bookings = query.all()
-    
-    for booking in existing_bookings:
-        # Check time overlap
-        if (start_time < booking.end_time and end_time > booking.start_time):
-            return True  # Conflict found
-    
-    return False  # No conflict
+    return query.first() is not None
 
 
 # ============= BOOKING ENDPOINTS =============
@@ -176,7 +211,9 @@ def create_booking(
     # Calculate end time
     end_time = calculate_end_time(booking_data.start_time, booking_data.duration_minutes)
     
-    # Check for conflicts
+    # Check for conflicts while holding the mentor/day lock so concurrent
+    # requests (including other workers) cannot both pass the check.
+    lock_mentor_day(db, booking_data.mentor_id, booking_data.session_date)
     if check_booking_conflict(
         db, booking_data.mentor_id, booking_data.session_date,
         booking_data.start_time, end_time
@@ -222,11 +259,16 @@ def create_booking(
 
 @router.get("/my-bookings", response_model=list[BookingWithDetails])
 def get_my_bookings(
+    response: Response,
     status_filter: Optional[str] = Query(None, regex="^(requested|confirmed|completed|cancelled)$"),
-    db: Session = Depends(get_db),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all bookings for current user (as mentee or mentor)"""
+    """Get bookings for current user (as mentee or mentor), newest session first.
+
+    Paginated by (session_date, start_time, id); see app.utils.pagination.
+    """
     
     print(f"DEBUG /my-bookings - User ID: {current_user.id}, Email: {getattr(current_user, 'email', None)}, Role: {current_user.role}")
     role = (current_user.role or "").lower()
@@ -241,34 +283,30 @@ def get_my_bookings(
     if status_filter:
         query = query.filter(Booking.status == status_filter)
     
-    bookings = query.order_by(Booking.session_date.desc(), Booking.start_time.desc()).all()
-    
-    # Add mentor/mentee details
-    result = []
-    for booking in bookings:
-        mentor = db.query(User).filter(User.id == booking.mentor_id).first()
-        mentee = db.query(User).filter(User.id == booking.mentee_id).first()
-        
-        booking_dict = _safe_booking_out_dict(booking)
-        booking_dict["mentor_name"] = getattr(mentor, "full_name", None) or "Unknown"
-        booking_dict["mentee_name"] = getattr(mentee, "full_name", None) or "Unknown"
-        booking_dict["mentor_email"] = getattr(mentor, "email", None) or ""
-        booking_dict["mentee_email"] = getattr(mentee, "email", None) or ""
-        
-        result.append(BookingWithDetails(**booking_dict))
+    # Load mentor/mentee users in the same round trip instead of two
+    # lookups per booking.
+    query = query.options(joinedload(Booking.mentor), joinedload(Booking.mentee))
+    bookings = paginate(
+        query,
+        [(Booking.session_date, True), (Booking.start_time, True), (Booking.id, True)],
+        page,
+        response,
+    )
     
-    return result
+    return [_booking_with_details(booking) for booking in bookings]
 
 
 @router.get("/{booking_id}", response_model=BookingWithDetails)
 def get_booking(
     booking_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get specific booking details"""
     
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
+    booking = db.query(Booking).options(
+        joinedload(Booking.mentor), joinedload(Booking.mentee)
+    ).filter(Booking.id == booking_id).first()
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
@@ -276,16 +314,7 @@ def get_booking(
     if booking.mentee_id != current_user.id and booking.mentor_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to view this booking")
     
-    mentor = db.query(User).filter(User.id == booking.mentor_id).first()
-    mentee = db.query(User).filter(User.id == booking.mentee_id).first()
-    
-    booking_dict = _safe_booking_out_dict(booking)
-    booking_dict["mentor_name"] = getattr(mentor, "full_name", None) or "Unknown"
-    booking_dict["mentee_name"] = getattr(mentee, "full_name", None) or "Unknown"
-    booking_dict["mentor_email"] = getattr(mentor, "email", None) or ""
-    booking_dict["mentee_email"] = getattr(mentee, "email", None) or ""
-    
-    return BookingWithDetails(**booking_dict)
+    return _booking_with_details(booking)
 
 
 @router.patch("/{booking_id}/status", response_model=BookingOut)
@@ -478,7 +507,7 @@ def create_availability(
 
 @router.get("/availability/my-slots", response_model=list[AvailabilityOut])
 def get_my_availability(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get mentor's own availability slots"""
@@ -498,7 +527,8 @@ def get_mentor_available_slots(
     mentor_id: int,
     start_date: date = Query(...),
     end_date: date = Query(...),
-    db: Session = Depends(get_db)
+    slot_minutes: Optional[int] = Query(None, ge=15, le=240, description="Split windows into fixed-length slots"),
+    db: Session = Depends(get_read_db)
 ):
     """Get mentor's available time slots for date range"""
     
@@ -517,59 +547,28 @@ def get_mentor_available_slots(
         return AvailableSlotsResponse(mentor_id=mentor_id, available_slots=[])
     
     # Get blocked dates
-    blocked_dates = db.query(BlockedDate).filter(
+    blocked_dates = db.query(BlockedDate.blocked_date).filter(
         BlockedDate.mentor_id == mentor_id,
         BlockedDate.blocked_date.between(start_date, end_date)
     ).all()
-    blocked_date_list = [bd.blocked_date for bd in blocked_dates]
     
     # Get existing bookings
-    existing_bookings = db.query(Booking).filter(
+    existing_bookings = db.query(
+        Booking.session_date, Booking.start_time, Booking.end_time
+    ).filter(
         Booking.mentor_id == mentor_id,
         Booking.session_date.between(start_date, end_date),
         Booking.status.in_(["requested", "confirmed"])
     ).all()
     
-    # Generate available slots
-    available_slots = []
-    current_date = start_date
-    
-    while current_date <= end_date:
-        # Skip blocked dates
-        if current_date in blocked_date_list:
-            current_date += timedelta(days=1)
-            continue
-        
-        # Get day of week (0=Monday)
-        day_of_week = current_date.weekday()
-        
-        # Find availability for this day
-        day_availability = [a for a in availability_slots if a.day_of_week == day_of_week]
-        
-        for av_slot in day_availability:
-            # Check if this slot is booked
-            is_booked = False
-            for booking in existing_bookings:
-                if (booking.session_date == current_date and
-                    booking.start_time < av_slot.end_time and
-                    booking.end_time > av_slot.start_time):
-                    is_booked = True
-                    break
-            
-            if not is_booked:
-                # Calculate duration
-                start_dt = datetime.combine(current_date, av_slot.start_time)
-                end_dt = datetime.combine(current_date, av_slot.end_time)
-                duration = int((end_dt - start_dt).total_seconds() / 60)
-                
-                available_slots.append(AvailableSlot(
-                    date=current_date,
-                    start_time=av_slot.start_time,
-                    end_time=av_slot.end_time,
-                    duration_minutes=duration
-                ))
-        
-        current_date += timedelta(days=1)
+    available_slots = compute_available_slots(
+        start_date,
+        end_date,
+        availability_slots,
+        [bd.blocked_date for bd in blocked_dates],
+        existing_bookings,
+        slot_minutes=slot_minutes,
+    )
     
     return AvailableSlotsResponse(
         mentor_id=mentor_id,
@@ -577,6 +576,101 @@ def get_mentor_available_slots(
     )
 
 
+MAX_AVAILABILITY_SEARCH_MENTORS = 100
+MAX_AVAILABILITY_SEARCH_DAYS = 62
+
+
+@router.get("/availability/search", response_model=MultiMentorAvailabilityResponse)
+def search_mentor_availability(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    mentor_ids: Optional[list[int]] = Query(None, description="Repeat for each mentor user id"),
+    skill: Optional[str] = None,
+    domain: Optional[str] = None,
+    slot_minutes: Optional[int] = Query(None, ge=15, le=240, description="Split windows into fixed-length slots"),
+    db: Session = Depends(get_read_db)
+):
+    """Get free slots for many mentors at once.
+
+    Mentors are selected by id and/or a skills/domains filter on their
+    profile. Availability, blocked dates and bookings for all of them are
+    fetched with one query each, then expanded by the slot engine.
+    """
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date must be on or after start_date")
+    if (end_date - start_date).days + 1 > MAX_AVAILABILITY_SEARCH_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_AVAILABILITY_SEARCH_DAYS} days can be searched at once"
+        )
+    if not mentor_ids and not skill and not domain:
+        raise HTTPException(status_code=400, detail="Provide mentor_ids or a skill/domain filter")
+    if mentor_ids and len(mentor_ids) > MAX_AVAILABILITY_SEARCH_MENTORS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_AVAILABILITY_SEARCH_MENTORS} mentors can be searched at once"
+        )
+    
+    mentor_query = db.query(User.id).filter(User.role == "mentor")
+    if mentor_ids:
+        mentor_query = mentor_query.filter(User.id.in_(mentor_ids))
+    if skill or domain:
+        mentor_query = mentor_query.join(MentorProfile, MentorProfile.user_id == User.id)
+        if skill:
+            mentor_query = mentor_query.filter(MentorProfile.skills.ilike(f"%{skill}%"))
+        if domain:
+            mentor_query = mentor_query.filter(MentorProfile.domains.ilike(f"%{domain}%"))
+    matched_ids = [
+        row.id for row in mentor_query.order_by(User.id).limit(MAX_AVAILABILITY_SEARCH_MENTORS).all()
+    ]
+    
+    if not matched_ids:
+        return MultiMentorAvailabilityResponse(start_date=start_date, end_date=end_date, mentors=[])
+    
+    availability_by_mentor = defaultdict(list)
+    for av_slot in db.query(Availability).filter(
+        Availability.mentor_id.in_(matched_ids),
+        Availability.is_active == True
+    ).all():
+        availability_by_mentor[av_slot.mentor_id].append(av_slot)
+    
+    blocked_by_mentor = defaultdict(list)
+    for row in db.query(BlockedDate.mentor_id, BlockedDate.blocked_date).filter(
+        BlockedDate.mentor_id.in_(matched_ids),
+        BlockedDate.blocked_date.between(start_date, end_date)
+    ).all():
+        blocked_by_mentor[row.mentor_id].append(row.blocked_date)
+    
+    bookings_by_mentor = defaultdict(list)
+    for row in db.query(
+        Booking.mentor_id, Booking.session_date, Booking.start_time, Booking.end_time
+    ).filter(
+        Booking.mentor_id.in_(matched_ids),
+        Booking.session_date.between(start_date, end_date),
+        Booking.status.in_(["requested", "confirmed"])
+    ).all():
+        bookings_by_mentor[row.mentor_id].append(row)
+    
+    return MultiMentorAvailabilityResponse(
+        start_date=start_date,
+        end_date=end_date,
+        mentors=[
+            AvailableSlotsResponse(
+                mentor_id=mentor_id,
+                available_slots=compute_available_slots(
+                    start_date,
+                    end_date,
+                    availability_by_mentor.get(mentor_id, []),
+                    blocked_by_mentor.get(mentor_id, []),
+                    bookings_by_mentor.get(mentor_id, []),
+                    slot_minutes=slot_minutes,
+                ),
+            )
+            for mentor_id in matched_ids
+        ],
+    )
+
+
 @router.patch("/availability/{slot_id}", response_model=AvailabilityOut)
 def update_availability_slot(
     slot_id: int,
@@ -660,7 +754,7 @@ def create_blocked_date(
 
 @router.get("/blocked-dates/my-dates", response_model=list[BlockedDateOut])
 def get_my_blocked_dates(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get mentor's blocked dates"""
@@ -1,129 +1,184 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from jose import JWTError
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, desc
+from sqlalchemy import and_, case, or_
 from typing import Optional
 
-from app.database import get_db
-from app.auth import get_current_user
+from app.database import SessionLocal, get_db, get_read_db
+from app.auth import Principal, decode_user_id, get_current_user, load_principal
 from app.models.user import User
-from app.models.booking import Booking
-from app.models.mentorship import Mentorship
+from app.models.conversation import Conversation
 from app.models.profile import MentorProfile, MenteeProfile
 from app.models.message import Message
-from app.schemas.chat_schema import ConversationOut, MessageCreate, MessageOut
+from app.schemas.chat_schema import (
+    ConversationOut,
+    MarkRead,
+    MessageCreate,
+    MessageOut,
+    UnreadConversation,
+    UnreadSummary,
+)
+from app.utils.chat_hub import chat_hub
+from app.utils.conversations import chat_allowed, mark_read, pair_key, record_message, side
+from app.utils.pagination import HAS_MORE_HEADER, MAX_PAGE_SIZE, SYNC_TOKEN_HEADER, decode_cursor, encode_cursor
 
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
 
+MAX_READ_MARKS = 200
+
 
-def _display_name_for_user(db: Session, user: User) -> str:
+def _display_name(user: User, mentor_name: Optional[str], mentee_name: Optional[str]) -> str:
     role = (str(getattr(user, "role", "")) or "").lower()
+    fallback = getattr(user, "full_name", None) or getattr(user, "email", None)
     if role == "mentor":
-        mp = db.query(MentorProfile).filter(MentorProfile.user_id == user.id).first()
-        return (getattr(mp, "full_name", None) if mp else None) or (getattr(user, "full_name", None) or getattr(user, "email", None) or "Mentor")
+        return mentor_name or fallback or "Mentor"
     if role == "mentee":
-        mp = db.query(MenteeProfile).filter(MenteeProfile.user_id == user.id).first()
-        return (getattr(mp, "name", None) if mp else None) or (getattr(user, "full_name", None) or getattr(user, "email", None) or "Mentee")
-    return getattr(user, "full_name", None) or getattr(user, "email", None) or "User"
+        return mentee_name or fallback or "Mentee"
+    return fallback or "User"
 
 
-def _chat_allowed(db: Session, user_id: int, other_user_id: int) -> bool:
-    if user_id == other_user_id:
-        return False
+@router.get("/conversations", response_model=list[ConversationOut])
+def list_conversations(
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """List chat-eligible counterparts (mentorships or bookings), most recent first.
 
-    mentorship_exists = db.query(Mentorship.id).filter(
-        or_(
-            and_(Mentorship.mentor_id == user_id, Mentorship.mentee_id == other_user_id),
-            and_(Mentorship.mentor_id == other_user_id, Mentorship.mentee_id == user_id),
+    One query on the conversations table, joined to each counterpart's
+    user row and profile name.
+    """
+    me = int(current_user.id)
+    other_id = case((Conversation.user_low_id == me, Conversation.user_high_id), else_=Conversation.user_low_id)
+    rows = (
+        db.query(Conversation, User, MentorProfile.full_name, MenteeProfile.name)
+        .join(User, User.id == other_id)
+        .outerjoin(MentorProfile, MentorProfile.user_id == User.id)
+        .outerjoin(MenteeProfile, MenteeProfile.user_id == User.id)
+        .filter(
+            or_(Conversation.user_low_id == me, Conversation.user_high_id == me),
+            Conversation.chat_allowed.is_(True),
         )
-    ).first()
+        .order_by(Conversation.last_message_at.desc().nullslast(), User.id)
+        .all()
+    )
+
+    conversations = []
+    for conversation, other, mentor_name, mentee_name in rows:
+        mine, theirs = ("low", "high") if side(conversation, me) == "low" else ("high", "low")
+        conversations.append(ConversationOut(
+            other_user_id=other.id,
+            other_user_name=_display_name(other, mentor_name, mentee_name),
+            last_message=conversation.last_message_preview,
+            last_message_at=conversation.last_message_at,
+            unread_count=getattr(conversation, f"unread_{mine}"),
+            other_last_read_message_id=getattr(conversation, f"read_{theirs}_message_id"),
+        ))
+    return conversations
 
-    if mentorship_exists:
-        return True
 
-    booking_exists = db.query(Booking.id).filter(
+@router.get("/unread", response_model=UnreadSummary)
+def unread_summary(
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Unread counts for badges: one read of the counters kept on write."""
+    me = int(current_user.id)
+    rows = db.query(
+        case((Conversation.user_low_id == me, Conversation.user_high_id), else_=Conversation.user_low_id),
+        case((Conversation.user_low_id == me, Conversation.unread_low), else_=Conversation.unread_high),
+    ).filter(
         or_(
-            and_(Booking.mentor_id == user_id, Booking.mentee_id == other_user_id),
-            and_(Booking.mentor_id == other_user_id, Booking.mentee_id == user_id),
+            and_(Conversation.user_low_id == me, Conversation.unread_low > 0),
+            and_(Conversation.user_high_id == me, Conversation.unread_high > 0),
         )
-    ).first()
+    ).all()
 
-    return booking_exists is not None
+    return UnreadSummary(
+        total=sum(count for _, count in rows),
+        conversations=[UnreadConversation(other_user_id=other, unread_count=count) for other, count in rows],
+    )
 
 
-@router.get("/conversations", response_model=list[ConversationOut])
-def list_conversations(
+@router.post("/read", response_model=UnreadSummary)
+def mark_messages_read(
+    marks: list[MarkRead],
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List chat-eligible counterparts (active mentorships or any bookings)."""
+    """Mark conversations read up to a message id, several in one call.
 
-    counterparts: set[int] = set()
+    Watermarks only move forward. Each side gets a ``{"type": "read"}``
+    socket event: the reader's other tabs clear the badge and the
+    counterpart sees a read receipt. Returns the new unread summary.
+    """
+    if len(marks) > MAX_READ_MARKS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_READ_MARKS} conversations per call")
+    me = int(current_user.id)
+    latest: dict[int, int] = {}
+    for mark in marks:
+        latest[mark.other_user_id] = max(mark.message_id, latest.get(mark.other_user_id, 0))
 
-    mentorships = db.query(Mentorship).filter(
-        or_(Mentorship.mentor_id == current_user.id, Mentorship.mentee_id == current_user.id)
-    ).all()
-    for m in mentorships:
-        mentor_id = int(getattr(m, "mentor_id"))
-        mentee_id = int(getattr(m, "mentee_id"))
-        me_id = int(getattr(current_user, "id"))
-        counterparts.add(mentor_id if mentor_id != me_id else mentee_id)
-
-    bookings = db.query(Booking).filter(
-        or_(Booking.mentor_id == current_user.id, Booking.mentee_id == current_user.id)
-    ).all()
-    for b in bookings:
-        mentor_id = int(getattr(b, "mentor_id"))
-        mentee_id = int(getattr(b, "mentee_id"))
-        me_id = int(getattr(current_user, "id"))
-        counterparts.add(mentor_id if mentor_id != me_id else mentee_id)
-
-    conversations: list[ConversationOut] = []
-    for other_id in sorted(counterparts):
-        if not _chat_allowed(db, int(getattr(current_user, "id")), int(other_id)):
-            continue
-
-        other_user = db.query(User).filter(User.id == other_id).first()
-        if not other_user:
-            continue
-
-        last_msg: Optional[Message] = db.query(Message).filter(
-            or_(
-                and_(Message.sender_id == current_user.id, Message.recipient_id == other_id),
-                and_(Message.sender_id == other_id, Message.recipient_id == current_user.id),
-            )
-        ).order_by(desc(Message.created_at)).first()
-
-        conversations.append(
-            ConversationOut(
-                other_user_id=other_id,
-                other_user_name=_display_name_for_user(db, other_user),
-                last_message=(getattr(last_msg, "content", None) if last_msg else None),
-                last_message_at=(getattr(last_msg, "created_at", None) if last_msg else None),
-            )
-        )
+    moved = mark_read(db, me, latest)
+    db.commit()
 
-    conversations.sort(key=lambda c: c.last_message_at or 0, reverse=True)
-    return conversations
+    for other, message_id in moved.items():
+        chat_hub.publish([me, other], {"type": "read", "reader_id": me, "peer_id": other, "message_id": message_id})
+    return unread_summary(db, current_user)
 
 
 @router.get("/messages/{other_user_id}", response_model=list[MessageOut])
 def list_messages(
     other_user_id: int,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    response: Response,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    before: Optional[int] = Query(None, description="Older history: messages with id < before"),
+    after: Optional[int] = Query(None, description="Messages with id > after"),
+    since: Optional[str] = Query(None, description="Sync token from the X-Sync-Token header"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    if not _chat_allowed(db, int(getattr(current_user, "id")), int(other_user_id)):
+    """Conversation history, oldest first within the page.
+
+    Without a cursor this is the newest ``limit`` messages; page back with
+    ``before=<oldest id shown>``. ``since`` (or ``after``) returns only
+    newer messages. X-Has-More says whether more exist in the direction
+    fetched. X-Sync-Token is set whenever the page reaches the newest
+    message, so the next poll fetches just what arrived since.
+    """
+    me = int(getattr(current_user, "id"))
+    if not chat_allowed(db, me, int(other_user_id)):
         raise HTTPException(status_code=403, detail="Chat not allowed")
+    if sum(cursor is not None for cursor in (before, after, since)) > 1:
+        raise HTTPException(status_code=400, detail="Use only one of before, after and since")
 
-    messages = db.query(Message).filter(
-        or_(
-            and_(Message.sender_id == current_user.id, Message.recipient_id == other_user_id),
-            and_(Message.sender_id == other_user_id, Message.recipient_id == current_user.id),
-        )
-    ).order_by(Message.created_at.asc()).limit(limit).all()
+    low, high = pair_key(me, int(other_user_id))
+    if since is not None:
+        token_low, token_high, after = decode_cursor(since, 3)
+        if (token_low, token_high) != (low, high) or not isinstance(after, int):
+            raise HTTPException(status_code=400, detail="Sync token belongs to another conversation")
+
+    query = db.query(Message).filter(Message.pair_low_id == low, Message.pair_high_id == high)
+    if after is not None:
+        messages = query.filter(Message.id > after).order_by(Message.id.asc()).limit(limit + 1).all()
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+    else:
+        if before is not None:
+            query = query.filter(Message.id < before)
+        messages = query.order_by(Message.id.desc()).limit(limit + 1).all()
+        has_more = len(messages) > limit
+        messages = messages[:limit][::-1]
 
+    response.headers[HAS_MORE_HEADER] = "true" if has_more else "false"
+    reaches_newest = before is None and not (after is not None and has_more)
+    if reaches_newest:
+        newest = messages[-1].id if messages else (after or 0)
+        response.headers[SYNC_TOKEN_HEADER] = encode_cursor([low, high, newest])
     return messages
 
 
@@ -136,7 +191,7 @@ def send_message(
     if not payload.content or not payload.content.strip():
         raise HTTPException(status_code=400, detail="Message is empty")
 
-    if not _chat_allowed(db, int(getattr(current_user, "id")), int(payload.recipient_id)):
+    if not chat_allowed(db, int(getattr(current_user, "id")), int(payload.recipient_id)):
         raise HTTPException(status_code=403, detail="Chat not allowed")
 
     recipient = db.query(User).filter(User.id == payload.recipient_id).first()
@@ -149,6 +204,79 @@ def send_message(
         content=payload.content.strip(),
     )
     db.add(msg)
+    db.flush()
+    record_message(db, msg)
     db.commit()
     db.refresh(msg)
+
+    # Both sides: the recipient and the sender's other open tabs.
+    chat_hub.publish(
+        [int(msg.recipient_id), int(msg.sender_id)],
+        {"type": "message", "message": MessageOut.model_validate(msg).model_dump(mode="json")},
+    )
     return msg
+
+
+# -------------------------
+# Real-time delivery
+# -------------------------
+def _socket_principal(token: Optional[str]) -> Optional[Principal]:
+    if not token:
+        return None
+    try:
+        user_id = decode_user_id(token)
+    except JWTError:
+        return None
+    db = SessionLocal()
+    try:
+        return load_principal(db, user_id)
+    finally:
+        db.close()
+
+
+@router.websocket("/ws")
+async def chat_socket(websocket: WebSocket, token: Optional[str] = None):
+    """Push new messages as they are sent.
+
+    Authenticate with ``?token=<access token>`` (browsers cannot set headers
+    on a WebSocket) or an ``Authorization: Bearer`` header. Server events are
+    ``{"type": "ready"}`` once, then ``{"type": "message", "message": {...}}``;
+    the client may send ``{"type": "ping"}`` and gets ``{"type": "pong"}``.
+    """
+    if token is None:
+        scheme, _, header_token = websocket.headers.get("authorization", "").partition(" ")
+        token = header_token if scheme.lower() == "bearer" else None
+    principal = await run_in_threadpool(_socket_principal, token)
+    if principal is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    connection = chat_hub.connect(principal.id)
+    try:
+        await websocket.send_json({"type": "ready", "user_id": principal.id})
+
+        async def receive():
+            while True:
+                try:
+                    data = json.loads(await websocket.receive_text())
+                except ValueError:
+                    continue
+                if isinstance(data, dict) and data.get("type") == "ping":
+                    await websocket.send_json({"type": "pong"})
+
+        async def forward():
+            while (event := await connection.queue.get()) is not None:
+                await websocket.send_json(event)
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+        tasks = [asyncio.create_task(receive()), asyncio.create_task(forward())]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                raise error
+    finally:
+        chat_hub.disconnect(connection)
@@ -1,9 +1,9 @@
 # app/routes/feedback_routes.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, cast
-from app.database import get_db
+from app.database import get_async_db, get_async_read_db
 from app.models.feedback import SessionFeedback
 from app.models.booking import Booking
 from app.models.user import User
@@ -13,7 +13,8 @@ from app.schemas.feedback_schema import (
     FeedbackResponse,
     MentorRatingsSummary
 )
-from app.utils.auth_utils import get_current_user, require_role
+from app.auth import require_role
+from app.utils.pagination import PageParams, paginate_async
 from datetime import datetime
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
@@ -22,13 +23,13 @@ router = APIRouter(prefix="/feedback", tags=["feedback"])
 @router.post("/complete-session")
 async def complete_session(
     request: SessionCompleteRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_role("mentor"))
 ):
     """Mentor marks session as complete"""
     
     # Verify booking belongs to this mentor
-    booking = db.query(Booking).filter(Booking.id == request.booking_id).first()
+    booking = await db.get(Booking, request.booking_id)
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
@@ -36,9 +37,9 @@ async def complete_session(
         raise HTTPException(status_code=403, detail="This booking doesn't belong to you")
     
     # Check if already completed
-    existing_feedback = db.query(SessionFeedback).filter(
-        SessionFeedback.booking_id == request.booking_id
-    ).first()
+    existing_feedback = (await db.execute(
+        select(SessionFeedback).filter(SessionFeedback.booking_id == request.booking_id)
+    )).scalars().first()
     
     if existing_feedback is not None and cast(Optional[datetime], existing_feedback.session_completed_at) is not None:
         raise HTTPException(status_code=400, detail="Session already marked as complete")
@@ -59,7 +60,7 @@ async def complete_session(
     # Update booking status
     setattr(booking, "status", "completed")
     
-    db.commit()
+    await db.commit()
     
     return {"message": "Session marked as complete. Mentee can now submit feedback."}
 
@@ -67,13 +68,13 @@ async def complete_session(
 @router.post("/submit", response_model=FeedbackResponse)
 async def submit_feedback(
     request: FeedbackCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_role("mentee"))
 ):
     """Mentee submits feedback and rating"""
     
     # Verify booking belongs to this mentee
-    booking = db.query(Booking).filter(Booking.id == request.booking_id).first()
+    booking = await db.get(Booking, request.booking_id)
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
@@ -85,9 +86,9 @@ async def submit_feedback(
         raise HTTPException(status_code=400, detail="Session must be marked complete by mentor first")
     
     # Check if feedback already exists
-    existing_feedback = db.query(SessionFeedback).filter(
-        SessionFeedback.booking_id == request.booking_id
-    ).first()
+    existing_feedback = (await db.execute(
+        select(SessionFeedback).filter(SessionFeedback.booking_id == request.booking_id)
+    )).scalars().first()
     
     if existing_feedback is not None and cast(Optional[int], existing_feedback.rating) is not None and cast(int, existing_feedback.rating) > 0:
         raise HTTPException(status_code=400, detail="Feedback already submitted for this session")
@@ -108,21 +109,23 @@ async def submit_feedback(
         )
         db.add(feedback)
     
-    db.commit()
-    db.refresh(feedback)
+    await db.commit()
+    await db.refresh(feedback)
     
     return feedback
 
 
 @router.get("/mentor/{mentor_id}/ratings", response_model=MentorRatingsSummary)
-async def get_mentor_ratings(mentor_id: int, db: Session = Depends(get_db)):
+async def get_mentor_ratings(mentor_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """Get mentor's rating summary"""
     
     # Get all feedback for this mentor
-    feedbacks = db.query(SessionFeedback).filter(
-        SessionFeedback.mentor_id == mentor_id,
-        SessionFeedback.rating > 0
-    ).all()
+    feedbacks = (await db.execute(
+        select(SessionFeedback).filter(
+            SessionFeedback.mentor_id == mentor_id,
+            SessionFeedback.rating > 0
+        )
+    )).scalars().all()
     
     if not feedbacks:
         return MentorRatingsSummary(
@@ -158,29 +161,42 @@ async def get_mentor_feedback(
     mentor_id: int,
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get mentor's feedback with pagination"""
     
-    feedbacks = db.query(SessionFeedback).filter(
-        SessionFeedback.mentor_id == mentor_id,
-        SessionFeedback.rating > 0,
-        SessionFeedback.feedback_text.isnot(None)
-    ).order_by(SessionFeedback.created_at.desc()).offset(skip).limit(limit).all()
+    feedbacks = (await db.execute(
+        select(SessionFeedback).filter(
+            SessionFeedback.mentor_id == mentor_id,
+            SessionFeedback.rating > 0,
+            SessionFeedback.feedback_text.isnot(None)
+        ).order_by(SessionFeedback.created_at.desc()).offset(skip).limit(limit)
+    )).scalars().all()
     
     return feedbacks
 
 
 @router.get("/my-feedback")
 async def get_my_feedback_received(
-    db: Session = Depends(get_db),
+    response: Response,
+    rating: Optional[int] = Query(None, ge=1, le=5),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_role("mentor"))
 ):
-    """Get all feedback received by current mentor"""
+    """Get feedback received by current mentor, newest first"""
     
-    feedbacks = db.query(SessionFeedback).filter(
+    query = select(SessionFeedback).filter(
         SessionFeedback.mentor_id == current_user.id,
         SessionFeedback.rating > 0
-    ).order_by(SessionFeedback.created_at.desc()).all()
-    
-    return feedbacks
+    )
+    if rating is not None:
+        query = query.filter(SessionFeedback.rating == rating)
+    
+    return await paginate_async(
+        db,
+        query,
+        [(SessionFeedback.created_at, True), (SessionFeedback.id, True)],
+        page,
+        response,
+    )
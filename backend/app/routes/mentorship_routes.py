@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
+from typing import Optional
 from app.database import get_db
 from app.auth import get_current_user
 from app.models.user import User
@@ -12,12 +13,17 @@ from app.schemas.mentorship_schema import (
     MentorshipOut,
     MentorshipWithDetails
 )
+from app.utils.pagination import PageParams, paginate
 
 router = APIRouter(
     prefix="/mentorship",
     tags=["Mentorship"]
 )
 
+# Newest first; see app.utils.pagination
+REQUEST_SORT_KEY = [(MentorshipRequest.created_at, True), (MentorshipRequest.id, True)]
+REQUEST_STATUS_PATTERN = "^(pending|accepted|rejected)$"
+
 
 # -------------------------
 # Create Mentorship Request (Mentee -> Mentor)
@@ -87,15 +93,21 @@ def create_request(
 # -------------------------
 @router.get("/requests/sent", response_model=list[MentorshipRequestWithDetails])
 def get_sent_requests(
+    response: Response,
+    status_filter: Optional[str] = Query(None, regex=REQUEST_STATUS_PATTERN),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role != "mentee":
         raise HTTPException(status_code=403, detail="Only mentees can view sent requests")
     
-    requests = db.query(MentorshipRequest).filter(
+    query = db.query(MentorshipRequest).filter(
         MentorshipRequest.mentee_id == current_user.id
-    ).all()
+    )
+    if status_filter:
+        query = query.filter(MentorshipRequest.status == status_filter)
+    requests = paginate(query, REQUEST_SORT_KEY, page, response)
     
     # Add mentor names
     result = []
@@ -116,15 +128,21 @@ def get_sent_requests(
 # -------------------------
 @router.get("/requests/received", response_model=list[MentorshipRequestWithDetails])
 def get_received_requests(
+    response: Response,
+    status_filter: Optional[str] = Query(None, regex=REQUEST_STATUS_PATTERN),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role != "mentor":
         raise HTTPException(status_code=403, detail="Only mentors can view received requests")
     
-    requests = db.query(MentorshipRequest).filter(
+    query = db.query(MentorshipRequest).filter(
         MentorshipRequest.mentor_id == current_user.id
-    ).all()
+    )
+    if status_filter:
+        query = query.filter(MentorshipRequest.status == status_filter)
+    requests = paginate(query, REQUEST_SORT_KEY, page, response)
     
     # Add mentee names
     result = []
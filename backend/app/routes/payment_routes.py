@@ -1,23 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, Header, Request
-from sqlalchemy.orm import Session
-from app.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db, get_async_read_db
 from app.models.user import User
 from app.models.booking import Booking
 from app.models.payment import Payment, MentorBalance
 from app.auth import get_current_user
+from app.utils.pagination import PageParams, paginate_async
+from functools import lru_cache
 from typing import Optional
-import stripe
 import os
 from datetime import datetime
 
-# Initialize Stripe
-stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
 STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
 PLATFORM_COMMISSION_RATE = 0.10  # 10% platform fee
 
 router = APIRouter(prefix="/payments", tags=["payments"])
 
 
+@lru_cache(maxsize=None)
+def _stripe():
+    """Stripe SDK, imported and configured on first use (it is ~40% of app import time)."""
+    import stripe
+
+    stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
+    return stripe
+
+
 def calculate_commission(amount: float) -> tuple:
     """Calculate platform fee and mentor payout"""
     platform_fee = round(amount * PLATFORM_COMMISSION_RATE, 2)
@@ -31,12 +41,12 @@ async def create_checkout_session(
     success_url: str,
     cancel_url: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create Stripe checkout session for booking payment"""
     
     # Verify booking exists and belongs to current user (mentee)
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
+    booking = await db.get(Booking, booking_id)
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
@@ -50,13 +60,17 @@ async def create_checkout_session(
         raise HTTPException(status_code=400, detail="Booking already paid")
     
     # Check if payment intent already exists
-    existing_payment = db.query(Payment).filter(Payment.booking_id == booking_id).first()
+    existing_payment = (await db.execute(
+        select(Payment).filter(Payment.booking_id == booking_id)
+    )).scalars().first()
     if existing_payment and existing_payment.status == "succeeded":
         raise HTTPException(status_code=400, detail="Payment already completed")
     
+    stripe = await run_in_threadpool(_stripe)
     try:
-        # Create Stripe checkout session
-        checkout_session = stripe.checkout.Session.create(
+        # Create Stripe checkout session (blocking HTTP call, kept off the event loop)
+        checkout_session = await run_in_threadpool(
+            stripe.checkout.Session.create,
             payment_method_types=["card"],
             line_items=[{
                 "price_data": {
@@ -81,7 +95,7 @@ async def create_checkout_session(
         
         # Store payment intent ID in booking
         booking.payment_intent_id = checkout_session.payment_intent
-        db.commit()
+        await db.commit()
         
         return {
             "checkout_url": checkout_session.url,
@@ -97,7 +111,7 @@ async def create_checkout_session(
 async def stripe_webhook(
     request: Request,
     stripe_signature: Optional[str] = Header(None, alias="stripe-signature"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Handle Stripe webhook events with idempotency"""
     
@@ -105,6 +119,7 @@ async def stripe_webhook(
     payload = await request.body()
     
     # Verify webhook signature
+    stripe = await run_in_threadpool(_stripe)
     try:
         event = stripe.Webhook.construct_event(
             payload, stripe_signature, STRIPE_WEBHOOK_SECRET
@@ -120,18 +135,18 @@ async def stripe_webhook(
         event_id = event["id"]
         
         # Idempotency check: check if this webhook event was already processed
-        existing_payment = db.query(Payment).filter(
-            Payment.webhook_event_id == event_id
-        ).first()
+        existing_payment = (await db.execute(
+            select(Payment).filter(Payment.webhook_event_id == event_id)
+        )).scalars().first()
         
         if existing_payment:
             # Event already processed, return success
             return {"status": "already_processed", "event_id": event_id}
         
         # Also check by payment_intent_id for duplicate prevention
-        existing_by_intent = db.query(Payment).filter(
-            Payment.payment_intent_id == payment_intent["id"]
-        ).first()
+        existing_by_intent = (await db.execute(
+            select(Payment).filter(Payment.payment_intent_id == payment_intent["id"])
+        )).scalars().first()
         
         if existing_by_intent and existing_by_intent.webhook_processed:
             # Payment already processed with different event ID
@@ -141,11 +156,11 @@ async def stripe_webhook(
         booking_id = payment_intent.get("metadata", {}).get("booking_id")
         if not booking_id:
             # Fallback: find booking by payment_intent_id
-            booking = db.query(Booking).filter(
-                Booking.payment_intent_id == payment_intent["id"]
-            ).first()
+            booking = (await db.execute(
+                select(Booking).filter(Booking.payment_intent_id == payment_intent["id"])
+            )).scalars().first()
         else:
-            booking = db.query(Booking).filter(Booking.id == int(booking_id)).first()
+            booking = await db.get(Booking, int(booking_id))
         
         if not booking:
             raise HTTPException(status_code=404, detail="Booking not found for payment")
@@ -181,9 +196,9 @@ async def stripe_webhook(
         booking.payment_status = "paid"
         
         # Update mentor balance
-        mentor_balance = db.query(MentorBalance).filter(
-            MentorBalance.mentor_id == booking.mentor_id
-        ).first()
+        mentor_balance = (await db.execute(
+            select(MentorBalance).filter(MentorBalance.mentor_id == booking.mentor_id)
+        )).scalars().first()
         
         # Hold mentor payout until session summary is approved by mentee.
         if not mentor_balance:
@@ -202,7 +217,7 @@ async def stripe_webhook(
         # Mark commission as paid
         payment.commission_paid = True
         
-        db.commit()
+        await db.commit()
         
         return {
             "status": "success",
@@ -219,23 +234,23 @@ async def stripe_webhook(
 @router.get("/balance")
 async def get_mentor_balance(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get mentor's current balance"""
     
     if current_user.role.lower() != "mentor":
         raise HTTPException(status_code=403, detail="Only mentors can view balance")
     
-    balance = db.query(MentorBalance).filter(
-        MentorBalance.mentor_id == current_user.id
-    ).first()
+    balance = (await db.execute(
+        select(MentorBalance).filter(MentorBalance.mentor_id == current_user.id)
+    )).scalars().first()
     
     if not balance:
         # Create initial balance
         balance = MentorBalance(mentor_id=current_user.id)
         db.add(balance)
-        db.commit()
-        db.refresh(balance)
+        await db.commit()
+        await db.refresh(balance)
     
     return {
         "mentor_id": balance.mentor_id,
@@ -246,23 +261,33 @@ async def get_mentor_balance(
     }
 
 
+# Newest first; see app.utils.pagination
+PAYMENT_SORT_KEY = [(Payment.created_at, True), (Payment.id, True)]
+
+
 @router.get("/history")
 async def get_payment_history(
+    response: Response,
+    status: Optional[str] = None,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get payment history for current user"""
     
     if current_user.role.lower() == "mentor":
         # Get payments for mentor's bookings
-        payments = db.query(Payment).join(Booking).filter(
+        query = select(Payment).join(Booking).filter(
             Booking.mentor_id == current_user.id
-        ).order_by(Payment.created_at.desc()).all()
+        )
     else:
         # Get payments for mentee's bookings
-        payments = db.query(Payment).join(Booking).filter(
+        query = select(Payment).join(Booking).filter(
             Booking.mentee_id == current_user.id
-        ).order_by(Payment.created_at.desc()).all()
+        )
+    if status:
+        query = query.filter(Payment.status == status)
+    payments = await paginate_async(db, query, PAYMENT_SORT_KEY, page, response)
     
     return [{
         "id": p.id,
@@ -279,16 +304,23 @@ async def get_payment_history(
 
 @router.get("/my-payments")
 async def get_my_payments(
+    response: Response,
+    status: Optional[str] = None,
+    page: PageParams = Depends(),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """Get all payments for the current user (mentee's payments or mentor's earnings)"""
+    """Get payments for the current user (mentee's payments or mentor's earnings)"""
     print(f"DEBUG /my-payments - User ID: {current_user.id}, Email: {getattr(current_user, 'email', None)}, Role: {current_user.role}")
+    query = select(Payment).join(Booking)
+    if status:
+        query = query.filter(Payment.status == status)
+
     if current_user.role.lower() == "mentee":
         # Get payments made by this mentee
-        payments = db.query(Payment).join(Booking).filter(
-            Booking.mentee_id == current_user.id
-        ).order_by(Payment.created_at.desc()).all()
+        payments = await paginate_async(
+            db, query.filter(Booking.mentee_id == current_user.id), PAYMENT_SORT_KEY, page, response
+        )
         return [{
             "id": p.id,
             "booking_id": p.booking_id,
@@ -300,9 +332,9 @@ async def get_my_payments(
         } for p in payments]
     elif current_user.role.lower() == "mentor":
         # Get payments received by this mentor
-        payments = db.query(Payment).join(Booking).filter(
-            Booking.mentor_id == current_user.id
-        ).order_by(Payment.created_at.desc()).all()
+        payments = await paginate_async(
+            db, query.filter(Booking.mentor_id == current_user.id), PAYMENT_SORT_KEY, page, response
+        )
         return [{
             "id": p.id,
             "booking_id": p.booking_id,
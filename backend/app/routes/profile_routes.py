@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
-from app.database import get_db
+from typing import Optional
+from app.database import get_db, get_read_db
 from app.models.profile import MentorProfile, MenteeProfile
 from app.schemas.profile_schema import MentorProfileCreate, MentorProfileOut, MenteeProfileCreate, MenteeProfileOut
 from app.auth import get_current_user
 from app.models.user import User
+from app.utils.pagination import PageParams, paginate
+from app.utils.mentor_index import mentor_index
+from app.utils.match_worker import enqueue_match_job
 
 router = APIRouter(
     prefix="/profiles",
@@ -28,6 +32,8 @@ def create_mentor_profile(profile: MentorProfileCreate, db: Session = Depends(ge
     db.add(new_profile)
     db.commit()
     db.refresh(new_profile)
+    mentor_index.upsert(new_profile)
+    enqueue_match_job(db, "mentor", current_user.id)
     return new_profile
 
 
@@ -50,6 +56,8 @@ def update_mentor_profile(profile: MentorProfileCreate, db: Session = Depends(ge
     
     db.commit()
     db.refresh(db_profile)
+    mentor_index.upsert(db_profile)
+    enqueue_match_job(db, "mentor", current_user.id)
     return db_profile
 
 
@@ -67,6 +75,8 @@ def delete_mentor_profile(db: Session = Depends(get_db), current_user: User = De
     
     db.delete(db_profile)
     db.commit()
+    mentor_index.remove(current_user.id)
+    enqueue_match_job(db, "mentor", current_user.id)
     return {"message": "Mentor profile deleted successfully"}
 
 
@@ -135,7 +145,7 @@ def delete_mentee_profile(db: Session = Depends(get_db), current_user: User = De
 # Get Current User's Profile
 # -------------------------
 @router.get("/me")
-def get_my_profile(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_my_profile(db: Session = Depends(get_read_db), current_user: User = Depends(get_current_user)):
     """Get the current user's profile (mentor or mentee)"""
     # Debug logging
     print(f"DEBUG /profiles/me - User ID: {current_user.id}, Email: {current_user.email}, Role: {current_user.role}")
@@ -169,10 +179,23 @@ def get_my_profile(db: Session = Depends(get_db), current_user: User = Depends(g
 # Get All Mentor Profiles (for search/listing)
 # -------------------------
 @router.get("/mentors", response_model=list[MentorProfileOut])
-def list_mentors(db: Session = Depends(get_db)):
-    """List all mentor profiles (public endpoint for mentee search)"""
-    mentors = db.query(MentorProfile).all()
-    return mentors
+def list_mentors(
+    response: Response,
+    skill: Optional[str] = None,
+    domain: Optional[str] = None,
+    verified: Optional[bool] = None,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_read_db),
+):
+    """List mentor profiles (public endpoint for mentee search)"""
+    query = db.query(MentorProfile)
+    if skill:
+        query = query.filter(MentorProfile.skills.ilike(f"%{skill}%"))
+    if domain:
+        query = query.filter(MentorProfile.domains.ilike(f"%{domain}%"))
+    if verified is not None:
+        query = query.filter(MentorProfile.is_verified == verified)
+    return paginate(query, [(MentorProfile.id, False)], page, response)
 
 
 # -------------------------
@@ -181,7 +204,7 @@ def list_mentors(db: Session = Depends(get_db)):
 @router.get("/mentor/{mentor_id}", response_model=MentorProfileOut)
 def get_mentor_profile(
     mentor_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _current_user: User = Depends(get_current_user),
 ):
     """Get a mentor profile by the mentor's user id (authenticated endpoint)."""
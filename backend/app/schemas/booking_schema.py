@@ -110,4 +110,10 @@ class AvailableSlot(BaseModel):
 
 class AvailableSlotsResponse(BaseModel):
     mentor_id: int
-    available_slots: list[AvailableSlot]
\ No newline at end of file
+    available_slots: list[AvailableSlot]
+
+class MultiMentorAvailabilityResponse(BaseModel):
+    """Free slots for several mentors over one date window"""
+    start_date: date
+    end_date: date
+    mentors: list[AvailableSlotsResponse]
@@ -24,3 +24,21 @@ class ConversationOut(BaseModel):
     other_user_name: str
     last_message: Optional[str] = None
     last_message_at: Optional[datetime] = None
+    unread_count: int = 0
+    # Read receipt: the last of my messages the other user has read
+    other_last_read_message_id: Optional[int] = None
+
+
+class MarkRead(BaseModel):
+    other_user_id: int
+    message_id: int  # everything up to and including this id is read
+
+
+class UnreadConversation(BaseModel):
+    other_user_id: int
+    unread_count: int
+
+
+class UnreadSummary(BaseModel):
+    total: int
+    conversations: list[UnreadConversation]
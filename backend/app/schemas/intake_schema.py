@@ -88,4 +88,17 @@ class MentorMatchOut(BaseModel):
     match_reasons: List[str]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class MatchJobOut(BaseModel):
+    """Background re-matching job status"""
+    id: int
+    status: str  # "pending", "running", "done", "failed"
+    attempts: int
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
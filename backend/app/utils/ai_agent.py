@@ -3,10 +3,56 @@
 Enhanced AI Agent for Mentee Intake
 """
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
 
+class KeywordMatcher:
+    """All keywords of one map compiled into a single regex.
+
+    A keyword only matches at the start of a word ("new" does not match
+    "renew"), and a keyword ending in a digit must end the number ("1" does
+    not match "10"). Other keywords may run into a longer word, so "skill"
+    still matches "skills". The leftmost match wins, and at the same position
+    the longest keyword wins ("new role" over "new").
+    """
+
+    def __init__(self, keywords_map: Dict[str, str]):
+        self.values: Dict[str, str] = {}
+        for keyword, value in keywords_map.items():
+            if keyword:
+                self.values.setdefault(keyword.lower(), value)
+        # sorted() is stable, so equal-length keywords keep map order.
+        self.keywords = sorted(self.values, key=len, reverse=True)
+        alternation = "|".join(
+            re.escape(k) + (r"(?![0-9])" if k[-1].isdigit() else "") for k in self.keywords
+        )
+        # A leading boundary character (rather than a lookbehind) lets the
+        # regex engine skip ahead to candidate positions.
+        self.pattern = re.compile(r"[^a-z0-9](" + alternation + ")") if self.keywords else None
+
+    def find(self, text: str) -> Optional[str]:
+        if self.pattern is None:
+            return None
+        match = self.pattern.search(" " + text.lower())
+        return self.values[match.group(1)] if match else None
+
+
+@lru_cache(maxsize=64)
+def _compiled_matcher(items: Tuple[Tuple[str, str], ...]) -> KeywordMatcher:
+    return KeywordMatcher(dict(items))
+
+
+def keyword_matcher(keywords_map: Dict[str, str]) -> KeywordMatcher:
+    """Compiled matcher for ``keywords_map``, built once per distinct map."""
+    return _compiled_matcher(tuple(keywords_map.items()))
+
+
+_SKILL_FILLER_RE = re.compile(r'\b(and|or|also|want|to|learn|develop|improve)\b', re.IGNORECASE)
+_SKILL_SPLIT_RE = re.compile(r'[,\n•\-]')
+
+
 class EnhancedIntakeAgent:
     """
     Enhanced AI agent for mentee intake with:
@@ -191,16 +237,12 @@ class EnhancedIntakeAgent:
     
     def extract_keywords(self, text: str, keywords_map: Dict[str, str]) -> Optional[str]:
         """Extract structured value from text using keyword matching"""
-        text_lower = text.lower()
-        for keyword, value in keywords_map.items():
-            if keyword in text_lower:
-                return value
-        return None
+        return keyword_matcher(keywords_map).find(text)
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skill list from text"""
-        text = re.sub(r'\b(and|or|also|want|to|learn|develop|improve)\b', '', text, flags=re.IGNORECASE)
-        skills = re.split(r'[,\n•\-]', text)
+        text = _SKILL_FILLER_RE.sub('', text)
+        skills = _SKILL_SPLIT_RE.split(text)
         skills = [s.strip().title() for s in skills if len(s.strip()) > 2]
         return skills[:5]
     
@@ -232,7 +274,7 @@ class EnhancedIntakeAgent:
         result = {"raw_input": user_input}
         
         if "keywords" in current_question:
-            extracted = self.extract_keywords(user_input, current_question["keywords"])
+            extracted = step_matcher(step).find(user_input)
             if extracted:
                 result[question_type] = extracted
             else:
@@ -277,11 +319,98 @@ class EnhancedIntakeAgent:
         return " | ".join(summary_parts)
 
 
+@lru_cache(maxsize=None)
+def step_matcher(step: int) -> KeywordMatcher:
+    """Compiled matcher for a conversation step, built on first use."""
+    for question in EnhancedIntakeAgent.CONVERSATION_FLOW:
+        if question["step"] == step and "keywords" in question:
+            return keyword_matcher(question["keywords"])
+    raise KeyError(step)
+
+
+# Scoring tables shared by the scalar scorer and the mentor search index
+EXPERIENCE_RANGES = {
+    "student": (1, 5),
+    "early_career": (3, 10),
+    "mid_level": (5, 15),
+    "senior": (10, 30),
+    "career_change": (5, 20)
+}
+
+BUDGET_RANGES = {
+    "free": (0, 0),
+    "0-50": (0, 50),
+    "50-100": (50, 100),
+    "100+": (100, 10000)
+}
+
+GOAL_KEYWORDS = {
+    "skill_development": ["teach", "train", "mentor", "coach"],
+    "career_transition": ["transition", "change", "pivot", "switch"],
+    "leadership": ["lead", "manage", "team", "executive"],
+    "entrepreneurship": ["startup", "business", "founder", "entrepreneur"]
+}
+
+# Most a mentor can score without any skill or domain overlap
+# (experience + budget + verified + goal bonus).
+NON_TEXT_SCORE_MAX = 20 + 12 + 8 + 10
+
+
+class IntakeFeatures:
+    """Intake fields normalized once per matching run."""
+
+    def __init__(self, intake):
+        self.desired_skills = [s.strip().lower() for s in (intake.desired_skills or "").split(",")]
+        self.industry_interest = intake.industry_interest
+        self.industry_keywords = intake.industry_interest.lower().split() if intake.industry_interest else []
+        self.career_stage = intake.career_stage
+        self.exp_range = EXPERIENCE_RANGES.get(intake.career_stage, (0, 30))
+        self.budget_range = BUDGET_RANGES.get(intake.budget_range, (0, 10000))
+        self.primary_goal = intake.primary_goal
+
+
+class MentorFeatures:
+    """Snapshot of a MentorProfile with the text pre-split and lowercased.
+
+    Holds plain values (no ORM state) so it can live in process-wide caches.
+    """
+
+    def __init__(self, mentor):
+        self.id = mentor.id
+        self.user_id = mentor.user_id
+        self.full_name = mentor.full_name
+        self.domains = mentor.domains
+        self.skills = mentor.skills
+        self.years_experience = mentor.years_experience
+        self.bio = mentor.bio
+        self.hourly_rate = mentor.hourly_rate
+        self.availability = mentor.availability
+        self.is_verified = mentor.is_verified
+
+        self.skills_list = [s.strip().lower() for s in (mentor.skills or "").split(",")]
+        self.domains_lower = (mentor.domains or "").lower()
+        self.bio_lower = (mentor.bio or "").lower()
+        self.goal_matches = frozenset(
+            goal for goal, keywords in GOAL_KEYWORDS.items()
+            if mentor.bio and any(kw in self.bio_lower for kw in keywords)
+        )
+
+
 def calculate_enhanced_match_score(intake, mentor) -> Tuple[int, List[str], Dict]:
     """
     Enhanced matching algorithm with multiple factors.
     Returns: (score, reasons, metadata)
     """
+    return score_match_features(IntakeFeatures(intake), MentorFeatures(mentor))
+
+
+def score_match_features(intake: IntakeFeatures, mentor: MentorFeatures, text_overlap: bool = True) -> Tuple[int, List[str], Dict]:
+    """calculate_enhanced_match_score on pre-normalized features.
+
+    Pass ``text_overlap=False`` when the caller already knows the mentor
+    shares no skills or domain keywords with the intake (see mentor_index)
+    to skip the string comparisons.
+    """
     score = 0
     reasons = []
     metadata = {
@@ -291,51 +420,60 @@ def calculate_enhanced_match_score(intake, mentor) -> Tuple[int, List[str], Dict
         "budget_compatible": False
     }
     
-    # 1. Skills match (35 points max)
-    desired_skills = [s.strip().lower() for s in (intake.desired_skills or "").split(",")]
-    mentor_skills = [s.strip().lower() for s in (mentor.skills or "").split(",")]
-    
-    exact_matches = [skill for skill in desired_skills if skill in mentor_skills]
+    if text_overlap:
+        # 1. Skills match (35 points max)
+        desired_skills = intake.desired_skills
+        mentor_skills = mentor.skills_list
+        
+        exact_matches = [skill for skill in desired_skills if skill in mentor_skills]
+        
+        partial_matches = []
+        for desired in desired_skills:
+            for mentor_skill in mentor_skills:
+                if desired in mentor_skill or mentor_skill in desired:
+                    if desired not in exact_matches:
+                        partial_matches.append(desired)
+        
+        skill_score = min(35, len(exact_matches) * 12 + len(partial_matches) * 6)
+        score += skill_score
+        
+        if exact_matches:
+            metadata["skill_overlap"] = exact_matches
+            reasons.append(f"✓ Expert in {', '.join(exact_matches[:3])}")
+        
+        # 2. Domain/Industry match (25 points max)
+        if intake.industry_interest:
+            domain_match_count = sum(1 for keyword in intake.industry_keywords
+                                     if keyword in mentor.domains_lower or keyword in mentor.bio_lower)
+            
+            if domain_match_count > 0:
+                domain_score = min(25, domain_match_count * 10)
+                score += domain_score
+                metadata["domain_match"] = True
+                reasons.append(f"✓ {intake.industry_interest} specialist")
     
-    partial_matches = []
-    for desired in desired_skills:
-        for mentor_skill in mentor_skills:
-            if desired in mentor_skill or mentor_skill in desired:
-                if desired not in exact_matches:
-                    partial_matches.append(desired)
+    # 3-6. Experience, budget, verification and goal alignment
+    non_text_score, non_text_reasons, non_text_metadata = score_non_text_features(intake, mentor)
+    score += non_text_score
+    reasons.extend(non_text_reasons)
+    metadata.update(non_text_metadata)
     
-    skill_score = min(35, len(exact_matches) * 12 + len(partial_matches) * 6)
-    score += skill_score
+    score = min(100, score)
     
-    if exact_matches:
-        metadata["skill_overlap"] = exact_matches
-        reasons.append(f"✓ Expert in {', '.join(exact_matches[:3])}")
+    if score < 25:
+        reasons.append("ℹ️ Limited match - consider browsing more mentors")
     
-    # 2. Domain/Industry match (25 points max)
-    if intake.industry_interest:
-        industry_keywords = intake.industry_interest.lower().split()
-        mentor_domains_lower = (mentor.domains or "").lower()
-        mentor_bio_lower = (mentor.bio or "").lower()
-        
-        domain_match_count = sum(1 for keyword in industry_keywords 
-                                 if keyword in mentor_domains_lower or keyword in mentor_bio_lower)
-        
-        if domain_match_count > 0:
-            domain_score = min(25, domain_match_count * 10)
-            score += domain_score
-            metadata["domain_match"] = True
-            reasons.append(f"✓ {intake.industry_interest} specialist")
+    return score, reasons, metadata
+
+
+def score_non_text_features(intake: IntakeFeatures, mentor: MentorFeatures) -> Tuple[int, List[str], Dict]:
+    """Score components that need no skill/domain text comparison."""
+    score = 0
+    reasons = []
+    metadata = {}
     
     # 3. Experience level appropriateness (20 points max)
-    experience_map = {
-        "student": (1, 5),
-        "early_career": (3, 10),
-        "mid_level": (5, 15),
-        "senior": (10, 30),
-        "career_change": (5, 20)
-    }
-    
-    exp_range = experience_map.get(intake.career_stage, (0, 30))
+    exp_range = intake.exp_range
     mentor_exp = mentor.years_experience or 0
     
     if exp_range[0] <= mentor_exp <= exp_range[1]:
@@ -347,14 +485,7 @@ def calculate_enhanced_match_score(intake, mentor) -> Tuple[int, List[str], Dict
         reasons.append(f"✓ Highly experienced ({mentor_exp} years)")
     
     # 4. Budget compatibility (12 points max)
-    budget_ranges = {
-        "free": (0, 0),
-        "0-50": (0, 50),
-        "50-100": (50, 100),
-        "100+": (100, 10000)
-    }
-    
-    budget_range = budget_ranges.get(intake.budget_range, (0, 10000))
+    budget_range = intake.budget_range
     mentor_rate = mentor.hourly_rate or 0
     
     if budget_range[0] <= mentor_rate <= budget_range[1]:
@@ -373,23 +504,8 @@ def calculate_enhanced_match_score(intake, mentor) -> Tuple[int, List[str], Dict
         reasons.append("✓ Verified mentor ✓")
     
     # 6. Bonus: Goal alignment from bio analysis (10 points)
-    goal_keywords = {
-        "skill_development": ["teach", "train", "mentor", "coach"],
-        "career_transition": ["transition", "change", "pivot", "switch"],
-        "leadership": ["lead", "manage", "team", "executive"],
-        "entrepreneurship": ["startup", "business", "founder", "entrepreneur"]
-    }
-    
-    if intake.primary_goal and mentor.bio:
-        relevant_keywords = goal_keywords.get(intake.primary_goal, [])
-        bio_lower = mentor.bio.lower()
-        if any(kw in bio_lower for kw in relevant_keywords):
-            score += 10
-            reasons.append(f"✓ Specializes in {intake.primary_goal.replace('_', ' ')}")
-    
-    score = min(100, score)
-    
-    if score < 25:
-        reasons.append("ℹ️ Limited match - consider browsing more mentors")
+    if intake.primary_goal and intake.primary_goal in mentor.goal_matches:
+        score += 10
+        reasons.append(f"✓ Specializes in {intake.primary_goal.replace('_', ' ')}")
     
-    return score, reasons, metadata
\ No newline at end of file
+    return score, reasons, metadata
@@ -1,89 +1,44 @@
+# app/utils/auth_utils.py
+"""
+Compatibility aliases for the old second auth stack.
+
+Everything here now resolves through app.auth: one CryptContext, one
+secret, one token format (user_id or sub claim) and one cached principal
+lookup. New code should import from app.auth directly.
+"""
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.models.user import User
-from app.schemas.user_schema import TokenData
+from jose import jwt
+
+from app.auth import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    ALGORITHM,
+    SECRET_KEY,
+    get_current_user,
+    hash_password as get_password_hash,
+    oauth2_scheme,
+    pwd_context,
+    require_role,
+    verify_password,
+)
+
+__all__ = [
+    "ACCESS_TOKEN_EXPIRE_MINUTES",
+    "ALGORITHM",
+    "create_access_token",
+    "get_current_user",
+    "get_password_hash",
+    "oauth2_scheme",
+    "pwd_context",
+    "require_role",
+    "verify_password",
+]
 
-# --------------------------
-# CONFIGURATION
-# --------------------------
-
-SECRET_KEY = "your_super_secret_key_here"
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60  # 1 hour
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
-
-
-# --------------------------
-# PASSWORD HASHING
-# --------------------------
-
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password):
-    return pwd_context.hash(password)
-
-
-# --------------------------
-# JWT TOKEN CREATION
-# --------------------------
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    """Token with arbitrary claims (e.g. {"sub": str(user_id)})."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
-
-
-# --------------------------
-# GET CURRENT USER
-# --------------------------
-
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        token_data = TokenData(id=int(user_id))
-    except JWTError:
-        raise credentials_exception
-
-    user = db.query(User).filter(User.id == token_data.id).first()
-    if user is None:
-        raise credentials_exception
-    return user
-
-
-# --------------------------
-# ROLE REQUIREMENT
-# --------------------------
-
-def require_role(required_role: str):
-    """Dependency to check if user has required role"""
-    def role_checker(current_user: User = Depends(get_current_user)):
-        if current_user.role != required_role:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. {required_role.capitalize()} role required."
-            )
-        return current_user
-    return role_checker
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
@@ -0,0 +1,195 @@
+# app/utils/batch_scorer.py
+"""
+Vectorized batch mode for calculate_enhanced_match_score.
+
+MentorTable stores the catalog column-wise: NumPy arrays for
+years_experience, hourly_rate, is_verified and the goal-keyword flags, a
+sparse (CSR) mentor x skill incidence matrix with entry counts, and sparse
+substring postings over the lowercased domains/bio text. score_batch()
+computes all six score components for every mentor with array operations
+and picks the top k with argpartition.
+
+Only the k winners go back through the scalar scorer to produce their
+reason strings and metadata, so those match calculate_enhanced_match_score
+exactly.
+"""
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.ai_agent import (
+    GOAL_KEYWORDS,
+    IntakeFeatures,
+    MentorFeatures,
+    score_match_features,
+)
+
+_GRAM = 3
+_GOALS = list(GOAL_KEYWORDS)
+
+
+def _grams(text: str):
+    return {text[i:i + n] for n in range(1, _GRAM + 1) for i in range(len(text) - n + 1)}
+
+
+class MentorTable:
+    """Columnar snapshot of the mentor catalog, ordered by profile id."""
+
+    def __init__(self, features: Sequence[MentorFeatures]):
+        self.features: List[MentorFeatures] = sorted(features, key=lambda f: f.id)
+        n = len(self.features)
+        self.size = n
+
+        self.user_ids = np.fromiter((f.user_id for f in self.features), dtype=np.int64, count=n)
+        self.years_experience = np.fromiter((f.years_experience or 0 for f in self.features), dtype=np.float64, count=n)
+        self.hourly_rate = np.fromiter((f.hourly_rate or 0 for f in self.features), dtype=np.float64, count=n)
+        self.is_verified = np.fromiter((bool(f.is_verified) for f in self.features), dtype=bool, count=n)
+        self.goal_flags = np.zeros((n, len(_GOALS)), dtype=bool)
+        for row, f in enumerate(self.features):
+            for goal in f.goal_matches:
+                self.goal_flags[row, _GOALS.index(goal)] = True
+
+        # Skill incidence in CSR form; data holds how often a skill appears
+        # in the mentor's comma-separated list (the scorer counts duplicates).
+        self.skill_vocab: List[str] = []
+        vocab_index: Dict[str, int] = {}
+        rows, cols, counts = [], [], []
+        for row, f in enumerate(self.features):
+            per_skill: Dict[int, int] = defaultdict(int)
+            for skill in f.skills_list:
+                col = vocab_index.setdefault(skill, len(vocab_index))
+                if col == len(self.skill_vocab):
+                    self.skill_vocab.append(skill)
+                per_skill[col] += 1
+            for col, count in per_skill.items():
+                rows.append(row)
+                cols.append(col)
+                counts.append(count)
+        self.skill_rows = np.array(rows, dtype=np.int64)
+        self.skill_cols = np.array(cols, dtype=np.int64)
+        self.skill_counts = np.array(counts, dtype=np.float64)
+
+        # Domain/bio substring postings: gram -> sorted mentor rows.
+        text_postings: Dict[str, List[int]] = defaultdict(list)
+        for row, f in enumerate(self.features):
+            for gram in _grams(f.domains_lower) | _grams(f.bio_lower):
+                text_postings[gram].append(row)
+        self.text_postings = {gram: np.array(r, dtype=np.int64) for gram, r in text_postings.items()}
+
+    # ---------- sparse helpers ----------
+
+    def _skill_matvec(self, vocab_weights: np.ndarray) -> np.ndarray:
+        """incidence @ vocab_weights, one value per mentor."""
+        return np.bincount(
+            self.skill_rows,
+            weights=self.skill_counts * vocab_weights[self.skill_cols],
+            minlength=self.size,
+        )
+
+    def _text_contains(self, keyword: str) -> np.ndarray:
+        """Mask of mentors whose domains or bio contain ``keyword``."""
+        mask = np.zeros(self.size, dtype=bool)
+        if len(keyword) <= _GRAM:
+            rows = self.text_postings.get(keyword)
+            if rows is not None:
+                mask[rows] = True
+            return mask
+        rows = None
+        for i in range(len(keyword) - _GRAM + 1):
+            posting = self.text_postings.get(keyword[i:i + _GRAM])
+            if posting is None:
+                return mask
+            rows = posting if rows is None else np.intersect1d(rows, posting, assume_unique=True)
+        for row in rows:
+            f = self.features[row]
+            if keyword in f.domains_lower or keyword in f.bio_lower:
+                mask[row] = True
+        return mask
+
+    # ---------- scoring ----------
+
+    def component_scores(self, intake: IntakeFeatures) -> Dict[str, np.ndarray]:
+        """Each of the six score components for every mentor."""
+        n = self.size
+        vocab = self.skill_vocab
+
+        # 1. Skills (35 max)
+        exact_count = np.zeros(n)
+        partial_count = np.zeros(n)
+        for desired in intake.desired_skills:
+            exact_vec = np.fromiter((skill == desired for skill in vocab), dtype=np.float64, count=len(vocab))
+            related_vec = np.fromiter(
+                (desired in skill or skill in desired for skill in vocab), dtype=np.float64, count=len(vocab)
+            )
+            has_exact = self._skill_matvec(exact_vec) > 0
+            exact_count += has_exact
+            partial_count += np.where(has_exact, 0.0, self._skill_matvec(related_vec))
+        skills = np.minimum(35, exact_count * 12 + partial_count * 6)
+
+        # 2. Domain/industry (25 max)
+        domain = np.zeros(n)
+        if intake.industry_interest:
+            matches = np.zeros(n)
+            for keyword in intake.industry_keywords:
+                matches += self._text_contains(keyword)
+            domain = np.where(matches > 0, np.minimum(25, matches * 10), 0)
+
+        # 3. Experience (20 max)
+        lo, hi = intake.exp_range
+        years = self.years_experience
+        experience = np.where((years >= lo) & (years <= hi), 20, np.where(years > hi, 10, 0))
+
+        # 4. Budget (12 max)
+        lo, hi = intake.budget_range
+        rate = self.hourly_rate
+        budget = np.where((rate >= lo) & (rate <= hi), 12, np.where(rate < lo, 6, 0))
+
+        # 5. Verification (8)
+        verified = np.where(self.is_verified, 8, 0)
+
+        # 6. Goal alignment (10)
+        goal = np.zeros(n)
+        if intake.primary_goal in GOAL_KEYWORDS:
+            goal = np.where(self.goal_flags[:, _GOALS.index(intake.primary_goal)], 10, 0)
+
+        return {
+            "skills": skills,
+            "domain": domain,
+            "experience": experience,
+            "budget": budget,
+            "verified": verified,
+            "goal": goal,
+        }
+
+    def scores(self, intake: IntakeFeatures) -> np.ndarray:
+        total = sum(self.component_scores(intake).values())
+        return np.minimum(100, total).astype(np.int64)
+
+    def top_k(self, intake: IntakeFeatures, k: int, min_score: int = 0) -> List[Tuple[int, List[str], Dict, MentorFeatures]]:
+        """Best ``k`` mentors with score >= min_score, ties in profile id order.
+
+        Returns (score, reasons, metadata, features) like
+        MentorSearchIndex.top_matches.
+        """
+        if k <= 0 or self.size == 0:
+            return []
+        scores = self.scores(intake)
+        eligible = np.flatnonzero(scores >= min_score)
+        if eligible.size == 0:
+            return []
+
+        # Unique sort key: higher score first, then lower row (profile id).
+        key = scores[eligible] * (self.size + 1) + (self.size - eligible)
+        if eligible.size > k:
+            picked = np.argpartition(-key, k - 1)[:k]
+        else:
+            picked = np.arange(eligible.size)
+        picked = picked[np.argsort(-key[picked])]
+
+        results = []
+        for row in eligible[picked]:
+            features = self.features[row]
+            score, reasons, metadata = score_match_features(intake, features)
+            results.append((score, reasons, metadata, features))
+        return results
@@ -0,0 +1,255 @@
+# app/utils/chat_hub.py
+"""
+Real-time chat fan-out.
+
+Each worker keeps a registry of its open chat WebSockets by user id.
+send_message publishes an event addressed to user ids, and the hub's
+pub/sub backend delivers it to every worker's registry:
+
+    InMemoryPubSub   one worker; publish delivers straight to the registry
+    BrokerPubSub     several workers; events go through a small line-based
+                     JSON broker that echoes each one to every connected
+                     worker (the sender included)
+
+Set CHAT_PUBSUB_URL=tcp://host:port to use the broker, and run it with
+
+    python -m app.utils.chat_hub [--host 127.0.0.1] [--port 8765]
+
+It is a local stand-in for a Redis-style pub/sub channel. If the broker is
+unreachable, a worker delivers its own events locally and keeps retrying
+the connection.
+
+publish() is thread-safe, so sync route handlers can call it. Every
+connection has its own event loop and queue. A client that falls more
+than CHAT_WS_QUEUE_SIZE events behind is disconnected and has to resync
+over HTTP.
+"""
+import argparse
+import asyncio
+import json
+import os
+import threading
+from typing import Dict, Iterable, Optional, Set
+from urllib.parse import urlparse
+
+CHAT_PUBSUB_URL = os.getenv("CHAT_PUBSUB_URL", "")
+CHAT_WS_QUEUE_SIZE = int(os.getenv("CHAT_WS_QUEUE_SIZE", "256"))
+CHAT_BROKER_RETRY_SECONDS = float(os.getenv("CHAT_BROKER_RETRY_SECONDS", "2"))
+
+
+class Connection:
+    """One open socket: events are queued on its own loop and sent by its handler."""
+
+    __slots__ = ("user_id", "loop", "queue", "overflowed")
+
+    def __init__(self, user_id: int, loop: asyncio.AbstractEventLoop):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[dict]]" = asyncio.Queue()
+        self.overflowed = False
+
+    def push(self, event: dict) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            pass  # loop already closed; the socket is gone
+
+    def _put(self, event: dict) -> None:
+        if self.overflowed:
+            return
+        if self.queue.qsize() >= CHAT_WS_QUEUE_SIZE:
+            self.overflowed = True
+            self.queue.put_nowait(None)  # tells the handler to close
+            return
+        self.queue.put_nowait(event)
+
+
+# -------------------------
+# Pub/sub backends
+# -------------------------
+class InMemoryPubSub:
+    """Single worker: publish is local delivery."""
+
+    def __init__(self):
+        self._deliver = None
+
+    def attach(self, deliver) -> None:
+        self._deliver = deliver
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def publish(self, message: dict) -> None:
+        self._deliver(message)
+
+
+class BrokerPubSub:
+    """Several workers: events go through the broker (see run_broker)."""
+
+    def __init__(self, host: str, port: int, retry_seconds: float = CHAT_BROKER_RETRY_SECONDS):
+        self.host = host
+        self.port = port
+        self.retry_seconds = retry_seconds
+        self._deliver = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self.connected = asyncio.Event()
+
+    def attach(self, deliver) -> None:
+        self._deliver = deliver
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self.connected = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._close_writer()
+
+    def publish(self, message: dict) -> None:
+        writer, loop = self._writer, self._loop
+        if writer is None or loop is None or loop.is_closed():
+            self._deliver(message)  # broker down: at least reach this worker's sockets
+            return
+        loop.call_soon_threadsafe(writer.write, (json.dumps(message) + "\n").encode())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+            except OSError as exc:
+                print(f"⚠️ Chat broker {self.host}:{self.port} unreachable ({exc}); delivering locally")
+                await asyncio.sleep(self.retry_seconds)
+                continue
+            self._writer = writer
+            self.connected.set()
+            try:
+                while line := await reader.readline():
+                    self._deliver(json.loads(line))
+            except (OSError, ValueError) as exc:
+                print(f"⚠️ Chat broker connection lost: {exc}")
+            finally:
+                self.connected.clear()
+                self._close_writer()
+            await asyncio.sleep(self.retry_seconds)
+
+    def _close_writer(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+
+
+def backend_from_url(url: str = CHAT_PUBSUB_URL):
+    if not url:
+        return InMemoryPubSub()
+    parsed = urlparse(url)
+    if parsed.scheme != "tcp" or not parsed.hostname or not parsed.port:
+        raise ValueError(f"CHAT_PUBSUB_URL must look like tcp://host:port, got {url!r}")
+    return BrokerPubSub(parsed.hostname, parsed.port)
+
+
+# -------------------------
+# Hub
+# -------------------------
+class ChatHub:
+    def __init__(self, backend=None):
+        self.backend = backend or InMemoryPubSub()
+        self.backend.attach(self.deliver)
+        self._lock = threading.Lock()
+        self._connections: Dict[int, Set[Connection]] = {}
+
+    async def start(self) -> None:
+        await self.backend.start()
+
+    async def stop(self) -> None:
+        await self.backend.stop()
+
+    def connect(self, user_id: int) -> Connection:
+        """Register a socket; call from the socket's own event loop."""
+        connection = Connection(user_id, asyncio.get_running_loop())
+        with self._lock:
+            self._connections.setdefault(user_id, set()).add(connection)
+        return connection
+
+    def disconnect(self, connection: Connection) -> None:
+        with self._lock:
+            sockets = self._connections.get(connection.user_id)
+            if sockets is not None:
+                sockets.discard(connection)
+                if not sockets:
+                    del self._connections[connection.user_id]
+
+    def connection_count(self, user_id: Optional[int] = None) -> int:
+        with self._lock:
+            if user_id is not None:
+                return len(self._connections.get(user_id, ()))
+            return sum(len(sockets) for sockets in self._connections.values())
+
+    def publish(self, user_ids: Iterable[int], event: dict) -> None:
+        """Send ``event`` to every socket of ``user_ids``, on any worker."""
+        self.backend.publish({"user_ids": sorted(set(user_ids)), "event": event})
+
+    def deliver(self, message: dict) -> None:
+        """Push a published message to this worker's sockets."""
+        with self._lock:
+            targets = [
+                connection
+                for user_id in message["user_ids"]
+                for connection in self._connections.get(user_id, ())
+            ]
+        for connection in targets:
+            connection.push(message["event"])
+
+
+chat_hub = ChatHub(backend_from_url())
+
+
+# -------------------------
+# Broker
+# -------------------------
+async def run_broker(host: str = "127.0.0.1", port: int = 8765, ready: Optional[asyncio.Future] = None) -> None:
+    """Echo every line from any worker to all workers. ``ready`` gets the bound port."""
+    workers: Set[asyncio.StreamWriter] = set()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        workers.add(writer)
+        try:
+            while line := await reader.readline():
+                for worker in list(workers):
+                    worker.write(line)
+        except OSError:
+            pass
+        finally:
+            workers.discard(writer)
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    if ready is not None:
+        ready.set_result(server.sockets[0].getsockname()[1])
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.utils.chat_hub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+    print(f"✅ Chat broker listening on {args.host}:{args.port}")
+    asyncio.run(run_broker(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
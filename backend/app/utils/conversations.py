@@ -0,0 +1,199 @@
+# app/utils/conversations.py
+"""
+Write-time upkeep of the conversations table (app.models.conversation).
+
+    Booking / Mentorship inserted   open the pair's row with chat_allowed set
+                                    (mapper events, same transaction)
+    message sent                    record_message(): last message, preview,
+                                    and one more unread for the recipient
+    messages read                   mark_read(): advance the reader's
+                                    watermark and reset their unread count
+
+Each change is a single upsert on ux_conversations_pair, so concurrent
+writers cannot create duplicate rows. /chat/conversations then reads only
+this table and the counterparts' names.
+
+chat_allowed() answers the permission check for sends and history from the
+same rows. Eligibility is never revoked (mentorships and bookings are not
+deleted), so allowed pairs are cached per process. Refusals are not cached:
+a booking made a moment ago is seen on the next check, and nothing needs
+invalidating.
+"""
+import os
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, Dict, Tuple
+
+from sqlalchemy import and_, case, event, func, insert, or_, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.booking import Booking
+from app.models.conversation import Conversation
+from app.models.mentorship import Mentorship
+from app.models.message import Message
+from app.utils.ttl_cache import TTLCache
+
+CONVERSATION_PREVIEW_CHARS = int(os.getenv("CONVERSATION_PREVIEW_CHARS", "140"))
+CHAT_PAIR_CACHE_TTL_SECONDS = float(os.getenv("CHAT_PAIR_CACHE_TTL_SECONDS", "600"))
+CHAT_PAIR_CACHE_MAX_ENTRIES = int(os.getenv("CHAT_PAIR_CACHE_MAX_ENTRIES", "50000"))
+
+# (user_low_id, user_high_id) -> True, for pairs known to be chat-eligible
+chat_pair_cache = TTLCache(CHAT_PAIR_CACHE_TTL_SECONDS, CHAT_PAIR_CACHE_MAX_ENTRIES)
+
+
+def pair_key(user_id: int, other_user_id: int) -> Tuple[int, int]:
+    """The pair as stored: (lower id, higher id)."""
+    return (user_id, other_user_id) if user_id <= other_user_id else (other_user_id, user_id)
+
+
+def chat_allowed(db: Session, user_id: int, other_user_id: int) -> bool:
+    """Can these users message each other? No query once a pair is cached."""
+    if user_id == other_user_id:
+        return False
+    key = pair_key(user_id, other_user_id)
+    if chat_pair_cache.get(key):
+        return True
+    allowed = db.query(Conversation.chat_allowed).filter(
+        Conversation.user_low_id == key[0], Conversation.user_high_id == key[1],
+    ).scalar()
+    if allowed:
+        chat_pair_cache.set(key, True)
+    return bool(allowed)
+
+
+def _dialect_insert(conn: Connection):
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert
+    if conn.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert
+    return None
+
+
+def _upsert(conn: Connection, low: int, high: int, values: dict, on_conflict: Callable) -> None:
+    """Insert the pair's row with ``values``, or apply ``on_conflict(new)`` to it.
+
+    ``new`` exposes the attempted values (``excluded`` in ON CONFLICT).
+    """
+    dialect_insert = _dialect_insert(conn)
+    if dialect_insert is not None:
+        stmt = dialect_insert(Conversation).values(user_low_id=low, user_high_id=high, **values)
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=["user_low_id", "user_high_id"], set_=on_conflict(stmt.excluded),
+        ))
+        return
+
+    # No ON CONFLICT support: look the row up first.
+    existing = conn.execute(select(Conversation.id).where(
+        Conversation.user_low_id == low, Conversation.user_high_id == high,
+    )).scalar()
+    if existing is None:
+        conn.execute(insert(Conversation).values(user_low_id=low, user_high_id=high, **values))
+    else:
+        conn.execute(update(Conversation).where(Conversation.id == existing).values(
+            **on_conflict(SimpleNamespace(**values))
+        ))
+
+
+def open_conversation(conn: Connection, user_id: int, other_user_id: int) -> None:
+    """Mark the pair chat-eligible, creating its row if needed."""
+    if user_id == other_user_id:
+        return
+    low, high = pair_key(user_id, other_user_id)
+    _upsert(conn, low, high, {"chat_allowed": True}, lambda new: {
+        "chat_allowed": True,
+        "updated_at": datetime.utcnow(),
+    })
+
+
+def record_message(db: Session, msg: Message) -> None:
+    """Point the pair's row at ``msg`` and count it as unread for the recipient.
+
+    Call after ``msg`` is flushed and before the commit.
+    """
+    low, high = pair_key(msg.sender_id, msg.recipient_id)
+    unread = "unread_low" if msg.recipient_id == low else "unread_high"
+    values = {
+        "chat_allowed": True,
+        "last_message_id": msg.id,
+        "last_message_at": msg.created_at,
+        "last_message_preview": msg.content[:CONVERSATION_PREVIEW_CHARS],
+        unread: 1,
+    }
+
+    def on_conflict(new):
+        # Senders racing on one pair may commit out of order; keep the newest.
+        newer = or_(Conversation.last_message_id.is_(None), Conversation.last_message_id < new.last_message_id)
+        return {
+            "chat_allowed": True,
+            "last_message_id": case((newer, new.last_message_id), else_=Conversation.last_message_id),
+            "last_message_at": case((newer, new.last_message_at), else_=Conversation.last_message_at),
+            "last_message_preview": case((newer, new.last_message_preview), else_=Conversation.last_message_preview),
+            unread: getattr(Conversation, unread) + 1,
+            "updated_at": datetime.utcnow(),
+        }
+
+    _upsert(db.connection(), low, high, values, on_conflict)
+
+
+def side(conversation, user_id: int) -> str:
+    """"low" or "high": which end of the stored pair ``user_id`` is."""
+    return "low" if conversation.user_low_id == user_id else "high"
+
+
+def mark_read(db: Session, user_id: int, marks: Dict[int, int]) -> Dict[int, int]:
+    """Advance ``user_id``'s read watermark per counterpart (no commit).
+
+    ``marks`` maps other user id -> last message id read. Watermarks only
+    move forward and are capped at the conversation's last message. The
+    unread count drops to zero when that message is covered; otherwise it
+    is recounted from the (short) tail after the watermark on
+    ix_messages_pair_id. Returns {other user id: new watermark} for the
+    conversations that moved.
+    """
+    pairs = {other: pair_key(user_id, other) for other in marks if other != user_id}
+    if not pairs:
+        return {}
+    rows = db.execute(select(Conversation).where(
+        or_(*[and_(Conversation.user_low_id == low, Conversation.user_high_id == high) for low, high in pairs.values()]),
+        Conversation.chat_allowed.is_(True),
+    )).scalars().all()
+
+    moved = {}
+    for conversation in rows:
+        me = side(conversation, user_id)
+        other = conversation.user_high_id if me == "low" else conversation.user_low_id
+        up_to = min(marks[other], conversation.last_message_id or 0)
+        read_column = getattr(Conversation, f"read_{me}_message_id")
+        if up_to <= (getattr(conversation, f"read_{me}_message_id") or 0):
+            continue
+        unread_tail = select(func.count(Message.id)).where(
+            Message.pair_low_id == conversation.user_low_id,
+            Message.pair_high_id == conversation.user_high_id,
+            Message.id > up_to,
+            Message.recipient_id == user_id,
+        ).scalar_subquery()
+        result = db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation.id, or_(read_column.is_(None), read_column < up_to))
+            .values({
+                read_column: up_to,
+                getattr(Conversation, f"unread_{me}"): case(
+                    (Conversation.last_message_id <= up_to, 0), else_=unread_tail,
+                ),
+            })
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            moved[other] = up_to
+    return moved
+
+
+# Every new booking or mentorship opens the pair's conversation, whichever
+# code path inserts it (routes, seed scripts, tests).
+@event.listens_for(Booking, "after_insert")
+@event.listens_for(Mentorship, "after_insert")
+def _open_conversation_for_pair(mapper, connection, target):
+    open_conversation(connection, target.mentor_id, target.mentee_id)
@@ -4,7 +4,7 @@ import secrets
 from datetime import datetime, timedelta
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import aiosmtplib
+from functools import lru_cache
 from typing import Optional
 
 def _env(name: str, default: str = "") -> str:
@@ -42,16 +42,19 @@ def _get_email_config() -> dict:
     }
 
 
-# Debug: Log email configuration on startup (do not log passwords)
-_cfg = _get_email_config()
-print(
-    "📧 Email Config: "
-    f"HOST={_cfg['SMTP_HOST']}, PORT={_cfg['SMTP_PORT']}, "
-    f"USER={'set' if bool(_cfg['SMTP_USER']) else 'missing'}, "
-    f"PASS={'set' if bool(_cfg['SMTP_PASSWORD']) else 'missing'}, "
-    f"FROM={_cfg['FROM_EMAIL']}, "
-    f"STARTTLS={_cfg['SMTP_STARTTLS']}, TLS={_cfg['SMTP_USE_TLS']}, ENABLED={_cfg['EMAIL_ENABLED']}"
-)
+# Debug: Log email configuration once, on first send (do not log passwords).
+# Kept out of import time so cold starts don't pay for it.
+@lru_cache(maxsize=None)
+def _log_email_config() -> None:
+    _cfg = _get_email_config()
+    print(
+        "📧 Email Config: "
+        f"HOST={_cfg['SMTP_HOST']}, PORT={_cfg['SMTP_PORT']}, "
+        f"USER={'set' if bool(_cfg['SMTP_USER']) else 'missing'}, "
+        f"PASS={'set' if bool(_cfg['SMTP_PASSWORD']) else 'missing'}, "
+        f"FROM={_cfg['FROM_EMAIL']}, "
+        f"STARTTLS={_cfg['SMTP_STARTTLS']}, TLS={_cfg['SMTP_USE_TLS']}, ENABLED={_cfg['EMAIL_ENABLED']}"
+    )
 
 
 def generate_reset_token() -> str:
@@ -74,6 +77,7 @@ async def send_email(to_email: str, subject: str, html_content: str, text_conten
         html_content: HTML version of email body
         text_content: Plain text version (optional, will use HTML if not provided)
     """
+    _log_email_config()
     cfg = _get_email_config()
     if not cfg["EMAIL_ENABLED"]:
         print(f"⚠️ Email disabled (EMAIL_ENABLED=false). Would have sent to {to_email}: {subject}")
@@ -99,6 +103,8 @@ async def send_email(to_email: str, subject: str, html_content: str, text_conten
     message.attach(html_part)
     
     try:
+        import aiosmtplib  # deferred: only needed once an email is actually sent
+
         await aiosmtplib.send(
             message,
             hostname=cfg["SMTP_HOST"],
@@ -0,0 +1,101 @@
+# app/utils/hashing_executor.py
+"""
+Bounded worker pool for password hashing.
+
+bcrypt is deliberately slow (~250ms per hash at the default cost). Called
+inline from an ``async def`` handler it blocks the event loop; called from a
+sync handler it ties up one of the threadpool slots FastAPI also uses for
+every other sync endpoint. Routes await hashing through this executor
+instead:
+
+    AUTH_HASH_EXECUTOR    "thread" (default; bcrypt releases the GIL) or "process"
+    AUTH_HASH_WORKERS     concurrent hashes (default: min(4, CPU count))
+    AUTH_HASH_MAX_QUEUE   waiting jobs before new ones are rejected with 503
+                          (default 64; 0 = unbounded)
+
+metrics() reports in-flight and queued jobs, the deepest queue seen, and
+completed/rejected counts.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+
+AUTH_HASH_EXECUTOR = os.getenv("AUTH_HASH_EXECUTOR", "thread").lower()
+AUTH_HASH_WORKERS = int(os.getenv("AUTH_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+AUTH_HASH_MAX_QUEUE = int(os.getenv("AUTH_HASH_MAX_QUEUE", "64"))
+
+
+class HashingExecutor:
+    def __init__(self, workers: int = AUTH_HASH_WORKERS, max_queue: int = AUTH_HASH_MAX_QUEUE,
+                 kind: str = AUTH_HASH_EXECUTOR):
+        self.workers = max(1, workers)
+        self.max_queue = max_queue
+        self.kind = kind
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0  # submitted and not finished (running + queued)
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _executor(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                if self.kind == "process":
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="auth-hash")
+            return self._pool
+
+    def _admit(self) -> None:
+        with self._lock:
+            queued = max(0, self._pending - self.workers)
+            if self.max_queue and queued >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many authentication requests, please retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+            self.max_queue_depth = max(self.max_queue_depth, max(0, self._pending - self.workers))
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
+
+    async def run(self, fn: Callable, *args):
+        """Run ``fn(*args)`` on the pool and await its result."""
+        self._admit()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor(), fn, *args)
+        finally:
+            self._release()
+
+    def metrics(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "executor": self.kind,
+                "workers": self.workers,
+                "in_flight": min(self._pending, self.workers),
+                "queued": max(0, self._pending - self.workers),
+                "max_queue": self.max_queue,
+                "max_queue_depth": self.max_queue_depth,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+hashing_executor = HashingExecutor()
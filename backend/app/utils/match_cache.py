@@ -0,0 +1,193 @@
+# app/utils/match_cache.py
+"""
+Cache of AI mentor match results.
+
+An entry holds a mentee's top matches and is valid for one intake version
+(the intake fields the scorer reads) and one mentor catalog version
+(MentorSearchIndex.version). Changes are applied incrementally:
+
+    intake saved        drop that mentee's entry
+    mentor upserted     re-score only that mentor against each cached intake;
+                        drop entries where it was or now could be in the top
+                        results, move the rest to the new catalog version
+    mentor removed      drop entries that listed that mentor
+    index rebuilt       version jumps, so every entry misses once
+
+save_matches() persists a result list to mentor_matches with one bulk
+upsert on (mentee_id, mentor_id).
+"""
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.mentee_intake import MentorMatch
+from app.utils.ai_agent import IntakeFeatures, MentorFeatures, score_match_features
+from app.utils.mentor_index import mentor_index
+
+MATCH_CACHE_MAX_ENTRIES = int(os.getenv("MATCH_CACHE_MAX_ENTRIES", "10000"))
+
+# (score, reasons, metadata, features), as returned by top_matches
+Match = Tuple[int, List[str], Dict, MentorFeatures]
+
+
+def intake_version(intake) -> tuple:
+    """The intake fields that affect matching; equal tuples score identically."""
+    return (
+        intake.desired_skills,
+        intake.industry_interest,
+        intake.career_stage,
+        intake.budget_range,
+        intake.primary_goal,
+    )
+
+
+class _Entry:
+    __slots__ = ("intake_version", "intake", "catalog_version", "results")
+
+    def __init__(self, intake_version: tuple, intake: IntakeFeatures, catalog_version: int):
+        self.intake_version = intake_version
+        self.intake = intake
+        self.catalog_version = catalog_version
+        # (limit, min_score) -> matches
+        self.results: Dict[Tuple[int, int], List[Match]] = {}
+
+
+def _affected(matches: List[Match], limit: int, min_score: int, intake: IntakeFeatures,
+              user_id: int, features: Optional[MentorFeatures]) -> bool:
+    """Could this mentor change ``matches``? Ties count as a change."""
+    if any(match[3].user_id == user_id for match in matches):
+        return True
+    if features is None:
+        return False
+    score, _, _ = score_match_features(intake, features)
+    if score < min_score:
+        return False
+    return len(matches) < limit or score >= matches[-1][0]
+
+
+class MatchCache:
+    def __init__(self, max_entries: int = MATCH_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+
+    def get(self, mentee_id: int, version: tuple, catalog_version: int,
+            limit: int, min_score: int) -> Optional[List[Match]]:
+        with self._lock:
+            entry = self._entries.get(mentee_id)
+            if entry is None or entry.intake_version != version or entry.catalog_version != catalog_version:
+                return None
+            matches = entry.results.get((limit, min_score))
+            if matches is not None:
+                self._entries.move_to_end(mentee_id)
+            return matches
+
+    def put(self, mentee_id: int, version: tuple, intake: IntakeFeatures, catalog_version: int,
+            limit: int, min_score: int, matches: List[Match]) -> None:
+        with self._lock:
+            entry = self._entries.get(mentee_id)
+            if entry is None or entry.intake_version != version or entry.catalog_version != catalog_version:
+                entry = _Entry(version, intake, catalog_version)
+                self._entries[mentee_id] = entry
+            entry.results[(limit, min_score)] = list(matches)
+            self._entries.move_to_end(mentee_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_mentee(self, mentee_id: int) -> None:
+        with self._lock:
+            self._entries.pop(mentee_id, None)
+
+    def mentor_changed(self, user_id: int, features: Optional[MentorFeatures],
+                       previous_version: int, version: int) -> None:
+        """MentorSearchIndex listener; see the module docstring."""
+        with self._lock:
+            for mentee_id in list(self._entries):
+                entry = self._entries[mentee_id]
+                if entry.catalog_version != previous_version:
+                    del self._entries[mentee_id]
+                    continue
+                for key in list(entry.results):
+                    limit, min_score = key
+                    if _affected(entry.results[key], limit, min_score, entry.intake, user_id, features):
+                        del entry.results[key]
+                if entry.results:
+                    entry.catalog_version = version
+                else:
+                    del self._entries[mentee_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+match_cache = MatchCache()
+mentor_index.add_listener(match_cache.mentor_changed)
+
+
+def _dialect_insert(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+
+def save_matches(db: Session, mentee_id: int, matches: List[Match]) -> None:
+    """Upsert mentor_matches rows for ``matches`` in one statement (no commit).
+
+    Existing rows keep their id, created_at and viewed/contacted flags; only
+    the score, reasons and metadata are refreshed.
+    """
+    if not matches:
+        return
+    rows = [
+        {
+            "mentee_id": mentee_id,
+            "mentor_id": features.user_id,
+            "match_score": score,
+            "match_reasons": reasons,
+            "match_metadata": metadata,
+            "is_viewed": False,
+            "is_contacted": False,
+            "created_at": datetime.utcnow(),
+        }
+        for score, reasons, metadata, features in matches
+    ]
+
+    insert = _dialect_insert(db)
+    if insert is None:
+        # No ON CONFLICT support: fall back to one lookup per row.
+        for row in rows:
+            existing = db.query(MentorMatch).filter(
+                MentorMatch.mentee_id == mentee_id,
+                MentorMatch.mentor_id == row["mentor_id"],
+            ).first()
+            if existing:
+                existing.match_score = row["match_score"]
+                existing.match_reasons = row["match_reasons"]
+                existing.match_metadata = row["match_metadata"]
+            else:
+                db.add(MentorMatch(**row))
+        return
+
+    stmt = insert(MentorMatch).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["mentee_id", "mentor_id"],
+        set_={
+            "match_score": stmt.excluded.match_score,
+            "match_reasons": stmt.excluded.match_reasons,
+            "match_metadata": stmt.excluded.match_metadata,
+        },
+    )
+    db.execute(stmt)
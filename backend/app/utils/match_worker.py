@@ -0,0 +1,366 @@
+# app/utils/match_worker.py
+"""
+Background re-matching.
+
+Intake and mentor profile changes enqueue rows in match_jobs. MatchWorker
+threads claim them and rewrite the affected mentees' MentorMatch rows to
+their top MATCH_PRECOMPUTE_LIMIT mentors (min score 0), so /ai-agent/matches
+can serve those rows with one bounded query (see precomputed_matches)
+instead of scoring the catalog inside the request.
+
+    mentee job   rescore one mentee and replace their MentorMatch rows
+    mentor job   score the changed mentor against every intake and enqueue
+                 mentee jobs for those whose stored top list it is in or
+                 could now enter
+
+Jobs are claimed with a conditional UPDATE, so several processes can share
+the table. Failures are retried with exponential backoff up to
+MATCH_JOB_MAX_ATTEMPTS. A job left "running" by a dead process is claimed
+again after MATCH_JOB_LEASE_SECONDS. shutdown() stops claiming and waits
+for running jobs to finish.
+
+Finished jobs are deleted once older than MATCH_JOB_RETENTION_SECONDS,
+except the latest job per target, which /ai-agent/matches and
+/ai-agent/matches/status read.
+"""
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, exists, func, or_
+from sqlalchemy.orm import Session, aliased
+
+from app.database import SessionLocal
+from app.models.mentee_intake import MatchJob, MenteeIntake, MentorMatch
+from app.models.profile import MentorProfile
+from app.utils.ai_agent import IntakeFeatures, MentorFeatures, score_match_features
+from app.utils.match_cache import save_matches
+from app.utils.mentor_index import mentor_index
+
+MATCH_WORKER_ENABLED = os.getenv("MATCH_WORKER_ENABLED", "true").lower() == "true"
+MATCH_WORKER_THREADS = int(os.getenv("MATCH_WORKER_THREADS", "2"))
+MATCH_WORKER_POLL_SECONDS = float(os.getenv("MATCH_WORKER_POLL_SECONDS", "5"))
+MATCH_WORKER_DRAIN_SECONDS = float(os.getenv("MATCH_WORKER_DRAIN_SECONDS", "30"))
+MATCH_JOB_MAX_ATTEMPTS = int(os.getenv("MATCH_JOB_MAX_ATTEMPTS", "3"))
+MATCH_JOB_RETRY_SECONDS = float(os.getenv("MATCH_JOB_RETRY_SECONDS", "10"))
+MATCH_JOB_LEASE_SECONDS = float(os.getenv("MATCH_JOB_LEASE_SECONDS", "300"))
+MATCH_JOB_RETENTION_SECONDS = float(os.getenv("MATCH_JOB_RETENTION_SECONDS", str(7 * 24 * 3600)))
+MATCH_JOB_PRUNE_INTERVAL_SECONDS = float(os.getenv("MATCH_JOB_PRUNE_INTERVAL_SECONDS", "3600"))
+MATCH_PRECOMPUTE_LIMIT = int(os.getenv("MATCH_PRECOMPUTE_LIMIT", "20"))
+
+ACTIVE_JOB_STATUSES = ("pending", "running")
+FINISHED_JOB_STATUSES = ("done", "failed")
+
+
+# ---------- enqueueing ----------
+
+def _enqueue(db: Session, kind: str, target_ids: Iterable[int]) -> int:
+    target_ids = set(target_ids)
+    if not target_ids:
+        return 0
+    # A pending job has not read anything yet, so it will see this change too.
+    queued = {
+        target for (target,) in db.query(MatchJob.target_id).filter(
+            MatchJob.kind == kind,
+            MatchJob.status == "pending",
+            MatchJob.target_id.in_(target_ids),
+        )
+    }
+    new_ids = sorted(target_ids - queued)
+    db.add_all([MatchJob(kind=kind, target_id=target) for target in new_ids])
+    return len(new_ids)
+
+
+def enqueue_match_job(db: Session, kind: str, target_id: int) -> None:
+    """Queue a rematch after an intake ("mentee") or profile ("mentor") change."""
+    _enqueue(db, kind, [target_id])
+    db.commit()
+    match_worker.notify()
+
+
+# ---------- job handlers ----------
+
+def rematch_mentee(db: Session, mentee_id: int) -> None:
+    intake = db.query(MenteeIntake).filter(MenteeIntake.user_id == mentee_id).first()
+    stale = db.query(MentorMatch).filter(MentorMatch.mentee_id == mentee_id)
+    if intake is None:
+        stale.delete(synchronize_session=False)
+        return
+
+    index = mentor_index.ensure_fresh(db)
+    top = index.top_matches(IntakeFeatures(intake), MATCH_PRECOMPUTE_LIMIT, 0)
+    save_matches(db, mentee_id, top)
+    keep = [features.user_id for _, _, _, features in top]
+    if keep:
+        stale = stale.filter(MentorMatch.mentor_id.notin_(keep))
+    stale.delete(synchronize_session=False)
+
+
+def _mentor_change_affects(intake: MenteeIntake, features: Optional[MentorFeatures], holds: bool,
+                           count: int, lowest: Optional[int]) -> bool:
+    """Could a change to this mentor alter the mentee's stored top list?
+
+    ``holds``: the mentor is in the list; ``count`` / ``lowest``: the list's
+    size and lowest score. ``features`` is None for a removed profile.
+    """
+    if holds:
+        return True
+    if features is None:
+        return False
+    if count < MATCH_PRECOMPUTE_LIMIT:
+        return True
+    score, _, _ = score_match_features(IntakeFeatures(intake), features)
+    return score >= lowest
+
+
+def fan_out_mentor(db: Session, mentor_id: int) -> None:
+    profile = db.query(MentorProfile).filter(MentorProfile.user_id == mentor_id).first()
+    features = MentorFeatures(profile) if profile else None
+
+    holders = {
+        mentee for (mentee,) in db.query(MentorMatch.mentee_id).filter(MentorMatch.mentor_id == mentor_id)
+    }
+    stored: Dict[int, Tuple[int, Optional[int]]] = {
+        mentee: (count, lowest)
+        for mentee, count, lowest in db.query(
+            MentorMatch.mentee_id, func.count(MentorMatch.id), func.min(MentorMatch.match_score)
+        ).group_by(MentorMatch.mentee_id)
+    }
+
+    affected: List[int] = []
+    for intake in db.query(MenteeIntake):
+        mentee = intake.user_id
+        count, lowest = stored.get(mentee, (0, None))
+        if _mentor_change_affects(intake, features, mentee in holders, count, lowest):
+            affected.append(mentee)
+
+    if _enqueue(db, "mentee", affected):
+        match_worker.notify()
+
+
+JOB_HANDLERS: Dict[str, Callable[[Session, int], None]] = {
+    "mentee": rematch_mentee,
+    "mentor": fan_out_mentor,
+}
+
+
+# ---------- serving ----------
+
+def _pending_mentor_change_affects(db: Session, intake: MenteeIntake) -> bool:
+    """Is a queued mentor fan-out one that would rematch this mentee?"""
+    pending = {
+        target for (target,) in db.query(MatchJob.target_id).filter(
+            MatchJob.kind == "mentor",
+            MatchJob.status.in_(ACTIVE_JOB_STATUSES),
+        )
+    }
+    if not pending:
+        return False
+    stored = dict(db.query(MentorMatch.mentor_id, MentorMatch.match_score).filter(
+        MentorMatch.mentee_id == intake.user_id
+    ).all())
+    lowest = min((score for score in stored.values() if score is not None), default=None)
+    profiles = {
+        profile.user_id: profile
+        for profile in db.query(MentorProfile).filter(MentorProfile.user_id.in_(pending))
+    }
+    return any(
+        _mentor_change_affects(
+            intake, MentorFeatures(profiles[mentor]) if mentor in profiles else None,
+            mentor in stored, len(stored), lowest,
+        )
+        for mentor in pending
+    )
+
+
+def precomputed_matches(db: Session, intake: MenteeIntake, limit: int, min_score: int) -> Optional[List[Tuple[MentorMatch, MentorProfile]]]:
+    """Stored matches for the mentee, or None if they may be out of date.
+
+    Rows are current when the mentee's latest job finished and no queued
+    mentor fan-out would rematch them (same rule as fan_out_mentor).
+    """
+    if limit > MATCH_PRECOMPUTE_LIMIT:
+        return None
+    mentee_id = intake.user_id
+    latest = db.query(MatchJob.status).filter(
+        MatchJob.kind == "mentee",
+        MatchJob.target_id == mentee_id,
+    ).order_by(MatchJob.id.desc()).first()
+    if latest is None or latest.status != "done":
+        return None
+    if _pending_mentor_change_affects(db, intake):
+        return None
+
+    return (
+        db.query(MentorMatch, MentorProfile)
+        .join(MentorProfile, MentorProfile.user_id == MentorMatch.mentor_id)
+        .filter(MentorMatch.mentee_id == mentee_id, MentorMatch.match_score >= min_score)
+        .order_by(MentorMatch.match_score.desc(), MentorProfile.id.asc())
+        .limit(limit)
+        .all()
+    )
+
+
+# ---------- retention ----------
+
+def prune_finished_jobs(db: Session, retention_seconds: float = MATCH_JOB_RETENTION_SECONDS) -> int:
+    """Delete done/failed jobs older than the retention window; returns the count.
+
+    The latest job per (kind, target) is kept whatever its age.
+    """
+    newer = aliased(MatchJob)
+    superseded = exists().where(
+        newer.kind == MatchJob.kind,
+        newer.target_id == MatchJob.target_id,
+        newer.id > MatchJob.id,
+    )
+    cutoff = datetime.utcnow() - timedelta(seconds=retention_seconds)
+    deleted = db.query(MatchJob).filter(
+        MatchJob.status.in_(FINISHED_JOB_STATUSES),
+        MatchJob.created_at < cutoff,
+        superseded,
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+# ---------- worker ----------
+
+class MatchWorker:
+    def __init__(self, threads: int = MATCH_WORKER_THREADS, poll_seconds: float = MATCH_WORKER_POLL_SECONDS,
+                 session_factory: Callable[[], Session] = SessionLocal):
+        self.thread_count = threads
+        self.poll_seconds = poll_seconds
+        self.session_factory = session_factory
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._prune_lock = threading.Lock()
+        self._last_prune: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping.clear()
+        self._threads = [
+            threading.Thread(target=self._loop, name=f"match-worker-{i}", daemon=True)
+            for i in range(self.thread_count)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def shutdown(self, timeout: float = MATCH_WORKER_DRAIN_SECONDS) -> bool:
+        """Stop claiming jobs and wait for running ones; True if all finished."""
+        self._stopping.set()
+        self._wake.set()
+        deadline = datetime.utcnow() + timedelta(seconds=timeout)
+        for thread in self._threads:
+            thread.join(max(0.0, (deadline - datetime.utcnow()).total_seconds()))
+        drained = not self.running
+        if not drained:
+            print("⚠️ Match worker shutdown timed out; unfinished jobs will be retried after their lease")
+        self._threads = []
+        return drained
+
+    def _loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                worked = self.run_once()
+            except Exception as e:
+                print(f"Match worker error: {str(e)}")
+                worked = False
+            if not worked:
+                self._maybe_prune()
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+
+    def _maybe_prune(self) -> None:
+        """Run prune_finished_jobs when idle, at most every MATCH_JOB_PRUNE_INTERVAL_SECONDS."""
+        with self._prune_lock:
+            now = time.monotonic()
+            if self._last_prune is not None and now - self._last_prune < MATCH_JOB_PRUNE_INTERVAL_SECONDS:
+                return
+            self._last_prune = now
+        db = self.session_factory()
+        try:
+            pruned = prune_finished_jobs(db)
+            if pruned:
+                print(f"✅ Pruned {pruned} finished match jobs")
+        except Exception as e:
+            db.rollback()
+            print(f"Match job pruning failed: {str(e)}")
+        finally:
+            db.close()
+
+    def run_pending(self) -> int:
+        """Run ready jobs in the calling thread until none are left."""
+        processed = 0
+        while self.run_once():
+            processed += 1
+        return processed
+
+    def run_once(self) -> bool:
+        db = self.session_factory()
+        try:
+            job_id = self._claim(db)
+            if job_id is None:
+                return False
+            self._execute(db, job_id)
+            return True
+        finally:
+            db.close()
+
+    def _claimable(self, now: datetime):
+        lease_cutoff = now - timedelta(seconds=MATCH_JOB_LEASE_SECONDS)
+        return or_(
+            and_(MatchJob.status == "pending", MatchJob.run_after <= now),
+            and_(MatchJob.status == "running", MatchJob.locked_at < lease_cutoff),
+        )
+
+    def _claim(self, db: Session) -> Optional[int]:
+        now = datetime.utcnow()
+        ready = db.query(MatchJob.id).filter(self._claimable(now)).order_by(
+            MatchJob.run_after, MatchJob.id
+        ).limit(self.thread_count + 1).all()
+        for (job_id,) in ready:
+            claimed = db.query(MatchJob).filter(MatchJob.id == job_id, self._claimable(now)).update(
+                {"status": "running", "locked_at": now, "attempts": MatchJob.attempts + 1},
+                synchronize_session=False,
+            )
+            db.commit()
+            if claimed:
+                return job_id
+        return None
+
+    def _execute(self, db: Session, job_id: int) -> None:
+        job = db.get(MatchJob, job_id)
+        try:
+            JOB_HANDLERS[job.kind](db, job.target_id)
+            job.status = "done"
+            job.last_error = None
+        except Exception as e:
+            db.rollback()
+            job = db.get(MatchJob, job_id)
+            job.last_error = f"{type(e).__name__}: {e}"[:1000]
+            if job.attempts >= MATCH_JOB_MAX_ATTEMPTS:
+                job.status = "failed"
+            else:
+                job.status = "pending"
+                job.run_after = datetime.utcnow() + timedelta(
+                    seconds=MATCH_JOB_RETRY_SECONDS * 2 ** (job.attempts - 1)
+                )
+            print(f"Match job {job.id} ({job.kind} {job.target_id}) failed: {str(e)}")
+        job.locked_at = None
+        db.commit()
+
+
+match_worker = MatchWorker()
@@ -0,0 +1,261 @@
+# app/utils/mentor_index.py
+"""
+In-process mentor search index for the AI matcher.
+
+Keeps a MentorFeatures snapshot per mentor (skills pre-split, text
+lowercased, goal keywords pre-matched) plus postings that answer "which
+mentors can score any skill or domain points for this intake?" without
+touching the rest of the catalog:
+
+    skill_postings   normalized skill -> mentor user ids
+    skill_grams      1-3 character substrings -> skills containing them
+    text_grams       1-3 character substrings -> mentors whose domains/bio contain them
+
+Substring postings are needed because the scorer awards partial skill
+matches (``desired in mentor_skill`` and vice versa) and matches industry
+keywords anywhere in the domains/bio text.
+
+When the candidates alone cannot decide the top results (few or weak
+skill/domain matches), large catalogs fall back to the vectorized
+MentorTable in app.utils.batch_scorer instead of a Python loop.
+
+The index is refreshed write-through from the profile routes and rebuilt
+from the database when it is older than MENTOR_INDEX_TTL_SECONDS, which
+bounds staleness when other workers write profiles.
+"""
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.profile import MentorProfile
+from app.utils.ai_agent import (
+    NON_TEXT_SCORE_MAX,
+    IntakeFeatures,
+    MentorFeatures,
+    score_match_features,
+)
+
+if TYPE_CHECKING:  # NumPy-backed; imported on first batch scoring, not at startup
+    from app.utils.batch_scorer import MentorTable
+
+MENTOR_INDEX_TTL_SECONDS = float(os.getenv("MENTOR_INDEX_TTL_SECONDS", "300"))
+# Below this many non-candidate mentors the scalar loop beats building arrays.
+BATCH_SCORING_MIN_MENTORS = int(os.getenv("BATCH_SCORING_MIN_MENTORS", "2000"))
+
+_GRAM = 3
+
+
+def _grams(text: str) -> Set[str]:
+    """All substrings of length 1.._GRAM."""
+    return {text[i:i + n] for n in range(1, _GRAM + 1) for i in range(len(text) - n + 1)}
+
+
+def _lookup_grams(postings: Dict[str, set], needle: str) -> set:
+    """Keys whose text may contain ``needle`` (exact when len(needle) <= _GRAM)."""
+    if len(needle) <= _GRAM:
+        return set(postings.get(needle, ()))
+    sets = [postings.get(needle[i:i + _GRAM]) for i in range(len(needle) - _GRAM + 1)]
+    if any(not s for s in sets):
+        return set()
+    sets.sort(key=len)
+    return set(sets[0]).intersection(*sets[1:])
+
+
+class MentorSearchIndex:
+    def __init__(self, ttl_seconds: float = MENTOR_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        self._reset()
+        self.loaded_at: Optional[float] = None
+        # Bumped on every change; lets callers cache results per catalog state.
+        self.version = 0
+        self._table: Optional["MentorTable"] = None
+        self._table_version = -1
+        self._listeners: List[Callable[[int, Optional[MentorFeatures], int, int], None]] = []
+
+    def _reset(self) -> None:
+        self.features: Dict[int, MentorFeatures] = {}
+        self.skill_postings: Dict[str, Set[int]] = defaultdict(set)
+        self.skill_grams: Dict[str, Set[str]] = defaultdict(set)
+        self.text_grams: Dict[str, Set[int]] = defaultdict(set)
+
+    # ---------- maintenance ----------
+
+    def _add(self, features: MentorFeatures) -> None:
+        uid = features.user_id
+        self.features[uid] = features
+        for skill in set(features.skills_list):
+            if not self.skill_postings.get(skill):
+                for gram in _grams(skill):
+                    self.skill_grams[gram].add(skill)
+            self.skill_postings[skill].add(uid)
+        for gram in _grams(features.domains_lower) | _grams(features.bio_lower):
+            self.text_grams[gram].add(uid)
+
+    def _discard(self, uid: int) -> None:
+        features = self.features.pop(uid, None)
+        if features is None:
+            return
+        for skill in set(features.skills_list):
+            holders = self.skill_postings.get(skill)
+            if holders is None:
+                continue
+            holders.discard(uid)
+            if not holders:
+                del self.skill_postings[skill]
+                for gram in _grams(skill):
+                    self.skill_grams[gram].discard(skill)
+                    if not self.skill_grams[gram]:
+                        del self.skill_grams[gram]
+        for gram in _grams(features.domains_lower) | _grams(features.bio_lower):
+            holders = self.text_grams.get(gram)
+            if holders is not None:
+                holders.discard(uid)
+                if not holders:
+                    del self.text_grams[gram]
+
+    def rebuild(self, profiles: Iterable[MentorProfile]) -> None:
+        with self._lock:
+            self._reset()
+            for profile in profiles:
+                if profile.user_id is not None:
+                    self._add(MentorFeatures(profile))
+            self.loaded_at = time.monotonic()
+            self.version += 1
+
+    def add_listener(self, listener: Callable[[int, Optional[MentorFeatures], int, int], None]) -> None:
+        """Call ``listener(user_id, features, previous_version, version)`` on
+        every single-mentor change; ``features`` is None for a removal.
+
+        Full rebuilds are not reported: they bump the version, which callers
+        keyed on it treat as a new catalog.
+        """
+        self._listeners.append(listener)
+
+    def _changed(self, user_id: int, features: Optional[MentorFeatures]) -> None:
+        previous = self.version
+        self.version += 1
+        for listener in self._listeners:
+            listener(user_id, features, previous, self.version)
+
+    def upsert(self, profile: MentorProfile) -> None:
+        """Refresh one mentor after its profile was created or updated."""
+        with self._lock:
+            if self.loaded_at is None:
+                return  # built lazily on first use
+            self._discard(profile.user_id)
+            features = MentorFeatures(profile)
+            self._add(features)
+            self._changed(profile.user_id, features)
+
+    def remove(self, user_id: int) -> None:
+        with self._lock:
+            if self.loaded_at is None:
+                return
+            self._discard(user_id)
+            self._changed(user_id, None)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.loaded_at = None
+
+    def ensure_fresh(self, db: Session) -> "MentorSearchIndex":
+        with self._lock:
+            stale = self.loaded_at is None or time.monotonic() - self.loaded_at > self.ttl_seconds
+            if stale:
+                self.rebuild(db.query(MentorProfile).all())
+        return self
+
+    # ---------- queries ----------
+
+    def _skill_candidates(self, desired_skills: List[str]) -> Set[int]:
+        matched_skills: Set[str] = set()
+        for desired in desired_skills:
+            # exact match and mentor_skill in desired
+            for n in range(len(desired) + 1):
+                for i in range(len(desired) - n + 1):
+                    part = desired[i:i + n]
+                    if part in self.skill_postings:
+                        matched_skills.add(part)
+            # desired in mentor_skill
+            for skill in _lookup_grams(self.skill_grams, desired):
+                if desired in skill:
+                    matched_skills.add(skill)
+        result: Set[int] = set()
+        for skill in matched_skills:
+            result |= self.skill_postings[skill]
+        return result
+
+    def _domain_candidates(self, keywords: List[str]) -> Set[int]:
+        result: Set[int] = set()
+        for keyword in keywords:
+            for uid in _lookup_grams(self.text_grams, keyword):
+                features = self.features[uid]
+                if keyword in features.domains_lower or keyword in features.bio_lower:
+                    result.add(uid)
+        return result
+
+    def candidates(self, intake: IntakeFeatures) -> Set[int]:
+        """Mentors that can earn skill or domain points for this intake."""
+        with self._lock:
+            if "" in intake.desired_skills:
+                # An empty desired entry is a substring of every mentor skill.
+                return set(self.features)
+            result = self._skill_candidates(intake.desired_skills)
+            if intake.industry_interest:
+                result |= self._domain_candidates(intake.industry_keywords)
+            return result
+
+    def top_matches(self, intake: IntakeFeatures, limit: int, min_score: int) -> List[Tuple[int, List[str], Dict, MentorFeatures]]:
+        """Best ``limit`` mentors scoring at least ``min_score``.
+
+        Only text candidates are fully scored. Other mentors are scored (on
+        pre-computed numeric features) only when they could still reach the
+        top ``limit``, i.e. when fewer than ``limit`` candidates beat
+        NON_TEXT_SCORE_MAX. Ties keep catalog (profile id) order, matching
+        a full scan.
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            candidate_ids = self.candidates(intake)
+            scored = []
+            for uid in candidate_ids:
+                features = self.features[uid]
+                score, reasons, metadata = score_match_features(intake, features)
+                if score >= min_score:
+                    scored.append((score, reasons, metadata, features))
+            scored.sort(key=lambda m: (-m[0], m[3].id))
+
+            needs_rest = NON_TEXT_SCORE_MAX >= min_score and (
+                len(scored) < limit or scored[limit - 1][0] <= NON_TEXT_SCORE_MAX
+            )
+            if needs_rest:
+                if len(self.features) - len(candidate_ids) >= BATCH_SCORING_MIN_MENTORS:
+                    return self.table().top_k(intake, limit, min_score)
+                for uid, features in self.features.items():
+                    if uid in candidate_ids:
+                        continue
+                    score, reasons, metadata = score_match_features(intake, features, text_overlap=False)
+                    if score >= min_score:
+                        scored.append((score, reasons, metadata, features))
+                scored.sort(key=lambda m: (-m[0], m[3].id))
+
+            return scored[:limit]
+
+    def table(self) -> "MentorTable":
+        """Columnar copy of the catalog for batch scoring, rebuilt per version."""
+        from app.utils.batch_scorer import MentorTable
+
+        with self._lock:
+            if self._table is None or self._table_version != self.version:
+                self._table = MentorTable(list(self.features.values()))
+                self._table_version = self.version
+            return self._table
+
+
+mentor_index = MentorSearchIndex()
@@ -0,0 +1,161 @@
+# app/utils/pagination.py
+"""
+Keyset (cursor) pagination shared by the list endpoints.
+
+List routes keep returning a plain JSON list so existing clients continue to
+work, but every response is one page of at most ``limit`` rows (default
+DEFAULT_PAGE_SIZE). Paging metadata travels in response headers:
+
+    X-Next-Cursor: opaque cursor for the next page (absent on the last page)
+    X-Has-More:    "true" / "false"
+
+A cursor encodes the sort key of the last row on the page, e.g.
+``(created_at, id)`` or ``(session_date, start_time, id)``. The next page is
+fetched with a range predicate on those columns, so each page is one bounded
+index scan no matter how much history precedes it.
+
+Nullable sort columns (e.g. ``created_at`` on older rows) are ordered with
+NULL as the lowest value on every dialect, and the cursor predicate treats
+NULL the same way, so such rows are neither skipped nor repeated.
+"""
+import base64
+import json
+from datetime import date, datetime, time
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import Select, and_, false, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query as SAQuery
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+HAS_MORE_HEADER = "X-Has-More"
+SYNC_TOKEN_HEADER = "X-Sync-Token"  # chat history: pass back as ?since= for newer messages
+PAGINATION_HEADERS = [NEXT_CURSOR_HEADER, HAS_MORE_HEADER, SYNC_TOKEN_HEADER]
+
+# (column, descending)
+SortKey = Sequence[Tuple[Any, bool]]
+
+
+class PageParams:
+    """Query parameters accepted by every paginated list route."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def _encode_value(value: Any) -> list:
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, time):
+        return ["t", value.isoformat()]
+    return ["v", value]
+
+
+def _decode_value(raw: list) -> Any:
+    kind, value = raw
+    if kind == "dt":
+        return datetime.fromisoformat(value)
+    if kind == "d":
+        return date.fromisoformat(value)
+    if kind == "t":
+        return time.fromisoformat(value)
+    if kind == "v":
+        return value
+    raise ValueError(f"Unknown cursor value type: {kind}")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_length: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        values = [_decode_value(item) for item in raw]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    if len(values) != key_length:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    return values
+
+
+def _equals(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _beyond(column, descending: bool, value):
+    """Rows past ``value`` in the sort order, with NULL as the lowest value."""
+    if value is None:
+        return false() if descending else column.is_not(None)
+    if descending:
+        return or_(column < value, column.is_(None)) if column.nullable else column < value
+    return column > value
+
+
+def _after_cursor(sort_key: SortKey, values: Sequence[Any]):
+    """Row-value comparison ``key > cursor`` honouring each column's direction."""
+    clauses = []
+    for i, (column, descending) in enumerate(sort_key):
+        equal_prefix = [_equals(sort_key[j][0], values[j]) for j in range(i)]
+        clauses.append(and_(*equal_prefix, _beyond(column, descending, values[i])))
+    return or_(*clauses)
+
+
+def _order_by(column, descending: bool):
+    if not column.nullable:
+        return column.desc() if descending else column.asc()
+    # NULL lowest, as _beyond() assumes (PostgreSQL sorts it highest by default)
+    return column.desc().nulls_last() if descending else column.asc().nulls_first()
+
+
+def _page_query(query, sort_key: SortKey, page: PageParams):
+    """Keyset filter + ordering + limit; works on ORM Query and 2.0 select()."""
+    if page.cursor:
+        values = decode_cursor(page.cursor, len(sort_key))
+        query = query.filter(_after_cursor(sort_key, values))
+
+    query = query.order_by(*[_order_by(col, desc) for col, desc in sort_key])
+    return query.limit(page.limit + 1)
+
+
+def _finish_page(rows: list, sort_key: SortKey, page: PageParams, response: Response) -> list:
+    has_more = len(rows) > page.limit
+    rows = rows[:page.limit]
+
+    response.headers[HAS_MORE_HEADER] = "true" if has_more else "false"
+    if has_more and rows:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(last, col.key) for col, _ in sort_key]
+        )
+    return rows
+
+
+def paginate(query: SAQuery, sort_key: SortKey, page: PageParams, response: Response) -> list:
+    """Apply keyset ordering/filtering to ``query`` and return one page of rows.
+
+    ``sort_key`` must end with a unique, non-null column (usually the primary
+    key) so the ordering is total.
+    """
+    rows = _page_query(query, sort_key, page).all()
+    return _finish_page(rows, sort_key, page, response)
+
+
+async def paginate_async(db: AsyncSession, stmt: Select, sort_key: SortKey, page: PageParams,
+                         response: Response) -> list:
+    """paginate() for a ``select()`` run on an AsyncSession."""
+    rows = list((await db.execute(_page_query(stmt, sort_key, page))).scalars().all())
+    return _finish_page(rows, sort_key, page, response)
@@ -0,0 +1,126 @@
+# app/utils/pool_metrics.py
+"""
+Connection pool instrumentation.
+
+TimedQueuePool measures how long each checkout waited for a connection, and
+PoolMetrics listens to SQLAlchemy pool events (connect, checkout, checkin,
+invalidate) to count overflow connections, checkout timeouts and
+invalidated (stale) connections. snapshot() is served by GET /health/db, and
+checkouts slower than DB_POOL_SLOW_CHECKOUT_MS are logged as they happen.
+"""
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+DB_POOL_SLOW_CHECKOUT_MS = float(os.getenv("DB_POOL_SLOW_CHECKOUT_MS", "500"))
+_SAMPLES = 1000
+
+
+def _percentile(ordered, pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waits_ms = deque(maxlen=_SAMPLES)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connects = 0
+        self.overflow_connects = 0
+        self.invalidated = 0
+        self.max_wait_ms = 0.0
+
+    # ---------- recording ----------
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self._waits_ms.append(wait_ms)
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        if wait_ms >= DB_POOL_SLOW_CHECKOUT_MS:
+            print(f"⚠️ Slow DB pool checkout: waited {wait_ms:.0f} ms")
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts += 1
+        print("⚠️ DB pool checkout timed out")
+
+    def attach(self, engine) -> None:
+        pool = engine.pool
+
+        @event.listens_for(pool, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self.connects += 1
+                if isinstance(pool, QueuePool) and pool.overflow() > 0:
+                    self.overflow_connects += 1
+
+        @event.listens_for(pool, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            with self._lock:
+                self.checkouts += 1
+
+        @event.listens_for(pool, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            with self._lock:
+                self.invalidated += 1
+
+    # ---------- reporting ----------
+
+    def snapshot(self, engine) -> Dict[str, object]:
+        pool = engine.pool
+        with self._lock:
+            waits = sorted(self._waits_ms)
+            stats = {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "connects": self.connects,
+                "overflow_connects": self.overflow_connects,
+                "invalidated": self.invalidated,
+                "checkout_wait_ms": {
+                    "p50": round(_percentile(waits, 50), 3),
+                    "p99": round(_percentile(waits, 99), 3),
+                    "max": round(self.max_wait_ms, 3),
+                    "samples": len(waits),
+                },
+            }
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+            })
+        stats["status"] = pool.status()
+        return stats
+
+
+pool_metrics = PoolMetrics()
+_timing = threading.local()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout waited."""
+
+    def _do_get(self):
+        if getattr(_timing, "active", False):
+            return super()._do_get()  # QueuePool retries by recursing
+        _timing.active = True
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        finally:
+            _timing.active = False
+        pool_metrics.record_wait((time.perf_counter() - started) * 1000)
+        return record
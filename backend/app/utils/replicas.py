@@ -0,0 +1,147 @@
+# app/utils/replicas.py
+"""
+Read-replica routing.
+
+ReplicaSet hands out replicas round-robin to the read-only dependencies
+(get_read_db / get_async_read_db in app.database). A replica that fails to
+hand out a connection is taken out of rotation for DB_REPLICA_RETRY_SECONDS
+and then retried. check() probes every replica with ``SELECT 1``; a
+background thread runs it every DB_REPLICA_PROBE_SECONDS, and GET /health/db
+serves the last result rather than probing per request. With no replicas
+configured every read goes to the primary.
+
+Read-your-writes: replicas lag the primary, so a user who just changed
+something must not read the old row back. note_write() (called by
+ReadYourWritesMiddleware for every non-GET request) pins that user's reads
+to the primary for DB_READ_YOUR_WRITES_SECONDS.
+"""
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+from app.utils.ttl_cache import TTLCache
+
+
+class Replica:
+    __slots__ = ("name", "engine", "async_engine", "down_until", "failures", "last_error")
+
+    def __init__(self, name: str, engine, async_engine=None):
+        self.name = name
+        self.engine = engine
+        self.async_engine = async_engine
+        self.down_until = 0.0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    def is_up(self, now: float) -> bool:
+        return self.down_until <= now
+
+
+class ReplicaSet:
+    def __init__(self, retry_seconds: float = 30.0, read_your_writes_seconds: float = 5.0,
+                 probe_seconds: float = 15.0):
+        self.retry_seconds = retry_seconds
+        self.probe_seconds = probe_seconds
+        self.replicas: List[Replica] = []
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._recent_writers = TTLCache(read_your_writes_seconds, 100_000)
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self._stop_probing = threading.Event()
+        self._probe_thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def add(self, name: str, engine, async_engine=None) -> Replica:
+        replica = Replica(name, engine, async_engine)
+        self.replicas.append(replica)
+        return replica
+
+    # ---------- routing ----------
+
+    def pick(self, user_id: Optional[int] = None) -> Optional[Replica]:
+        """Next healthy replica, or None when the read must go to the primary."""
+        if self.replicas and (user_id is None or not self.recently_wrote(user_id)):
+            now = time.monotonic()
+            start = next(self._counter)
+            for offset in range(len(self.replicas)):
+                replica = self.replicas[(start + offset) % len(self.replicas)]
+                if replica.is_up(now):
+                    self.replica_reads += 1
+                    return replica
+        self.primary_reads += 1
+        return None
+
+    def mark_down(self, replica: Replica, error: Exception) -> None:
+        with self._lock:
+            replica.failures += 1
+            replica.last_error = str(error).splitlines()[0] if str(error) else type(error).__name__
+            replica.down_until = time.monotonic() + self.retry_seconds
+        print(f"⚠️ Read replica {replica.name} unavailable, using primary for {self.retry_seconds:.0f}s: {replica.last_error}")
+
+    def mark_up(self, replica: Replica) -> None:
+        with self._lock:
+            replica.down_until = 0.0
+
+    # ---------- read-your-writes ----------
+
+    def note_write(self, user_id: int) -> None:
+        if self.replicas:
+            self._recent_writers.set(user_id, True)
+
+    def recently_wrote(self, user_id: int) -> bool:
+        return self._recent_writers.get(user_id) is not None
+
+    # ---------- health ----------
+
+    def check(self) -> None:
+        """Probe every replica, taking failed ones out of rotation and restoring recovered ones."""
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+            except Exception as e:
+                self.mark_down(replica, e)
+            else:
+                self.mark_up(replica)
+
+    def start_probing(self) -> None:
+        """Run check() every ``probe_seconds`` on a daemon thread (no-op without replicas)."""
+        if not self.replicas or (self._probe_thread and self._probe_thread.is_alive()):
+            return
+        self._stop_probing.clear()
+        self._probe_thread = threading.Thread(target=self._probe_loop, name="replica-probe", daemon=True)
+        self._probe_thread.start()
+
+    def stop_probing(self) -> None:
+        self._stop_probing.set()
+        if self._probe_thread:
+            self._probe_thread.join(timeout=5)
+        self._probe_thread = None
+
+    def _probe_loop(self) -> None:
+        while not self._stop_probing.is_set():
+            self.check()
+            self._stop_probing.wait(self.probe_seconds)
+
+    def status(self) -> Dict[str, object]:
+        now = time.monotonic()
+        return {
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "replicas": [
+                {
+                    "name": r.name,
+                    "healthy": r.is_up(now),
+                    "failures": r.failures,
+                    "last_error": r.last_error,
+                }
+                for r in self.replicas
+            ],
+        }
@@ -0,0 +1,136 @@
+# app/utils/slot_engine.py
+"""
+Slot engine for mentor availability.
+
+Turns a mentor's weekly availability windows, blocked dates and active
+bookings into concrete free slots for a date range. Bookings are grouped by
+date and merged into sorted, disjoint busy intervals once, so each candidate
+slot is checked with a binary search instead of a scan over every booking in
+the range: O(bookings log bookings + days x windows x log bookings).
+"""
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.schemas.booking_schema import AvailableSlot
+
+
+def _micros(t: time) -> int:
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+def _from_micros(value: int) -> time:
+    seconds, micro = divmod(value, 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return time(hour, minute, second, micro)
+
+
+class _DayBookings:
+    """Busy intervals for one date, merged and sorted for bisect lookups."""
+
+    def __init__(self, intervals: Iterable[Tuple[time, time]]):
+        proper: List[Tuple[int, int]] = []
+        # Rows whose end is not after their start (e.g. a session that wraps
+        # past midnight) are kept aside and compared exactly as stored.
+        self.irregular: List[Tuple[time, time]] = []
+        self.raw: List[Tuple[time, time]] = []
+        for start, end in intervals:
+            self.raw.append((start, end))
+            if start < end:
+                proper.append((_micros(start), _micros(end)))
+            else:
+                self.irregular.append((start, end))
+
+        proper.sort()
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        for start, end in proper:
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def is_busy(self, start: time, end: time) -> bool:
+        """True if any booking overlaps [start, end)."""
+        if not start < end:
+            return any(b_start < end and b_end > start for b_start, b_end in self.raw)
+
+        start_us, end_us = _micros(start), _micros(end)
+        i = bisect_right(self.ends, start_us)
+        if i < len(self.starts) and self.starts[i] < end_us:
+            return True
+        return any(b_start < end and b_end > start for b_start, b_end in self.irregular)
+
+
+_NO_BOOKINGS = _DayBookings(())
+
+
+def index_bookings(bookings: Iterable) -> Dict[date, _DayBookings]:
+    """Group booking rows (session_date, start_time, end_time) by date."""
+    by_date: Dict[date, List[Tuple[time, time]]] = defaultdict(list)
+    for booking in bookings:
+        by_date[booking.session_date].append((booking.start_time, booking.end_time))
+    return {day: _DayBookings(intervals) for day, intervals in by_date.items()}
+
+
+def _split(start: time, end: time, slot_minutes: int) -> List[Tuple[time, time]]:
+    step = slot_minutes * 60 * 1_000_000
+    cursor, stop = _micros(start), _micros(end)
+    pieces = []
+    while cursor + step <= stop:
+        pieces.append((_from_micros(cursor), _from_micros(cursor + step)))
+        cursor += step
+    return pieces
+
+
+def compute_available_slots(
+    start_date: date,
+    end_date: date,
+    availability_slots: Iterable,
+    blocked_dates: Iterable[date],
+    bookings: Iterable,
+    slot_minutes: Optional[int] = None,
+) -> List[AvailableSlot]:
+    """Free slots between start_date and end_date (inclusive).
+
+    Without ``slot_minutes`` each availability window is returned whole when
+    no booking overlaps it. With ``slot_minutes`` windows are cut into
+    fixed-length sub-slots (a trailing remainder shorter than the slot is
+    dropped) and each free sub-slot is returned.
+    """
+    windows_by_weekday: Dict[int, list] = defaultdict(list)
+    for av_slot in availability_slots:
+        windows_by_weekday[av_slot.day_of_week].append(av_slot)
+
+    blocked = set(blocked_dates)
+    busy_by_date = index_bookings(bookings)
+
+    available_slots: List[AvailableSlot] = []
+    current_date = start_date
+    while current_date <= end_date:
+        windows = windows_by_weekday.get(current_date.weekday())
+        if windows and current_date not in blocked:
+            busy = busy_by_date.get(current_date, _NO_BOOKINGS)
+            for av_slot in windows:
+                if slot_minutes:
+                    candidates = _split(av_slot.start_time, av_slot.end_time, slot_minutes)
+                else:
+                    candidates = [(av_slot.start_time, av_slot.end_time)]
+
+                for start, end in candidates:
+                    if busy.is_busy(start, end):
+                        continue
+                    start_dt = datetime.combine(current_date, start)
+                    end_dt = datetime.combine(current_date, end)
+                    available_slots.append(AvailableSlot(
+                        date=current_date,
+                        start_time=start,
+                        end_time=end,
+                        duration_minutes=int((end_dt - start_dt).total_seconds() / 60),
+                    ))
+        current_date += timedelta(days=1)
+
+    return available_slots
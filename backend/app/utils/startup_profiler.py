@@ -0,0 +1,87 @@
+# app/utils/startup_profiler.py
+"""
+Cold-start import profiler.
+
+    python -m app.utils.startup_profiler [--top 25] [--module app.main]
+
+Imports the module in a fresh interpreter under ``-X importtime`` and prints
+the slowest imports by cumulative time plus self time grouped by top-level
+package, so a slower time to first byte can be traced to the import that
+caused it. bench_cold_start.py uses the same helpers.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """Parse ``import time: self | cumulative | name`` lines from -X importtime."""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        records.append(ImportRecord(
+            stripped, int(fields[0]), int(fields[1]), (len(name) - len(stripped) - 1) // 2,
+        ))
+    return records
+
+
+def profile_import(module: str = "app.main", env: Optional[Dict[str, str]] = None) -> Tuple[float, List[ImportRecord]]:
+    """Import ``module`` in a new interpreter; returns (wall seconds, import records)."""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env={**os.environ, **(env or {})},
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return wall, parse_importtime(proc.stderr)
+
+
+def by_package(records: List[ImportRecord]) -> List[Tuple[str, int]]:
+    """Self time summed per top-level package, slowest first."""
+    totals: Dict[str, int] = defaultdict(int)
+    for record in records:
+        totals[record.module.split(".")[0]] += record.self_us
+    return sorted(totals.items(), key=lambda item: -item[1])
+
+
+def report(wall: float, records: List[ImportRecord], top: int = 25) -> str:
+    lines = [f"Interpreter start + import: {wall * 1000:.0f} ms", "", "Slowest imports (cumulative ms):"]
+    for record in sorted(records, key=lambda r: -r.cumulative_us)[:top]:
+        lines.append(f"  {record.cumulative_us / 1000:9.1f}  {'  ' * record.depth}{record.module}")
+    lines += ["", "Self time by package (ms):"]
+    for package, total in by_package(records)[:top]:
+        lines.append(f"  {total / 1000:9.1f}  {package}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.utils.startup_profiler")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args(argv)
+    wall, records = profile_import(args.module)
+    print(report(wall, records, args.top))
+
+
+if __name__ == "__main__":
+    main()
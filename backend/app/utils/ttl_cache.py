@@ -0,0 +1,87 @@
+# app/utils/ttl_cache.py
+"""
+Small thread-safe TTL + LRU cache for per-process lookups (auth principals,
+decoded tokens). Entries expire after ``ttl_seconds`` (or an explicit
+deadline passed to set()), and the least recently used entry is evicted
+once ``max_entries`` is reached.
+
+Loads that race with invalidation use tickets: reserve(key) before reading
+the source, then set(key, value, ticket=ticket). pop(key) and clear()
+revoke the outstanding tickets, so a value read before an invalidation is
+never stored after it.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Set
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._tickets: Dict[Hashable, Set[object]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def reserve(self, key: Hashable) -> object:
+        """Ticket for a load of ``key``; pass it to set() and then release()."""
+        ticket = object()
+        with self._lock:
+            self._tickets.setdefault(key, set()).add(ticket)
+        return ticket
+
+    def release(self, key: Hashable, ticket: object) -> None:
+        with self._lock:
+            tickets = self._tickets.get(key)
+            if tickets is not None:
+                tickets.discard(ticket)
+                if not tickets:
+                    del self._tickets[key]
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None,
+            ticket: Optional[object] = None) -> bool:
+        """Store ``value``; ``expires_at`` (time.monotonic() based) caps the TTL.
+
+        With a ``ticket``, nothing is stored (and False is returned) if the
+        key was popped since reserve().
+        """
+        deadline = time.monotonic() + self.ttl_seconds
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        with self._lock:
+            if ticket is not None and ticket not in self._tickets.get(key, ()):
+                return False
+            self._entries[key] = (value, deadline)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._tickets.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tickets.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
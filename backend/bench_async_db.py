@@ -0,0 +1,133 @@
+"""
+Benchmark async handlers on the sync Session vs the AsyncSession.
+
+Sends GET /feedback/mentor/{id}/ratings from CLIENTS concurrent clients
+through the ASGI app in one event loop, and compares it with a copy of the
+handler as it was before the port (``async def`` + synchronous Session),
+mounted for the run at /bench/sync-ratings/{id}.
+
+A database round trip costs next to nothing on a local SQLite file, so each
+statement is delayed by DB_RTT_MS to model a network hop to Postgres: the
+sync engine sleeps in place (blocking the event loop, as a real blocking
+driver call does), the async engine awaits the delay.
+
+The sync pool is widened to CLIENTS connections for the run. With the default
+5 + 10 the "before" handler stalls for DB_POOL_TIMEOUT at 100 clients: its
+connection is only returned in get_db's teardown, which cannot be scheduled
+while another request holds the event loop blocked in pool checkout.
+
+Usage (from backend/):
+    python bench_async_db.py [DB_RTT_MS]
+"""
+import os
+
+os.environ.setdefault("DB_MAX_OVERFLOW", "100")  # >= CLIENTS, see above
+
+import bench_utils  # noqa: F401,E402  (must be imported before app)
+
+import asyncio
+import sys
+import time
+import uuid
+from datetime import date, time as dtime
+
+import httpx
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+
+from app.database import Base, SessionLocal, async_engine, engine, get_db
+from app.main import app
+from app.models.booking import Booking
+from app.models.feedback import SessionFeedback
+from app.models.user import User
+from bench_utils import percentile, print_table
+
+CLIENTS = 100
+REQUESTS_PER_CLIENT = 5
+FEEDBACK_ROWS = 50
+DB_RTT_MS = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+
+
+@app.get("/bench/sync-ratings/{mentor_id}")
+async def _sync_ratings(mentor_id: int, db: Session = Depends(get_db)):
+    feedbacks = db.query(SessionFeedback).filter(
+        SessionFeedback.mentor_id == mentor_id,
+        SessionFeedback.rating > 0
+    ).all()
+    return {"mentor_id": mentor_id, "total_sessions": len(feedbacks)}
+
+
+def _simulate_rtt():
+    delay = DB_RTT_MS / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _blocking_rtt(*_args):
+        time.sleep(delay)
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def _awaited_rtt(*_args):
+        await_only(asyncio.sleep(delay))
+
+
+def _seed() -> int:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        mentor = User(email=f"mentor-{uuid.uuid4().hex[:8]}@example.com", full_name="Bench Mentor",
+                      role="mentor", password="x")
+        mentee = User(email=f"mentee-{uuid.uuid4().hex[:8]}@example.com", full_name="Bench Mentee",
+                      role="mentee", password="x")
+        db.add_all([mentor, mentee])
+        db.commit()
+        for i in range(FEEDBACK_ROWS):
+            booking = Booking(mentee_id=mentee.id, mentor_id=mentor.id, session_date=date(2024, 1, 1),
+                              start_time=dtime(10, 0), end_time=dtime(11, 0), duration_minutes=60,
+                              amount=50.0, status="completed")
+            db.add(booking)
+            db.flush()
+            db.add(SessionFeedback(booking_id=booking.id, mentee_id=mentee.id, mentor_id=mentor.id,
+                                   rating=1 + i % 5))
+        db.commit()
+        return mentor.id
+    finally:
+        db.close()
+
+
+async def _run(path: str):
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one_client():
+            for _ in range(REQUESTS_PER_CLIENT):
+                started = time.perf_counter()
+                response = await client.get(path)
+                assert response.status_code == 200, response.text
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        await client.get(path)  # warm up
+        latencies.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(one_client() for _ in range(CLIENTS)))
+        elapsed = time.perf_counter() - started
+    return len(latencies) / elapsed, latencies
+
+
+def main():
+    mentor_id = _seed()
+    _simulate_rtt()
+    rows = []
+    for name, path in [
+        ("sync Session (before)", f"/bench/sync-ratings/{mentor_id}"),
+        ("AsyncSession", f"/feedback/mentor/{mentor_id}/ratings"),
+    ]:
+        throughput, latencies = asyncio.run(_run(path))
+        rows.append([name, f"{throughput:.0f}", f"{percentile(latencies, 50):.1f}", f"{percentile(latencies, 99):.1f}"])
+
+    print(f"{CLIENTS} concurrent clients x {REQUESTS_PER_CLIENT} requests, simulated DB round trip {DB_RTT_MS} ms\n")
+    print_table(["handler", "req/s", "p50 ms", "p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark the availability slot engine for a busy mentor.
+
+Compares app.utils.slot_engine.compute_available_slots with the original
+per-day / per-slot / per-booking scan over 90- and 365-day ranges, and checks
+that both produce the same slots.
+
+Usage (from backend/):
+    python bench_available_slots.py
+"""
+import bench_utils  # noqa: F401  (must be imported before app)
+
+import random
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+from app.schemas.booking_schema import AvailableSlot
+from app.utils.slot_engine import compute_available_slots
+from bench_utils import print_table, time_call
+
+RANGES = [90, 365]
+BOOKINGS_PER_DAY = 6
+
+
+def legacy_available_slots(start_date, end_date, availability_slots, blocked_dates, existing_bookings):
+    """The original nested scan from get_mentor_available_slots."""
+    blocked_date_list = list(blocked_dates)
+    available_slots = []
+    current_date = start_date
+    while current_date <= end_date:
+        if current_date in blocked_date_list:
+            current_date += timedelta(days=1)
+            continue
+        day_availability = [a for a in availability_slots if a.day_of_week == current_date.weekday()]
+        for av_slot in day_availability:
+            is_booked = False
+            for booking in existing_bookings:
+                if (booking.session_date == current_date and
+                        booking.start_time < av_slot.end_time and
+                        booking.end_time > av_slot.start_time):
+                    is_booked = True
+                    break
+            if not is_booked:
+                start_dt = datetime.combine(current_date, av_slot.start_time)
+                end_dt = datetime.combine(current_date, av_slot.end_time)
+                available_slots.append(AvailableSlot(
+                    date=current_date,
+                    start_time=av_slot.start_time,
+                    end_time=av_slot.end_time,
+                    duration_minutes=int((end_dt - start_dt).total_seconds() / 60),
+                ))
+        current_date += timedelta(days=1)
+    return available_slots
+
+
+def _busy_mentor(start: date, days: int):
+    rng = random.Random(days)
+    # Hourly windows 08:00-20:00 every day of the week.
+    availability = [
+        SimpleNamespace(day_of_week=dow, start_time=time(hour, 0), end_time=time(hour + 1, 0))
+        for dow in range(7)
+        for hour in range(8, 20)
+    ]
+    blocked = [start + timedelta(days=d) for d in range(0, days, 11)]
+    bookings = []
+    for d in range(days):
+        day = start + timedelta(days=d)
+        for hour in rng.sample(range(8, 20), BOOKINGS_PER_DAY):
+            minute = rng.choice([0, 30])
+            bookings.append(SimpleNamespace(
+                session_date=day,
+                start_time=time(hour, minute),
+                end_time=(datetime.combine(day, time(hour, minute)) + timedelta(minutes=60)).time(),
+            ))
+    return availability, blocked, bookings
+
+
+def main() -> None:
+    start = date(2025, 1, 1)
+    rows = []
+    for days in RANGES:
+        end = start + timedelta(days=days - 1)
+        availability, blocked, bookings = _busy_mentor(start, days)
+
+        legacy = legacy_available_slots(start, end, availability, blocked, bookings)
+        engine = compute_available_slots(start, end, availability, blocked, bookings)
+        assert legacy == engine, "slot engine output differs from the legacy scan"
+
+        legacy_ms = time_call(lambda: legacy_available_slots(start, end, availability, blocked, bookings), repeat=3)
+        engine_ms = time_call(lambda: compute_available_slots(start, end, availability, blocked, bookings))
+        split_ms = time_call(lambda: compute_available_slots(start, end, availability, blocked, bookings, slot_minutes=30))
+        rows.append([days, len(bookings), len(engine), f"{legacy_ms:.1f}", f"{engine_ms:.1f}", f"{split_ms:.1f}"])
+
+    print_table(["days", "bookings", "free slots", "legacy ms", "engine ms", "engine 30-min ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
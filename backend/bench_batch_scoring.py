@@ -0,0 +1,86 @@
+"""
+Benchmark vectorized batch match scoring against the scalar scorer.
+
+Scores one intake against synthetic catalogs of 1k, 10k and 100k mentors
+with calculate_enhanced_match_score in a loop and with
+MentorTable.top_k, and checks both return the same top 10.
+
+Usage (from backend/):
+    python bench_batch_scoring.py
+"""
+import bench_utils  # noqa: F401  (must be imported before app)
+
+import random
+import time
+from types import SimpleNamespace
+
+from app.utils.ai_agent import IntakeFeatures, MentorFeatures, calculate_enhanced_match_score
+from app.utils.batch_scorer import MentorTable
+from bench_utils import print_table, time_call
+
+CATALOG_SIZES = [1_000, 10_000, 100_000]
+TOP_K = 10
+
+SKILLS = [
+    "python", "java", "javascript", "typescript", "go", "rust", "sql", "react", "machine learning",
+    "data analysis", "product management", "leadership", "public speaking", "fundraising", "design",
+]
+DOMAINS = ["Software Engineering", "Tech", "Finance", "Marketing", "Healthcare", "Design", "Startups"]
+BIO_WORDS = ["teach", "lead", "team", "startup", "founder", "pivot", "coach", "engineer", "data", "product"]
+
+
+def _catalog(size: int):
+    rng = random.Random(size)
+    return [
+        SimpleNamespace(
+            id=i,
+            user_id=i,
+            full_name=f"Mentor {i}",
+            domains=", ".join(rng.sample(DOMAINS, 2)),
+            skills=", ".join(rng.sample(SKILLS, rng.randint(1, 5))),
+            years_experience=rng.randint(0, 30),
+            bio=" ".join(rng.choices(BIO_WORDS, k=12)),
+            hourly_rate=float(rng.choice([0, 25, 40, 60, 90, 150])),
+            availability="Weekdays",
+            is_verified=rng.random() < 0.3,
+        )
+        for i in range(1, size + 1)
+    ]
+
+
+INTAKE = SimpleNamespace(
+    desired_skills="Python, Machine Learning, Leadership",
+    industry_interest="Software Engineering",
+    career_stage="mid_level",
+    budget_range="50-100",
+    primary_goal="leadership",
+)
+
+
+def _scalar_top_k(profiles):
+    scored = [(calculate_enhanced_match_score(INTAKE, p)[0], p.user_id) for p in profiles]
+    scored.sort(key=lambda m: m[0], reverse=True)
+    return [uid for _, uid in scored[:TOP_K]]
+
+
+def main() -> None:
+    rows = []
+    for size in CATALOG_SIZES:
+        profiles = _catalog(size)
+        started = time.perf_counter()
+        table = MentorTable([MentorFeatures(p) for p in profiles])
+        build_ms = (time.perf_counter() - started) * 1000
+        intake = IntakeFeatures(INTAKE)
+
+        batch_top = [f.user_id for _, _, _, f in table.top_k(intake, TOP_K)]
+        assert batch_top == _scalar_top_k(profiles), "batch top-k differs from scalar scoring"
+
+        scalar_ms = time_call(lambda: _scalar_top_k(profiles), repeat=3)
+        batch_ms = time_call(lambda: table.top_k(IntakeFeatures(INTAKE), TOP_K))
+        rows.append([size, f"{scalar_ms:.1f}", f"{batch_ms:.1f}", f"{scalar_ms / batch_ms:.1f}x", f"{build_ms:.0f}"])
+
+    print_table(["mentors", "scalar ms", "batch ms", "speedup", "table build ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark cold-start time: interpreter launch to first HTTP response.
+
+Each run starts a fresh interpreter that imports app.main and serves
+GET / through the ASGI app, timing the import and the first response
+separately. The database is migrated by a warm-up run first, so the
+numbers cover a normal worker boot. Run this before and after changes
+that touch imports; the heaviest imports are listed via
+app.utils.startup_profiler.
+
+Usage (from backend/):
+    python bench_cold_start.py [RUNS]
+"""
+import bench_utils  # noqa: F401  (sets DATABASE_URL for the child processes)
+
+import json
+import os
+import subprocess
+import sys
+
+from app.utils.startup_profiler import by_package, profile_import
+from bench_utils import percentile, print_table
+
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+_CHILD = """
+import json, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(app.main.app)
+assert client.get("/").status_code == 200
+served = time.perf_counter()
+print("BENCH " + json.dumps({"import_ms": (imported - started) * 1000, "first_response_ms": (served - started) * 1000}))
+"""
+
+
+def _boot() -> dict:
+    proc = subprocess.run([sys.executable, "-c", _CHILD], capture_output=True, text=True,
+                          env=dict(os.environ), cwd=os.path.dirname(os.path.abspath(__file__)))
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr[-2000:])
+    line = next(line for line in proc.stdout.splitlines() if line.startswith("BENCH "))
+    return json.loads(line[len("BENCH "):])
+
+
+def main():
+    _boot()  # warm-up: migrates the throwaway database
+    runs = [_boot() for _ in range(RUNS)]
+
+    rows = []
+    for key, label in [("import_ms", "import app.main"), ("first_response_ms", "first response")]:
+        samples = [run[key] for run in runs]
+        rows.append([label, f"{percentile(samples, 50):.0f}", f"{min(samples):.0f}", f"{max(samples):.0f}"])
+    print(f"{RUNS} cold starts (after interpreter launch)\n")
+    print_table(["phase", "p50 ms", "min ms", "max ms"], rows)
+
+    _, records = profile_import()
+    print("\nImport self time by package (one -X importtime run):\n")
+    print_table(["package", "ms"], [[package, f"{us / 1000:.1f}"] for package, us in by_package(records)[:10]])
+    loaded = {r.module.split(".")[0] for r in records}
+    print("\nDeferred until first use: " + ", ".join(
+        name for name in ("stripe", "aiosmtplib", "numpy") if name not in loaded
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark the compiled intake keyword matcher against the old linear scan.
+
+Runs every keyword step of EnhancedIntakeAgent.CONVERSATION_FLOW over long
+free-text answers (the answer phrase first, then a narrative of 50 to 2000
+words) and over answers containing no keyword at all. Reports the median
+time per answer for the previous ``keyword in text_lower`` loop and for
+KeywordMatcher.find.
+
+Usage (from backend/):
+    python bench_keyword_matching.py
+"""
+import bench_utils  # noqa: F401  (must be imported before app)
+
+import random
+
+from app.utils.ai_agent import EnhancedIntakeAgent, step_matcher
+from bench_utils import print_table, time_call
+
+NARRATIVE_WORDS = [
+    "honestly", "really", "hoping", "would", "like", "find", "somebody", "who", "has", "been", "through",
+    "similar", "path", "before", "because", "right", "feel", "stuck", "about", "what", "matters", "most",
+    "my", "day", "job", "keeps", "me", "busy", "but", "am", "motivated", "grow", "every", "week", "read",
+    "blog", "posts", "and", "watch", "videos", "yet", "progress", "is", "slow", "so", "here", "we", "are",
+]
+ANSWERS = {
+    0: "I'm a senior platform engineer",
+    1: "Mostly I want leadership experience",
+    6: "Healthcare, ideally",
+    7: "Flexible, it varies",
+    8: "About $50-100/hour",
+    9: "12 months or so",
+    10: "An accountability partner",
+    11: "Video calls work best",
+}
+NARRATIVE_LENGTHS = [50, 300, 2000]
+CALLS = 200
+
+
+def _linear_scan(text, keywords_map):
+    """The previous EnhancedIntakeAgent.extract_keywords."""
+    text_lower = text.lower()
+    for keyword, value in keywords_map.items():
+        if keyword in text_lower:
+            return value
+    return None
+
+
+def _narrative(rng, length):
+    # Keep filler words free of any keyword so only the answer phrase can match.
+    keywords = [k for step in EnhancedIntakeAgent.CONVERSATION_FLOW for k in step.get("keywords", {})]
+    words = [w for w in NARRATIVE_WORDS if not any(k in w for k in keywords)]
+    return " ".join(rng.choice(words) for _ in range(length)) + "."
+
+
+def _run(texts_by_step, fn):
+    def work():
+        for _ in range(CALLS // len(texts_by_step) or 1):
+            for step, text in texts_by_step.items():
+                fn(step, text)
+    return time_call(work)
+
+
+def main():
+    rng = random.Random(10)
+    flow = EnhancedIntakeAgent.CONVERSATION_FLOW
+    old = lambda step, text: _linear_scan(text, flow[step]["keywords"])  # noqa: E731
+    new = lambda step, text: step_matcher(step).find(text)  # noqa: E731
+
+    rows = []
+    for length in NARRATIVE_LENGTHS:
+        narrative = _narrative(rng, length)
+        cases = {
+            "answer first": {step: f"{answer}. {narrative}" for step, answer in ANSWERS.items()},
+            "no keyword": {step: narrative for step in ANSWERS},
+        }
+        for case, texts in cases.items():
+            if case == "answer first":
+                for step, text in texts.items():
+                    assert new(step, text) == step_matcher(step).find(ANSWERS[step])
+            old_ms, new_ms = _run(texts, old), _run(texts, new)
+            rows.append([length, case, f"{old_ms:.2f}", f"{new_ms:.2f}", f"{old_ms / new_ms:.1f}x"])
+
+    print(f"{CALLS} answers per cell, median of 5 runs\n")
+    print_table(["words", "answer", "linear scan ms", "compiled ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark GET /bookings/my-bookings against booking history size.
+
+Reports the number of SQL statements and median latency for the endpoint,
+next to the old per-booking User lookup loop for comparison.
+
+Usage (from backend/):
+    python bench_my_bookings.py
+"""
+import bench_utils  # noqa: F401  (must be imported before app)
+
+from datetime import date, time, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.auth import create_access_token
+from app.database import SessionLocal
+from app.main import app
+from app.models.booking import Booking
+from app.models.user import User
+from bench_utils import QueryCounter, print_table, time_call
+
+HISTORY_SIZES = [10, 100, 500, 1000]
+
+
+def _seed(db, size: int) -> int:
+    mentor = User(email=f"bench-mentor-{size}@example.com", full_name="Bench Mentor", role="mentor", password="x")
+    db.add(mentor)
+    db.flush()
+    mentees = [
+        User(email=f"bench-mentee-{size}-{i}@example.com", full_name=f"Mentee {i}", role="mentee", password="x")
+        for i in range(20)
+    ]
+    db.add_all(mentees)
+    db.flush()
+    start = date(2020, 1, 1)
+    db.add_all([
+        Booking(
+            mentee_id=mentees[i % len(mentees)].id,
+            mentor_id=mentor.id,
+            session_date=start + timedelta(days=i),
+            start_time=time(10, 0),
+            end_time=time(11, 0),
+            duration_minutes=60,
+            amount=50.0,
+            status="completed",
+            payment_status="paid",
+        )
+        for i in range(size)
+    ])
+    db.commit()
+    return mentor.id
+
+
+def _legacy_lookup(mentor_id: int) -> None:
+    """The pre-batching access pattern: two User queries per booking."""
+    db = SessionLocal()
+    try:
+        bookings = db.query(Booking).filter(Booking.mentor_id == mentor_id).all()
+        for booking in bookings:
+            db.query(User).filter(User.id == booking.mentor_id).first()
+            db.query(User).filter(User.id == booking.mentee_id).first()
+    finally:
+        db.close()
+
+
+def main() -> None:
+    client = TestClient(app)
+    rows = []
+    for size in HISTORY_SIZES:
+        db = SessionLocal()
+        try:
+            mentor_id = _seed(db, size)
+        finally:
+            db.close()
+
+        headers = {"Authorization": f"Bearer {create_access_token(mentor_id)}"}
+        fetch = lambda: client.get("/bookings/my-bookings", headers=headers)  # noqa: E731
+
+        with QueryCounter() as counter:
+            response = fetch()
+        assert response.status_code == 200, response.text
+        endpoint_ms = time_call(fetch)
+
+        with QueryCounter() as legacy_counter:
+            _legacy_lookup(mentor_id)
+        legacy_ms = time_call(lambda: _legacy_lookup(mentor_id))
+
+        rows.append([size, counter.count, f"{endpoint_ms:.1f}", legacy_counter.count, f"{legacy_ms:.1f}"])
+
+    print_table(["bookings", "queries", "endpoint ms", "legacy queries", "legacy lookup ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
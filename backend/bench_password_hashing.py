@@ -0,0 +1,90 @@
+"""
+Benchmark /auth/login latency per password hashing profile.
+
+For each profile the app's CryptContext is swapped for one built with
+build_crypt_context(), a user is stored with a hash from that profile, and
+LOGINS logins are sent through the real endpoint, first one at a time and
+then CONCURRENCY at once. Reports p50/p99 latency, to help pick bcrypt
+rounds / argon2id parameters for an instance size. argon2id rows need
+argon2-cffi (pip install argon2-cffi) and are skipped without it.
+
+Usage (from backend/):
+    python bench_password_hashing.py
+"""
+import bench_utils  # noqa: F401  (must be imported before app)
+
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+import app.auth as auth
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models.user import User
+from bench_utils import percentile, print_table
+
+LOGINS = 20
+CONCURRENCY = 4
+
+PROFILES = [
+    ("bcrypt rounds=10", dict(scheme="bcrypt", bcrypt_rounds=10)),
+    ("bcrypt rounds=11", dict(scheme="bcrypt", bcrypt_rounds=11)),
+    ("bcrypt rounds=12", dict(scheme="bcrypt", bcrypt_rounds=12)),
+    ("bcrypt rounds=13", dict(scheme="bcrypt", bcrypt_rounds=13)),
+    ("argon2id m=19MiB t=2 p=1", dict(scheme="argon2id", argon2_memory_kib=19456, argon2_time_cost=2, argon2_parallelism=1)),
+    ("argon2id m=64MiB t=3 p=4", dict(scheme="argon2id", argon2_memory_kib=65536, argon2_time_cost=3, argon2_parallelism=4)),
+]
+
+
+def _login_latencies(client, email, concurrency):
+    def login(_):
+        started = time.perf_counter()
+        response = client.post("/auth/login", json={"email": email, "password": "bench-password"})
+        assert response.status_code == 200, response.text
+        return (time.perf_counter() - started) * 1000
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(login, range(LOGINS)))
+
+
+def main():
+    Base.metadata.create_all(bind=engine)
+    client = TestClient(app)
+    rows = []
+    for name, settings in PROFILES:
+        if settings["scheme"] == "argon2id" and not auth._argon2_available():
+            rows.append([name, "-", "-", "-", "-", "argon2-cffi not installed"])
+            continue
+        auth.pwd_context = auth.build_crypt_context(**settings)
+
+        email = f"bench-{uuid.uuid4().hex[:8]}@example.com"
+        db = SessionLocal()
+        try:
+            db.add(User(email=email, full_name="Bench User", role="mentee",
+                        password=auth.hash_password("bench-password")))
+            db.commit()
+        finally:
+            db.close()
+
+        serial = _login_latencies(client, email, 1)
+        burst = _login_latencies(client, email, CONCURRENCY)
+        rows.append([
+            name,
+            f"{percentile(serial, 50):.0f}",
+            f"{percentile(serial, 99):.0f}",
+            f"{percentile(burst, 50):.0f}",
+            f"{percentile(burst, 99):.0f}",
+            "",
+        ])
+
+    print(f"{LOGINS} logins per column, hashing pool workers={auth.hashing_executor.workers}\n")
+    print_table(
+        ["profile", "p50 ms", "p99 ms", f"p50 ms x{CONCURRENCY}", f"p99 ms x{CONCURRENCY}", "note"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
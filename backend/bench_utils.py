@@ -0,0 +1,64 @@
+"""
+Shared helpers for the backend benchmark scripts (bench_*.py).
+
+Import this module before anything from ``app`` so the benchmarks run against
+a throwaway SQLite database instead of the DATABASE_URL used by the server.
+Set BENCH_DATABASE_URL to benchmark against a real Postgres instance.
+"""
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Iterable, Sequence
+
+_bench_dir = tempfile.mkdtemp(prefix="mentor-bench-")
+os.environ["DATABASE_URL"] = os.getenv(
+    "BENCH_DATABASE_URL", f"sqlite:///{os.path.join(_bench_dir, 'bench.db')}"
+)
+
+from sqlalchemy import event  # noqa: E402
+
+from app.database import engine  # noqa: E402
+
+
+class QueryCounter:
+    """Count SQL statements sent to the engine inside a ``with`` block."""
+
+    def __init__(self):
+        self.count = 0
+
+    def _on_execute(self, *_args, **_kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *_exc):
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+
+
+def time_call(fn: Callable, repeat: int = 5) -> float:
+    """Return the median wall time of ``fn()`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def print_table(headers: Sequence[str], rows: Iterable[Sequence]) -> None:
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(h), *(len(r[i]) for r in rows)) if rows else len(h) for i, h in enumerate(headers)]
+    print("  ".join(h.rjust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(cell.rjust(w) for cell, w in zip(row, widths)))
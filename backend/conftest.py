@@ -1,9 +1,12 @@
 import os
+import uuid
 
 # Use local SQLite for test runs to avoid psycopg2 dependency
 os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
 
+from app.auth import create_access_token  # noqa: E402  pylint: disable=wrong-import-position
 from app.database import Base, engine  # noqa: E402  pylint: disable=wrong-import-position
+from app.models.user import User  # noqa: E402  pylint: disable=wrong-import-position
 import pytest
 
 
@@ -13,3 +16,16 @@ def setup_test_database():
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
+
+
+# Shared helpers; test modules import them with ``from conftest import ...``.
+def make_user(db, role: str, full_name: str, password: str = "x") -> int:
+    """Commit a user with a unique email and return its id."""
+    user = User(email=f"{role}-{uuid.uuid4().hex[:8]}@example.com", full_name=full_name, role=role, password=password)
+    db.add(user)
+    db.commit()
+    return user.id
+
+
+def auth_headers(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
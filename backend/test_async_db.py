@@ -0,0 +1,108 @@
+"""
+Async DB layer tests (run with pytest from backend/).
+
+The payment, feedback, register and forgot-password handlers run on the
+AsyncSession from get_async_db; none of their queries should go through the
+synchronous engine, which would block the event loop.
+"""
+import uuid
+from datetime import date, time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import SessionLocal, engine
+from app.main import app
+from app.models.booking import Booking
+from app.models.user import User
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _sync_queries(fn):
+    statements = []
+    listener = lambda *args, **kwargs: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, statements
+
+
+def test_feedback_flow_runs_on_the_async_session():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Async Mentor")
+        mentee = make_user(db, "mentee", "Async Mentee")
+        booking = Booking(
+            mentee_id=mentee, mentor_id=mentor, session_date=date(2024, 3, 1),
+            start_time=time(10, 0), end_time=time(11, 0), duration_minutes=60,
+            amount=50.0, status="confirmed",
+        )
+        db.add(booking)
+        db.commit()
+        booking_id = booking.id
+    finally:
+        db.close()
+
+    response = client.post("/feedback/complete-session", json={"booking_id": booking_id}, headers=auth_headers(mentor))
+    assert response.status_code == 200
+    response = client.post(
+        "/feedback/submit",
+        json={"booking_id": booking_id, "rating": 4, "feedback_text": "Helpful"},
+        headers=auth_headers(mentee),
+    )
+    assert response.status_code == 200
+    assert response.json()["rating"] == 4
+
+    ratings, statements = _sync_queries(lambda: client.get(f"/feedback/mentor/{mentor}/ratings"))
+    assert ratings.json()["total_sessions"] == 1
+    assert ratings.json()["four_star"] == 1
+    assert statements == []
+
+    feedback = client.get(f"/feedback/mentor/{mentor}/feedback").json()
+    assert [f["feedback_text"] for f in feedback] == ["Helpful"]
+    mine = client.get("/feedback/my-feedback?limit=1", headers=auth_headers(mentor))
+    assert [f["booking_id"] for f in mine.json()] == [booking_id]
+    assert mine.headers["X-Has-More"] == "false"
+
+
+def test_payment_reads_run_on_the_async_session():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Balance Mentor")
+    finally:
+        db.close()
+    client.get("/payments/my-payments", headers=auth_headers(mentor))  # caches the principal
+
+    balance, statements = _sync_queries(lambda: client.get("/payments/balance", headers=auth_headers(mentor)))
+    assert balance.status_code == 200
+    assert balance.json()["mentor_id"] == mentor
+    assert statements == []
+
+    history = client.get("/payments/history", headers=auth_headers(mentor))
+    assert history.status_code == 200
+    assert history.json() == []
+
+
+def test_register_and_forgot_password_use_the_async_session():
+    email = f"async-{uuid.uuid4().hex[:8]}@example.com"
+    payload = {"email": email, "full_name": "Async User", "role": "Mentee", "password": "s3cret-pass"}
+
+    response, statements = _sync_queries(lambda: client.post("/auth/register", json=payload))
+    assert response.status_code == 200
+    assert response.json()["role"] == "mentee"
+    assert statements == []
+    assert client.post("/auth/register", json=payload).status_code == 400
+
+    response, statements = _sync_queries(lambda: client.post("/auth/forgot-password", json={"email": email}))
+    assert response.status_code == 200
+    assert statements == []
+
+    db = SessionLocal()
+    try:
+        assert db.query(User).filter(User.email == email).one().reset_token is not None
+    finally:
+        db.close()
@@ -0,0 +1,173 @@
+"""
+Auth principal cache tests (run with pytest from backend/).
+"""
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy import event
+
+from app.auth import (
+    ALGORITHM, SECRET_KEY, create_access_token, hash_password, invalidate_user, load_principal,
+    principal_cache, token_cache,
+)
+from app.database import SessionLocal, engine
+from app.main import app
+from app.models.user import User
+from app.utils import auth_utils
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _user_queries(fn):
+    statements = []
+    listener = lambda *args, **kwargs: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return result, [sql for sql in statements if "FROM users" in sql]
+
+
+def test_repeat_requests_skip_the_users_lookup():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Cached Mentor")
+    finally:
+        db.close()
+
+    first, queries = _user_queries(lambda: client.get("/auth/me", headers=auth_headers(mentor)))
+    assert first.status_code == 200
+    assert len(queries) == 1
+
+    second, queries = _user_queries(lambda: client.get("/auth/me", headers=auth_headers(mentor)))
+    assert second.json() == first.json()
+    assert queries == []
+
+
+def test_role_change_and_password_reset_invalidate_the_principal():
+    db = SessionLocal()
+    try:
+        user_id = make_user(db, "mentor", "Switching User")
+        assert client.get("/auth/me", headers=auth_headers(user_id)).status_code == 200
+        assert principal_cache.get(user_id) is not None
+
+        user = db.get(User, user_id)
+        user.role = "mentee"
+        db.commit()
+        assert principal_cache.get(user_id) is None
+        assert client.get("/auth/me", headers=auth_headers(user_id)).status_code == 403
+
+        user.reset_token = uuid.uuid4().hex
+        user.reset_token_expiry = datetime.utcnow() + timedelta(hours=1)
+        db.commit()
+        token = user.reset_token
+    finally:
+        db.close()
+
+    client.get("/profiles/me", headers=auth_headers(user_id))
+    assert principal_cache.get(user_id) is not None
+    response = client.post("/auth/reset-password", json={"token": token, "new_password": "n3w-password"})
+    assert response.status_code == 200
+    assert principal_cache.get(user_id) is None
+
+
+def test_invalidation_during_a_load_is_not_overwritten_by_the_old_row():
+    db = SessionLocal()
+    try:
+        user_id = make_user(db, "mentee", "Racing User")
+        principal_cache.pop(user_id)
+
+        # Another request commits a change (and invalidates) while this
+        # one is reading the old row.
+        def commit_elsewhere(conn, cursor, statement, *args):
+            if "FROM users" in statement:
+                invalidate_user(user_id)
+
+        event.listen(engine, "before_cursor_execute", commit_elsewhere)
+        try:
+            principal = load_principal(db, user_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", commit_elsewhere)
+
+        assert principal.id == user_id
+        assert principal_cache.get(user_id) is None
+        assert load_principal(db, user_id) is principal_cache.get(user_id)
+    finally:
+        db.close()
+
+
+def test_rolled_back_changes_keep_the_cached_principal():
+    db = SessionLocal()
+    try:
+        user_id = make_user(db, "mentee", "Steady User", password=hash_password("pw"))
+        client.get("/profiles/me", headers=auth_headers(user_id))
+        cached = principal_cache.get(user_id)
+
+        db.get(User, user_id).role = "mentor"
+        db.flush()
+        db.rollback()
+        assert principal_cache.get(user_id) is cached
+    finally:
+        db.close()
+
+
+def test_login_token_carries_role():
+    db = SessionLocal()
+    try:
+        user_id = make_user(db, "mentor", "Login User", password=hash_password("pw"))
+        email = db.get(User, user_id).email
+    finally:
+        db.close()
+
+    token = client.post("/auth/login", json={"email": email, "password": "pw"}).json()["access_token"]
+    claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    assert claims["user_id"] == user_id
+    assert claims["role"] == "mentor"
+
+
+def test_feedback_routes_accept_both_token_shapes():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Feedback Mentor")
+        mentee = make_user(db, "mentee", "Feedback Mentee")
+    finally:
+        db.close()
+
+    sub_token = auth_utils.create_access_token({"sub": str(mentor)})
+    for headers in (auth_headers(mentor), {"Authorization": f"Bearer {sub_token}"}):
+        assert client.get("/feedback/my-feedback", headers=headers).status_code == 200
+    assert client.get("/feedback/my-feedback", headers=auth_headers(mentee)).status_code == 403
+
+
+def test_decoded_tokens_are_cached_per_token():
+    db = SessionLocal()
+    try:
+        user_id = make_user(db, "mentor", "Token User")
+        other_id = make_user(db, "mentor", "Other User")
+    finally:
+        db.close()
+
+    token = create_access_token(user_id)
+    assert client.get("/auth/me", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+    assert token_cache.get(token) == user_id
+
+    # Reusing the signature with different claims must not hit the cache.
+    header, _, signature = token.split(".")
+    other_claims = create_access_token(other_id).split(".")[1]
+    forged = f"{header}.{other_claims}.{signature}"
+    assert client.get("/auth/me", headers={"Authorization": f"Bearer {forged}"}).status_code == 401
+
+
+def test_expired_tokens_are_rejected():
+    db = SessionLocal()
+    try:
+        user_id = make_user(db, "mentor", "Expired User")
+    finally:
+        db.close()
+    expired = create_access_token(user_id, expires_delta=-1)
+    assert client.get("/auth/me", headers={"Authorization": f"Bearer {expired}"}).status_code == 401
+    assert token_cache.get(expired) is None
@@ -0,0 +1,47 @@
+"""
+Batch scorer tests (run with pytest from backend/).
+"""
+import random
+
+from app.utils.ai_agent import IntakeFeatures, MentorFeatures, calculate_enhanced_match_score
+from app.utils.batch_scorer import MentorTable
+import app.utils.mentor_index as mentor_index_module
+from app.utils.mentor_index import MentorSearchIndex
+from test_mentor_index import _full_scan, _intake, _profile
+
+
+def test_batch_scores_match_scalar_scores():
+    rng = random.Random(11)
+    profiles = [_profile(rng, i) for i in range(1, 301)]
+    table = MentorTable([MentorFeatures(p) for p in profiles])
+
+    for _ in range(40):
+        intake = _intake(rng)
+        scores = table.scores(IntakeFeatures(intake))
+        expected = [calculate_enhanced_match_score(intake, p)[0] for p in profiles]
+        assert scores.tolist() == expected
+
+
+def test_batch_top_k_matches_full_scan_including_reasons():
+    rng = random.Random(13)
+    profiles = [_profile(rng, i) for i in range(1, 301)]
+    table = MentorTable([MentorFeatures(p) for p in profiles])
+
+    for _ in range(40):
+        intake = _intake(rng)
+        limit, min_score = rng.choice([1, 5, 25]), rng.choice([0, 30, 60])
+        top = table.top_k(IntakeFeatures(intake), limit, min_score)
+        assert [(f.user_id, score, reasons) for score, reasons, _, f in top] == _full_scan(profiles, intake, limit, min_score)
+
+
+def test_index_falls_back_to_batch_table_for_large_catalogs(monkeypatch):
+    rng = random.Random(17)
+    profiles = [_profile(rng, i) for i in range(1, 201)]
+    index = MentorSearchIndex()
+    index.rebuild(profiles)
+    monkeypatch.setattr(mentor_index_module, "BATCH_SCORING_MIN_MENTORS", 1)
+
+    for _ in range(30):
+        intake = _intake(rng)
+        top = index.top_matches(IntakeFeatures(intake), 5, 30)
+        assert [(f.user_id, score, reasons) for score, reasons, _, f in top] == _full_scan(profiles, intake, 5, 30)
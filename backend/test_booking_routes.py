@@ -0,0 +1,219 @@
+"""
+Booking route tests (run with pytest from backend/).
+"""
+import threading
+from datetime import date, time, timedelta
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import SessionLocal, engine
+from app.main import app
+from app.models.booking import Availability, Booking
+from app.models.profile import MentorProfile
+from app.models.user import User
+from app.routes.booking_routes import MAX_AVAILABILITY_SEARCH_DAYS, create_booking
+from app.schemas.booking_schema import BookingCreate
+from app.utils.pagination import DEFAULT_PAGE_SIZE
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _add_bookings(db, mentor_id: int, mentee_ids: list, count: int, start: date = date(2024, 1, 1)) -> None:
+    db.add_all([
+        Booking(
+            mentee_id=mentee_ids[i % len(mentee_ids)],
+            mentor_id=mentor_id,
+            session_date=start + timedelta(days=i),
+            start_time=time(10, 0),
+            end_time=time(11, 0),
+            duration_minutes=60,
+            amount=50.0,
+            status="confirmed",
+            payment_status="pending",
+        )
+        for i in range(count)
+    ])
+    db.commit()
+
+
+def test_my_bookings_loads_names_without_per_booking_queries():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Ada Mentor")
+        mentees = [make_user(db, "mentee", f"Mentee {i}") for i in range(3)]
+        _add_bookings(db, mentor, mentees, 12)
+    finally:
+        db.close()
+
+    statements = []
+    listener = lambda *args, **kwargs: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get("/bookings/my-bookings", headers=auth_headers(mentor))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    bookings = response.json()
+    assert len(bookings) == 12
+    assert {b["mentor_name"] for b in bookings} == {"Ada Mentor"}
+    assert {b["mentee_name"] for b in bookings} == {"Mentee 0", "Mentee 1", "Mentee 2"}
+    assert all(b["mentee_email"].endswith("@example.com") for b in bookings)
+    # One query for the auth user, one for bookings + users.
+    assert len(statements) <= 2
+
+
+def test_my_bookings_pages_with_keyset_cursor():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Paged Mentor")
+        mentee = make_user(db, "mentee", "Paged Mentee")
+        _add_bookings(db, mentor, [mentee], 7)
+    finally:
+        db.close()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/bookings/my-bookings", params=params, headers=auth_headers(mentee))
+        assert response.status_code == 200
+        seen.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if response.headers["X-Has-More"] == "false":
+            assert cursor is None
+            break
+
+    assert len(seen) == 7
+    dates = [b["session_date"] for b in seen]
+    assert dates == sorted(dates, reverse=True)
+    assert len({b["id"] for b in seen}) == 7
+
+
+def test_my_bookings_without_cursor_is_one_bounded_page():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Busy Mentor")
+        mentee = make_user(db, "mentee", "Busy Mentee")
+        _add_bookings(db, mentor, [mentee], DEFAULT_PAGE_SIZE + 5)
+    finally:
+        db.close()
+
+    response = client.get("/bookings/my-bookings", headers=auth_headers(mentor))
+    assert response.status_code == 200
+    assert len(response.json()) == DEFAULT_PAGE_SIZE
+    assert response.headers["X-Has-More"] == "true"
+
+    rest = client.get("/bookings/my-bookings", params={"cursor": response.headers["X-Next-Cursor"]}, headers=auth_headers(mentor))
+    assert len(rest.json()) == 5
+    assert rest.headers["X-Has-More"] == "false"
+
+
+def test_my_bookings_rejects_malformed_cursor():
+    db = SessionLocal()
+    try:
+        mentee = make_user(db, "mentee", "Cursor Mentee")
+    finally:
+        db.close()
+
+    response = client.get("/bookings/my-bookings", params={"cursor": "not-a-cursor"}, headers=auth_headers(mentee))
+    assert response.status_code == 400
+
+
+def test_availability_search_covers_many_mentors_with_fixed_query_count():
+    monday = date(2025, 3, 3)
+    db = SessionLocal()
+    try:
+        mentee = make_user(db, "mentee", "Searcher")
+        mentor_ids = [make_user(db, "mentor", f"Search Mentor {i}") for i in range(5)]
+        db.add_all([
+            Availability(mentor_id=mentor_id, day_of_week=0, start_time=time(9, 0), end_time=time(11, 0))
+            for mentor_id in mentor_ids
+        ])
+        db.commit()
+        _add_bookings(db, mentor_ids[0], [mentee], 1, start=monday)
+    finally:
+        db.close()
+
+    statements = []
+    listener = lambda *args, **kwargs: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(
+            "/bookings/availability/search",
+            params={"start_date": str(monday), "end_date": str(monday), "mentor_ids": mentor_ids, "slot_minutes": 60},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    by_mentor = {m["mentor_id"]: m["available_slots"] for m in response.json()["mentors"]}
+    assert set(by_mentor) == set(mentor_ids)
+    assert [s["start_time"] for s in by_mentor[mentor_ids[0]]] == ["09:00:00"]
+    assert all(len(by_mentor[m]) == 2 for m in mentor_ids[1:])
+    # mentors + availability + blocked dates + bookings
+    assert len(statements) == 4
+
+
+def test_availability_search_rejects_oversized_window():
+    start = date(2025, 3, 3)
+    response = client.get(
+        "/bookings/availability/search",
+        params={"start_date": str(start), "end_date": str(start + timedelta(days=MAX_AVAILABILITY_SEARCH_DAYS)), "mentor_ids": [1]},
+    )
+    assert response.status_code == 400
+
+
+def test_concurrent_bookings_for_same_slot_only_one_wins():
+    session_date = date(2026, 6, 1)
+    db = SessionLocal()
+    try:
+        mentor_id = make_user(db, "mentor", "Busy Mentor")
+        db.add(MentorProfile(user_id=mentor_id, full_name="Busy Mentor", hourly_rate=60.0))
+        db.commit()
+        mentee_ids = [make_user(db, "mentee", f"Racer {i}") for i in range(8)]
+    finally:
+        db.close()
+
+    barrier = threading.Barrier(len(mentee_ids))
+    outcomes = []
+
+    def attempt(mentee_id: int, start: time) -> None:
+        db = SessionLocal()
+        try:
+            mentee = db.query(User).filter(User.id == mentee_id).first()
+            barrier.wait()
+            create_booking(
+                BookingCreate(mentor_id=mentor_id, session_date=session_date, start_time=start, duration_minutes=60),
+                db=db,
+                current_user=mentee,
+            )
+            outcomes.append(201)
+        except HTTPException as exc:
+            outcomes.append(exc.status_code)
+        finally:
+            db.close()
+
+    # Overlapping start times: every pair of requests conflicts.
+    starts = [time(10, 0), time(10, 30), time(9, 45), time(10, 15)] * 2
+    threads = [threading.Thread(target=attempt, args=(m, t)) for m, t in zip(mentee_ids, starts)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(outcomes) == [201] + [409] * 7
+
+    db = SessionLocal()
+    try:
+        active = db.query(Booking).filter(
+            Booking.mentor_id == mentor_id, Booking.session_date == session_date
+        ).count()
+    finally:
+        db.close()
+    assert active == 1
@@ -0,0 +1,69 @@
+"""
+Chat history cursor tests (run with pytest from backend/).
+"""
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from app.models.message import Message
+from app.models.mentorship import Mentorship
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _conversation(count: int):
+    """A mentor/mentee pair with ``count`` alternating messages; returns (mentor, mentee, ids)."""
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "History Mentor")
+        mentee = make_user(db, "mentee", "History Mentee")
+        db.add(Mentorship(mentor_id=mentor, mentee_id=mentee, status="active"))
+        messages = [
+            Message(sender_id=(mentor, mentee)[n % 2], recipient_id=(mentee, mentor)[n % 2], content=f"m{n}")
+            for n in range(count)
+        ]
+        db.add_all(messages)
+        db.commit()
+        return mentor, mentee, [m.id for m in messages]
+    finally:
+        db.close()
+
+
+def test_default_page_is_newest_messages_and_before_pages_back():
+    mentor, mentee, ids = _conversation(25)
+
+    res = client.get(f"/chat/messages/{mentee}?limit=10", headers=auth_headers(mentor))
+    assert [m["id"] for m in res.json()] == ids[-10:]
+    assert res.headers["X-Has-More"] == "true"
+    assert "X-Sync-Token" in res.headers
+
+    res = client.get(f"/chat/messages/{mentee}?limit=10&before={ids[-10]}", headers=auth_headers(mentor))
+    assert [m["id"] for m in res.json()] == ids[5:15]
+    assert "X-Sync-Token" not in res.headers
+
+    res = client.get(f"/chat/messages/{mentor}?limit=10&before={ids[5]}", headers=auth_headers(mentee))
+    assert [m["id"] for m in res.json()] == ids[:5]
+    assert res.headers["X-Has-More"] == "false"
+
+
+def test_since_token_returns_only_new_messages():
+    mentor, mentee, ids = _conversation(3)
+    token = client.get(f"/chat/messages/{mentee}", headers=auth_headers(mentor)).headers["X-Sync-Token"]
+
+    res = client.get(f"/chat/messages/{mentee}", params={"since": token}, headers=auth_headers(mentor))
+    assert res.json() == []
+    assert res.headers["X-Sync-Token"] == token
+
+    sent = client.post("/chat/messages", json={"recipient_id": mentor, "content": "new"}, headers=auth_headers(mentee)).json()
+    res = client.get(f"/chat/messages/{mentee}", params={"since": token}, headers=auth_headers(mentor))
+    assert [m["id"] for m in res.json()] == [sent["id"]]
+    assert res.headers["X-Sync-Token"] != token
+
+    other_mentor, other_mentee, _ = _conversation(1)
+    res = client.get(f"/chat/messages/{other_mentee}", params={"since": token}, headers=auth_headers(other_mentor))
+    assert res.status_code == 400
+    res = client.get(f"/chat/messages/{mentee}", params={"since": token, "before": ids[-1]}, headers=auth_headers(mentor))
+    assert res.status_code == 400
+
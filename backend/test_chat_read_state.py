@@ -0,0 +1,90 @@
+"""
+Chat read-state tests (run with pytest from backend/).
+"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.auth import create_access_token
+from app.database import SessionLocal, engine
+from app.main import app
+from app.models.mentorship import Mentorship
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _mentor_with_mentees(count: int):
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Read Mentor")
+        mentees = [make_user(db, "mentee", f"Read Mentee {i}") for i in range(count)]
+        db.add_all([Mentorship(mentor_id=mentor, mentee_id=mentee, status="active") for mentee in mentees])
+        db.commit()
+        return mentor, mentees
+    finally:
+        db.close()
+
+
+def _send(sender: int, recipient: int, content: str = "hi") -> int:
+    res = client.post("/chat/messages", json={"recipient_id": recipient, "content": content}, headers=auth_headers(sender))
+    assert res.status_code == 201
+    return res.json()["id"]
+
+
+def test_unread_counts_come_from_counters_in_one_query():
+    mentor, (a, b) = _mentor_with_mentees(2)
+    for _ in range(3):
+        _send(a, mentor)
+    _send(b, mentor)
+    _send(mentor, b)
+
+    client.get("/chat/unread", headers=auth_headers(mentor))  # warm the principal cache
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        res = client.get("/chat/unread", headers=auth_headers(mentor))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    summary = res.json()
+    assert summary["total"] == 4
+    assert sorted((c["other_user_id"], c["unread_count"]) for c in summary["conversations"]) == [(a, 3), (b, 1)]
+    assert len(statements) == 1
+    assert "messages" not in statements[0]
+    assert client.get("/chat/unread", headers=auth_headers(b)).json()["total"] == 1
+
+
+def test_batched_mark_read_moves_watermarks_forward_only():
+    mentor, (a, b) = _mentor_with_mentees(2)
+    first = _send(a, mentor)
+    second = _send(a, mentor)
+    _send(a, mentor)
+    from_b = _send(b, mentor)
+
+    res = client.post("/chat/read", json=[
+        {"other_user_id": a, "message_id": first},
+        {"other_user_id": b, "message_id": from_b + 1000},  # capped at the last message
+    ], headers=auth_headers(mentor))
+    assert res.status_code == 200
+    assert res.json() == {"total": 2, "conversations": [{"other_user_id": a, "unread_count": 2}]}
+
+    # An older mark does not move the watermark back.
+    res = client.post("/chat/read", json=[{"other_user_id": a, "message_id": second}, {"other_user_id": a, "message_id": first}], headers=auth_headers(mentor))
+    assert res.json()["total"] == 1
+
+    convos = {c["other_user_id"]: c for c in client.get("/chat/conversations", headers=auth_headers(mentor)).json()}
+    assert (convos[a]["unread_count"], convos[b]["unread_count"]) == (1, 0)
+
+    receipts = {c["other_user_id"]: c for c in client.get("/chat/conversations", headers=auth_headers(a)).json()}
+    assert receipts[mentor]["other_last_read_message_id"] == second
+
+
+def test_mark_read_is_pushed_to_both_sides():
+    mentor, (mentee,) = _mentor_with_mentees(1)
+    message_id = _send(mentee, mentor)
+    with client.websocket_connect(f"/chat/ws?token={create_access_token(mentee)}") as socket:
+        assert socket.receive_json()["type"] == "ready"
+        assert client.post("/chat/read", json=[{"other_user_id": mentee, "message_id": message_id}], headers=auth_headers(mentor)).status_code == 200
+        assert socket.receive_json() == {"type": "read", "reader_id": mentor, "peer_id": mentee, "message_id": message_id}
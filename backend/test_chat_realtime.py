@@ -0,0 +1,101 @@
+"""
+Real-time chat tests (run with pytest from backend/).
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.auth import create_access_token
+from app.database import SessionLocal
+from app.main import app
+from app.models.mentorship import Mentorship
+from app.utils.chat_hub import BrokerPubSub, ChatHub, run_broker
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _pair():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Socket Mentor")
+        mentee = make_user(db, "mentee", "Socket Mentee")
+        db.add(Mentorship(mentor_id=mentor, mentee_id=mentee, status="active"))
+        db.commit()
+        return mentor, mentee
+    finally:
+        db.close()
+
+
+def test_socket_rejects_missing_or_bad_token():
+    for url in ("/chat/ws", "/chat/ws?token=not-a-jwt"):
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            with client.websocket_connect(url):
+                pass
+        assert excinfo.value.code == 1008
+
+
+def test_sent_message_is_pushed_to_connected_recipient():
+    mentor, mentee = _pair()
+    token = create_access_token(mentor)
+    with client.websocket_connect(f"/chat/ws?token={token}") as socket:
+        assert socket.receive_json() == {"type": "ready", "user_id": mentor}
+        socket.send_json({"type": "ping"})
+        assert socket.receive_json() == {"type": "pong"}
+
+        res = client.post("/chat/messages", json={"recipient_id": mentor, "content": " hi there "}, headers=auth_headers(mentee))
+        assert res.status_code == 201
+
+        event = socket.receive_json()
+        assert event["type"] == "message"
+        assert event["message"]["id"] == res.json()["id"]
+        assert event["message"]["sender_id"] == mentee
+        assert event["message"]["content"] == "hi there"
+
+
+def test_socket_accepts_bearer_header():
+    mentor, _ = _pair()
+    with client.websocket_connect("/chat/ws", headers=auth_headers(mentor)) as socket:
+        assert socket.receive_json()["type"] == "ready"
+
+
+def test_broker_fans_out_between_workers():
+    async def scenario():
+        ready = asyncio.get_running_loop().create_future()
+        broker = asyncio.create_task(run_broker("127.0.0.1", 0, ready))
+        port = await ready
+        first, second = ChatHub(BrokerPubSub("127.0.0.1", port)), ChatHub(BrokerPubSub("127.0.0.1", port))
+        try:
+            for hub in (first, second):
+                await hub.start()
+                await asyncio.wait_for(hub.backend.connected.wait(), 5)
+            on_second = second.connect(7)
+            on_first = first.connect(7)
+            elsewhere = second.connect(8)
+
+            first.publish([7], {"type": "message", "n": 1})
+            assert await asyncio.wait_for(on_second.queue.get(), 5) == {"type": "message", "n": 1}
+            assert await asyncio.wait_for(on_first.queue.get(), 5) == {"type": "message", "n": 1}
+            assert elsewhere.queue.empty()
+        finally:
+            for hub in (first, second):
+                await hub.stop()
+            broker.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_slow_socket_is_cut_off(monkeypatch):
+    monkeypatch.setattr("app.utils.chat_hub.CHAT_WS_QUEUE_SIZE", 2)
+
+    async def scenario():
+        hub = ChatHub()
+        connection = hub.connect(1)
+        for n in range(5):
+            hub.publish([1], {"n": n})
+        await asyncio.sleep(0)
+        return [connection.queue.get_nowait() for _ in range(connection.queue.qsize())]
+
+    assert asyncio.run(scenario()) == [{"n": 0}, {"n": 1}, None]
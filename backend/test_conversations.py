@@ -0,0 +1,141 @@
+"""
+Conversation summary tests (run with pytest from backend/).
+"""
+from datetime import date, datetime, time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert, select
+
+from app.database import SessionLocal, engine
+from app.main import app
+from app.migrations import migrate
+from app.models.booking import Booking
+from app.models.conversation import Conversation
+from app.models.mentorship import Mentorship
+from app.models.message import Message
+from app.models.profile import MenteeProfile
+from app.models.user import User
+from app.utils.conversations import chat_allowed, pair_key
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _conversation(db, a: int, b: int) -> Conversation:
+    low, high = pair_key(a, b)
+    return db.query(Conversation).filter(
+        Conversation.user_low_id == low, Conversation.user_high_id == high,
+    ).one()
+
+
+def test_conversations_are_opened_on_write_and_listed_in_one_query():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "List Mentor")
+        mentee_a = make_user(db, "mentee", "Mentee A")
+        mentee_b = make_user(db, "mentee", "Mentee B")
+        stranger = make_user(db, "mentee", "Stranger")
+        db.add(MenteeProfile(user_id=mentee_b, name="Profile Name B"))
+        db.add(Mentorship(mentor_id=mentor, mentee_id=mentee_a, status="active"))
+        db.add(Booking(
+            mentee_id=mentee_b, mentor_id=mentor, session_date=date(2026, 2, 2), start_time=time(10),
+            end_time=time(11), duration_minutes=60, amount=50.0, status="requested",
+        ))
+        db.commit()
+        assert _conversation(db, mentor, mentee_b).chat_allowed
+    finally:
+        db.close()
+
+    assert client.post("/chat/messages", json={"recipient_id": mentor, "content": "hello"}, headers=auth_headers(mentee_a)).status_code == 201
+    assert client.post("/chat/messages", json={"recipient_id": mentor, "content": "x"}, headers=auth_headers(stranger)).status_code == 403
+
+    client.get("/chat/conversations", headers=auth_headers(mentor))  # warm the principal cache
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        res = client.get("/chat/conversations", headers=auth_headers(mentor))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert res.status_code == 200
+    assert [(c["other_user_id"], c["other_user_name"], c["last_message"]) for c in res.json()] == [
+        (mentee_a, "Mentee A", "hello"),
+        (mentee_b, "Profile Name B", None),
+    ]
+    assert len(statements) == 1
+
+
+def test_send_message_updates_last_message_and_unread_count():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Count Mentor")
+        mentee = make_user(db, "mentee", "Count Mentee")
+        db.add(Mentorship(mentor_id=mentor, mentee_id=mentee, status="active"))
+        db.commit()
+    finally:
+        db.close()
+
+    for text in ("one", "two", "three"):
+        assert client.post("/chat/messages", json={"recipient_id": mentor, "content": text}, headers=auth_headers(mentee)).status_code == 201
+    last = client.post("/chat/messages", json={"recipient_id": mentee, "content": "reply " * 40}, headers=auth_headers(mentor)).json()
+
+    db = SessionLocal()
+    try:
+        conversation = _conversation(db, mentor, mentee)
+        unread = {conversation.user_low_id: conversation.unread_low, conversation.user_high_id: conversation.unread_high}
+        assert unread == {mentor: 3, mentee: 1}
+        assert conversation.last_message_id == last["id"]
+        assert len(conversation.last_message_preview) == 140
+    finally:
+        db.close()
+
+
+def test_migration_backfills_existing_pairs(tmp_path):
+    schema = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    migrate(schema, target=7)
+    with schema.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": i, "email": f"u{i}@example.com", "password": "x", "role": "mentor" if i == 1 else "mentee"}
+            for i in (1, 2, 3)
+        ])
+        conn.execute(insert(Mentorship).values(mentor_id=1, mentee_id=3, status="active"))
+        conn.execute(insert(Message), [
+            {"sender_id": 3, "recipient_id": 1, "content": "first", "created_at": datetime(2026, 1, 1)},
+            {"sender_id": 1, "recipient_id": 3, "content": "second", "created_at": datetime(2026, 1, 2)},
+            {"sender_id": 2, "recipient_id": 1, "content": "orphan", "created_at": datetime(2026, 1, 3)},
+        ])
+
+    migrate(schema)
+    with schema.connect() as conn:
+        rows = conn.execute(select(
+            Conversation.user_low_id, Conversation.user_high_id, Conversation.chat_allowed, Conversation.last_message_preview,
+        ).order_by(Conversation.user_low_id, Conversation.user_high_id)).all()
+    assert [tuple(row) for row in rows] == [(1, 2, False, "orphan"), (1, 3, True, "second")]
+
+
+def test_chat_permission_is_cached_and_new_bookings_apply_at_once():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Perm Mentor")
+        mentee = make_user(db, "mentee", "Perm Mentee")
+
+        assert chat_allowed(db, mentee, mentor) is False  # refusals are not cached
+        db.add(Booking(
+            mentee_id=mentee, mentor_id=mentor, session_date=date(2026, 3, 3), start_time=time(9),
+            end_time=time(10), duration_minutes=60, amount=50.0, status="requested",
+        ))
+        db.commit()
+        assert chat_allowed(db, mentee, mentor) is True
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            assert chat_allowed(db, mentor, mentee) is True
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        assert statements == []
+        assert chat_allowed(db, mentor, mentor) is False
+    finally:
+        db.close()
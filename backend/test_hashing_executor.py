@@ -0,0 +1,84 @@
+"""
+Password hashing executor tests (run with pytest from backend/).
+"""
+import asyncio
+import threading
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.auth import hash_password, verify_password_async
+from app.database import SessionLocal
+from app.main import app
+from app.models.user import User
+from app.utils.hashing_executor import HashingExecutor, hashing_executor
+
+client = TestClient(app)
+
+
+def test_hashing_runs_off_the_event_loop():
+    hashed = hash_password("secret")
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        ok = await verify_password_async("secret", hashed)
+        task.cancel()
+        return ok, ticks
+
+    ok, ticks = asyncio.run(scenario())
+    assert ok
+    # The loop kept running while bcrypt worked on the pool.
+    assert ticks > 5
+
+
+def test_queue_limit_rejects_with_503_and_reports_metrics():
+    executor = HashingExecutor(workers=1, max_queue=1, kind="thread")
+    release = threading.Event()
+
+    def blocked(value):
+        release.wait(5)
+        return value
+
+    async def scenario():
+        first = asyncio.create_task(executor.run(blocked, 1))
+        second = asyncio.create_task(executor.run(blocked, 2))
+        await asyncio.sleep(0.05)
+        metrics = executor.metrics()
+        with pytest.raises(HTTPException) as rejected:
+            await executor.run(blocked, 3)
+        release.set()
+        return await first, await second, metrics, rejected.value
+
+    first, second, metrics, rejected = asyncio.run(scenario())
+    executor.shutdown()
+    assert (first, second) == (1, 2)
+    assert metrics["in_flight"] == 1 and metrics["queued"] == 1
+    assert rejected.status_code == 503
+    final = executor.metrics()
+    assert final["completed"] == 2 and final["rejected"] == 1 and final["max_queue_depth"] == 1
+
+
+def test_login_awaits_the_hashing_pool():
+    email = f"hash-{uuid.uuid4().hex[:8]}@example.com"
+    db = SessionLocal()
+    try:
+        db.add(User(email=email, full_name="Hash User", role="mentee", password=hash_password("pw")))
+        db.commit()
+    finally:
+        db.close()
+
+    before = hashing_executor.metrics()["completed"]
+    assert client.post("/auth/login", json={"email": email, "password": "pw"}).status_code == 200
+    assert client.post("/auth/login", json={"email": email, "password": "nope"}).status_code == 401
+    metrics = client.get("/auth/hashing/metrics").json()
+    assert metrics["completed"] == before + 2
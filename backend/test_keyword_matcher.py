@@ -0,0 +1,62 @@
+"""
+Intake keyword matcher tests (run with pytest from backend/).
+"""
+import random
+
+from app.utils.ai_agent import EnhancedIntakeAgent, KeywordMatcher, step_matcher
+
+FLOW = EnhancedIntakeAgent.CONVERSATION_FLOW
+
+
+def _extract(step: int, text: str):
+    return EnhancedIntakeAgent().extract_keywords(text, FLOW[step]["keywords"])
+
+
+def test_numbers_do_not_match_inside_longer_numbers():
+    assert _extract(7, "About 10 hours a week") is None
+    assert _extract(7, "1 hour a week") == "1hr/week"
+    assert _extract(9, "Within 12 months") == "12_months"
+    assert _extract(8, "Around $100/hour") == "100+"
+    assert _extract(8, "$50-100/hour") == "50-100"
+
+
+def test_keywords_must_start_a_word():
+    assert _extract(0, "I want to renew my skills") is None
+    assert _extract(0, "I'm new to the industry") == "early_career"
+    # Inflected forms still match.
+    assert _extract(1, "Managing a team of five") == "leadership"
+    assert _extract(6, "Engineering") == "Engineering"
+
+
+def test_leftmost_then_longest_keyword_wins():
+    assert _extract(0, "Switching careers after years as a senior engineer") == "career_change"
+    assert _extract(0, "Senior engineer planning a switch") == "senior"
+    assert _extract(1, "A new role in product") == "career_transition"
+    assert KeywordMatcher({"new": "a", "new role": "b"}).find("new roles") == "b"
+
+
+def test_parse_response_uses_compiled_step_matchers():
+    agent = EnhancedIntakeAgent()
+    assert agent.parse_response(0, "Mid-level developer")["welcome"] == "mid_level"
+    assert agent.parse_response(11, "Mostly Zoom calls")["communication"] == "video"
+    assert agent.parse_response(11, "No preference")["communication"] == "No preference"
+
+
+def test_extract_skills_splits_and_drops_filler_words():
+    skills = EnhancedIntakeAgent().extract_skills("Python, Machine Learning and SQL\n• Public Speaking - Go")
+    assert skills == ["Python", "Machine Learning  Sql", "Public Speaking"]
+
+
+def test_long_answers_match_a_single_full_search():
+    rng = random.Random(10)
+    pieces = ["x", " ", ".", "1", "10", "new", "renew", "8+", "0-3", "senior", "mid", "switch", "$", "\n",
+              "é", "\u0130", "\u212a"]  # non-ASCII, including two that lowercase to ASCII letters
+    steps = [question["step"] for question in FLOW if "keywords" in question]
+    for _ in range(3000):
+        step = rng.choice(steps)
+        matcher = step_matcher(step)
+        keywords = list(FLOW[step]["keywords"])
+        text = "".join(rng.choice(pieces + keywords) if rng.random() < 0.2 else rng.choice("ab c")
+                       for _ in range(rng.randint(100, 200)))
+        expected = matcher.pattern.search(" " + text.lower())
+        assert matcher.find(text) == (matcher.values[expected.group(1)] if expected else None)
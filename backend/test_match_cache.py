@@ -0,0 +1,135 @@
+"""
+Match cache tests (run with pytest from backend/).
+"""
+import uuid
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import SessionLocal, engine
+from app.main import app
+from app.models.mentee_intake import MentorMatch
+from app.utils.ai_agent import IntakeFeatures, MentorFeatures, score_match_features
+from app.utils.match_cache import MatchCache, intake_version, save_matches
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _mentor_body(name: str, skills: str, rate: float = 40) -> dict:
+    return {
+        "full_name": name,
+        "domains": "Software Engineering",
+        "skills": skills,
+        "years_experience": 5,
+        "bio": "",
+        "hourly_rate": rate,
+        "availability": "weekends",
+    }
+
+
+def _features(profile_id: int, user_id: int, skills: str) -> MentorFeatures:
+    return MentorFeatures(SimpleNamespace(
+        id=profile_id, user_id=user_id, full_name=f"Mentor {user_id}", domains="", skills=skills,
+        years_experience=5, bio="", hourly_rate=40, availability=None, is_verified=False,
+    ))
+
+
+def _intake(skills: str) -> SimpleNamespace:
+    return SimpleNamespace(desired_skills=skills, industry_interest=None, career_stage="mid_level",
+                           budget_range="0-50", primary_goal="skill_development")
+
+
+def test_mentor_change_only_drops_affected_entries():
+    cache = MatchCache()
+    strong = _features(1, 101, "haskell")
+    weak = _features(2, 102, "cooking")
+    for mentee_id, skills in [(1, "haskell"), (2, "cooking")]:
+        intake = _intake(skills)
+        features = IntakeFeatures(intake)
+        mentor = strong if skills == "haskell" else weak
+        top = [score_match_features(features, mentor) + (mentor,)]
+        cache.put(mentee_id, intake_version(intake), features, 7, 1, 30, top)
+
+    # Mentor 102 gains nothing relevant to mentee 1 but is in mentee 2's results.
+    cache.mentor_changed(102, _features(2, 102, "baking"), 7, 8)
+    assert cache.get(1, intake_version(_intake("haskell")), 8, 1, 30) is not None
+    assert cache.get(2, intake_version(_intake("cooking")), 8, 1, 30) is None
+
+    # A new mentor that could outrank the cached top result drops the entry.
+    cache.mentor_changed(103, _features(3, 103, "haskell"), 8, 9)
+    assert cache.get(1, intake_version(_intake("haskell")), 9, 1, 30) is None
+
+
+def test_entry_misses_on_new_intake_or_catalog_version():
+    cache = MatchCache()
+    intake = _intake("haskell")
+    cache.put(5, intake_version(intake), IntakeFeatures(intake), 3, 5, 30, [])
+    assert cache.get(5, intake_version(intake), 3, 5, 30) == []
+    assert cache.get(5, intake_version(intake), 4, 5, 30) is None
+    assert cache.get(5, intake_version(_intake("rust")), 3, 5, 30) is None
+    assert cache.get(5, intake_version(intake), 3, 10, 30) is None
+
+
+def test_save_matches_upserts_existing_rows():
+    db = SessionLocal()
+    try:
+        mentee = make_user(db, "mentee", "Upsert Mentee")
+        mentors = [make_user(db, "mentor", f"Upsert Mentor {i}") for i in range(3)]
+        db.add(MentorMatch(mentee_id=mentee, mentor_id=mentors[0], match_score=10, match_reasons=[],
+                           match_metadata={}, is_viewed=True))
+        db.commit()
+
+        top = [(80 - i, [f"reason {i}"], {"rank": i}, _features(i + 1, uid, "x")) for i, uid in enumerate(mentors)]
+        save_matches(db, mentee, top)
+        db.commit()
+
+        rows = db.query(MentorMatch).filter(MentorMatch.mentee_id == mentee).order_by(MentorMatch.mentor_id).all()
+        assert [(r.mentor_id, r.match_score) for r in rows] == [(mentors[0], 80), (mentors[1], 79), (mentors[2], 78)]
+        assert rows[0].is_viewed is True
+        assert rows[0].match_reasons == ["reason 0"]
+    finally:
+        db.close()
+
+
+def test_matches_route_serves_cached_results_until_intake_or_mentor_changes():
+    skill = f"skill{uuid.uuid4().hex[:6]}"
+    db = SessionLocal()
+    try:
+        mentee = make_user(db, "mentee", "Cache Mentee")
+        mentors = [make_user(db, "mentor", f"Cache Mentor {i}") for i in range(2)]
+    finally:
+        db.close()
+
+    for i, mentor in enumerate(mentors):
+        assert client.post("/profiles/mentor", json=_mentor_body(f"Cache Mentor {i}", skill), headers=auth_headers(mentor)).status_code == 200
+    intake = {"desired_skills": skill, "career_stage": "mid_level", "budget_range": "0-50"}
+    assert client.post("/ai-agent/intake", json=intake, headers=auth_headers(mentee)).status_code == 201
+
+    first = client.get("/ai-agent/matches?limit=2&min_score=40", headers=auth_headers(mentee))
+    assert first.status_code == 200
+    assert [m["mentor_id"] for m in first.json()] == mentors
+
+    statements = []
+    listener = lambda *args, **kwargs: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        second = client.get("/ai-agent/matches?limit=2&min_score=40", headers=auth_headers(mentee))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert second.json() == first.json()
+    # Auth user + intake lookups only: no scoring writes.
+    assert not any("mentor_matches" in sql for sql in statements)
+
+    # Mentor 0 drops the skill: the cached entry is replaced.
+    assert client.put("/profiles/mentor", json=_mentor_body("Cache Mentor 0", "knitting"), headers=auth_headers(mentors[0])).status_code == 200
+    third = client.get("/ai-agent/matches?limit=2&min_score=40", headers=auth_headers(mentee))
+    assert [m["mentor_id"] for m in third.json()] == [mentors[1]]
+
+    db = SessionLocal()
+    try:
+        rows = db.query(MentorMatch).filter(MentorMatch.mentee_id == mentee).all()
+        assert sorted(r.mentor_id for r in rows) == sorted(mentors)
+    finally:
+        db.close()
@@ -0,0 +1,181 @@
+"""
+Background re-matching worker tests (run with pytest from backend/).
+"""
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.database import SessionLocal
+from app.main import app
+from app.models.mentee_intake import MatchJob, MentorMatch
+from app.utils import match_worker as match_worker_module
+from app.utils.match_cache import match_cache
+from app.utils.match_worker import MatchWorker, enqueue_match_job, match_worker, prune_finished_jobs
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+def _mentor_body(name: str, skills: str) -> dict:
+    return {
+        "full_name": name,
+        "domains": "Software Engineering",
+        "skills": skills,
+        "years_experience": 5,
+        "bio": "",
+        "hourly_rate": 40,
+        "availability": "weekends",
+    }
+
+
+def _job(job_id: int) -> MatchJob:
+    db = SessionLocal()
+    try:
+        return db.get(MatchJob, job_id)
+    finally:
+        db.close()
+
+
+def _enqueue(kind: str, target_id: int) -> int:
+    db = SessionLocal()
+    try:
+        enqueue_match_job(db, kind, target_id)
+        return db.query(MatchJob.id).filter(MatchJob.kind == kind, MatchJob.target_id == target_id).order_by(
+            MatchJob.id.desc()
+        ).first()[0]
+    finally:
+        db.close()
+
+
+def test_matches_are_served_from_precomputed_rows():
+    skill = f"skill{uuid.uuid4().hex[:6]}"
+    db = SessionLocal()
+    try:
+        mentee = make_user(db, "mentee", "Worker Mentee")
+        mentors = [make_user(db, "mentor", f"Worker Mentor {i}") for i in range(3)]
+    finally:
+        db.close()
+
+    for i, mentor in enumerate(mentors):
+        client.post("/profiles/mentor", json=_mentor_body(f"Worker Mentor {i}", skill), headers=auth_headers(mentor))
+    intake = {"desired_skills": skill, "career_stage": "mid_level", "budget_range": "0-50"}
+    client.post("/ai-agent/intake", json=intake, headers=auth_headers(mentee))
+    assert client.get("/ai-agent/matches/status", headers=auth_headers(mentee)).json()["status"] == "pending"
+
+    match_worker.run_pending()
+    assert client.get("/ai-agent/matches/status", headers=auth_headers(mentee)).json()["status"] == "done"
+
+    db = SessionLocal()
+    try:
+        stored = db.query(MentorMatch).filter(MentorMatch.mentee_id == mentee, MentorMatch.mentor_id.in_(mentors)).count()
+        assert stored == 3
+    finally:
+        db.close()
+
+    match_cache.clear()
+    served = client.get("/ai-agent/matches?limit=3&min_score=40", headers=auth_headers(mentee)).json()
+    assert [m["mentor_id"] for m in served] == mentors
+    assert all(m["match_reasons"] for m in served)
+
+    # A mentor edit queues a fan-out; until it has run the route computes live.
+    client.put("/profiles/mentor", json=_mentor_body("Worker Mentor 0", "knitting"), headers=auth_headers(mentors[0]))
+    live = client.get("/ai-agent/matches?limit=3&min_score=40", headers=auth_headers(mentee)).json()
+    assert [m["mentor_id"] for m in live] == mentors[1:]
+
+    match_worker.run_pending()
+    match_cache.clear()
+    served = client.get("/ai-agent/matches?limit=3&min_score=40", headers=auth_headers(mentee)).json()
+    assert [m["mentor_id"] for m in served] == mentors[1:]
+
+
+def test_unrelated_mentor_fan_out_keeps_precomputed_serving(monkeypatch):
+    monkeypatch.setattr(match_worker_module, "MATCH_PRECOMPUTE_LIMIT", 2)
+    skill = f"skill{uuid.uuid4().hex[:6]}"
+    db = SessionLocal()
+    try:
+        mentee = make_user(db, "mentee", "Scoped Mentee")
+        mentors = [make_user(db, "mentor", f"Scoped Mentor {i}") for i in range(3)]
+        outsider = make_user(db, "mentor", "Outsider Mentor")
+    finally:
+        db.close()
+
+    for i, mentor in enumerate(mentors):
+        client.post("/profiles/mentor", json=_mentor_body(f"Scoped Mentor {i}", skill), headers=auth_headers(mentor))
+    client.post("/ai-agent/intake", json={"desired_skills": skill, "career_stage": "mid_level", "budget_range": "0-50"},
+                headers=auth_headers(mentee))
+    match_worker.run_pending()
+
+    # A new mentor who cannot reach this mentee's top 2 queues a fan-out.
+    client.post("/profiles/mentor", json=_mentor_body("Outsider Mentor", "knitting"), headers=auth_headers(outsider))
+
+    def live_scoring(db):
+        raise AssertionError("served by live scoring")
+
+    monkeypatch.setattr(match_worker_module.mentor_index, "ensure_fresh", live_scoring)
+    served = client.get("/ai-agent/matches?limit=2&min_score=40", headers=auth_headers(mentee)).json()
+    assert [m["mentor_id"] for m in served] == mentors[:2]
+    match_worker.run_pending()
+
+
+def test_prune_keeps_recent_and_latest_jobs():
+    old = datetime.utcnow() - timedelta(days=30)
+    db = SessionLocal()
+    try:
+        jobs = [
+            MatchJob(kind="mentee", target_id=-1, status="done", created_at=old),     # superseded, old
+            MatchJob(kind="mentee", target_id=-1, status="failed", created_at=old),   # superseded, old
+            MatchJob(kind="mentee", target_id=-1, status="done"),                     # superseded, recent
+            MatchJob(kind="mentee", target_id=-1, status="done", created_at=old),     # latest
+            MatchJob(kind="mentor", target_id=-1, status="pending", created_at=old),  # unfinished
+            MatchJob(kind="mentor", target_id=-1, status="done", created_at=old),     # latest
+        ]
+        db.add_all(jobs)
+        db.commit()
+        ids = [job.id for job in jobs]
+
+        assert prune_finished_jobs(db, retention_seconds=7 * 24 * 3600) == 2
+        remaining = [job_id for (job_id,) in db.query(MatchJob.id).filter(MatchJob.target_id == -1).order_by(MatchJob.id)]
+        assert remaining == ids[2:]
+    finally:
+        db.close()
+
+
+def test_failed_jobs_are_retried_then_marked_failed(monkeypatch):
+    calls = []
+
+    def boom(db, target_id):
+        calls.append(target_id)
+        raise RuntimeError("scorer unavailable")
+
+    monkeypatch.setitem(match_worker_module.JOB_HANDLERS, "flaky", boom)
+    monkeypatch.setattr(match_worker_module, "MATCH_JOB_RETRY_SECONDS", 0)
+    job_id = _enqueue("flaky", 42)
+
+    worker = MatchWorker(threads=1)
+    worker.run_pending()
+
+    job = _job(job_id)
+    assert job.status == "failed"
+    assert job.attempts == match_worker_module.MATCH_JOB_MAX_ATTEMPTS
+    assert "scorer unavailable" in job.last_error
+    assert calls == [42] * match_worker_module.MATCH_JOB_MAX_ATTEMPTS
+
+
+def test_shutdown_drains_running_jobs(monkeypatch):
+    started = threading.Event()
+
+    def slow(db, target_id):
+        started.set()
+        time.sleep(0.3)
+
+    monkeypatch.setitem(match_worker_module.JOB_HANDLERS, "slow", slow)
+    job_id = _enqueue("slow", 7)
+
+    worker = MatchWorker(threads=1, poll_seconds=0.05)
+    worker.start()
+    assert started.wait(5)
+    assert worker.shutdown(timeout=5)
+    assert _job(job_id).status == "done"
@@ -0,0 +1,86 @@
+"""
+Mentor search index tests (run with pytest from backend/).
+"""
+import random
+from types import SimpleNamespace
+
+from app.utils.ai_agent import IntakeFeatures, calculate_enhanced_match_score
+from app.utils.mentor_index import MentorSearchIndex
+
+SKILLS = ["python", "java", "javascript", "machine learning", "ml", "sql", "react", "go", "leadership", "data analysis"]
+DOMAINS = [None, "Tech, Finance", "Software Engineering", "AI", "Healthcare", "Marketing / Growth"]
+BIOS = [None, "", "I teach and lead teams", "Startup founder in fintech", "Career pivot coach", "Data scientist at a bank"]
+
+
+def _profile(rng, profile_id):
+    skills = None if rng.random() < 0.1 else ", ".join(rng.sample(SKILLS, rng.randint(0, 3)))
+    return SimpleNamespace(
+        id=profile_id,
+        user_id=1000 + profile_id,
+        full_name=f"Mentor {profile_id}",
+        domains=rng.choice(DOMAINS),
+        skills=skills,
+        years_experience=rng.choice([None, 0, 2, 5, 12, 40]),
+        bio=rng.choice(BIOS),
+        hourly_rate=rng.choice([None, 0, 25, 50.0, 75, 150]),
+        availability=None,
+        is_verified=rng.choice([True, False]),
+    )
+
+
+def _intake(rng):
+    return SimpleNamespace(
+        desired_skills=", ".join(rng.sample(SKILLS + ["scala", "py", "data"], rng.randint(1, 3))),
+        industry_interest=rng.choice([None, "Software Engineering", "Tech", "ai", "Finance", "Biotech"]),
+        career_stage=rng.choice(["student", "early_career", "mid_level", "senior", "career_change", None]),
+        budget_range=rng.choice(["free", "0-50", "50-100", "100+", None]),
+        primary_goal=rng.choice(["skill_development", "career_transition", "leadership", "entrepreneurship", None]),
+    )
+
+
+def _full_scan(profiles, intake, limit, min_score):
+    matches = []
+    for profile in profiles:
+        score, reasons, _ = calculate_enhanced_match_score(intake, profile)
+        if score >= min_score:
+            matches.append((profile.user_id, score, reasons))
+    matches.sort(key=lambda m: m[1], reverse=True)
+    return matches[:limit]
+
+
+def test_top_matches_agree_with_full_scan():
+    rng = random.Random(3)
+    profiles = [_profile(rng, i) for i in range(1, 121)]
+    index = MentorSearchIndex()
+    index.rebuild(profiles)
+
+    for _ in range(200):
+        intake = _intake(rng)
+        limit, min_score = rng.choice([1, 5, 20]), rng.choice([0, 30, 55, 70])
+        top = index.top_matches(IntakeFeatures(intake), limit, min_score)
+        assert [(f.user_id, score, reasons) for score, reasons, _, f in top] == _full_scan(profiles, intake, limit, min_score)
+
+
+def test_upsert_and_remove_keep_postings_current():
+    rng = random.Random(5)
+    profiles = {i: _profile(rng, i) for i in range(1, 41)}
+    index = MentorSearchIndex()
+    index.rebuild(profiles.values())
+    version = index.version
+
+    profiles[7].skills = "Rust, Embedded Systems"
+    index.upsert(profiles[7])
+    removed = profiles.pop(9)
+    index.remove(removed.user_id)
+    assert index.version == version + 2
+
+    intake = SimpleNamespace(desired_skills="rust", industry_interest=None, career_stage=None,
+                             budget_range=None, primary_goal=None)
+    # Mentors with an empty skills entry partially match every desired skill.
+    blank_skills = {p.user_id for p in profiles.values() if "" in [s.strip() for s in (p.skills or "").split(",")]}
+    assert index.candidates(IntakeFeatures(intake)) == {profiles[7].user_id} | blank_skills
+
+    for _ in range(50):
+        intake = _intake(rng)
+        top = index.top_matches(IntakeFeatures(intake), 10, 30)
+        assert [(f.user_id, score, reasons) for score, reasons, _, f in top] == _full_scan(profiles.values(), intake, 10, 30)
@@ -0,0 +1,92 @@
+"""
+Migration runner tests (run with pytest from backend/).
+"""
+from sqlalchemy import create_engine, event, inspect, text
+
+from app.migrations import current_version, ensure_schema, latest_version, migrate, status
+from app.migrations.__main__ import main as cli
+
+
+def _engine(tmp_path, name="schema.db"):
+    return create_engine(f"sqlite:///{tmp_path / name}")
+
+
+def test_fresh_database_migrates_to_latest(tmp_path):
+    engine = _engine(tmp_path)
+    assert current_version(engine) == 0
+
+    applied = migrate(engine)
+    assert [m.version for m in applied] == list(range(1, latest_version() + 1))
+    assert current_version(engine) == latest_version()
+
+    tables = set(inspect(engine).get_table_names())
+    assert {"users", "bookings", "payments", "mentor_matches", "schema_version"} <= tables
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM notes")).scalar() == 1
+
+    assert migrate(engine) == []
+    assert all(row["applied"] for row in status(engine))
+
+
+def test_legacy_database_gets_missing_columns(tmp_path):
+    engine = _engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR, password VARCHAR, role VARCHAR)"))
+
+    migrate(engine)
+    columns = {col["name"] for col in inspect(engine).get_columns("users")}
+    assert {"full_name", "reset_token", "reset_token_expiry"} <= columns
+
+
+def test_up_to_date_startup_check_is_one_query(tmp_path):
+    engine = _engine(tmp_path)
+    migrate(engine)
+
+    statements = []
+    listener = lambda *args, **kwargs: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        ensure_schema(engine)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert len(statements) == 1
+    assert "schema_version" in statements[0]
+
+
+def test_cli_upgrade_to_target_and_status(tmp_path, monkeypatch, capsys):
+    engine = _engine(tmp_path)
+    monkeypatch.setattr("app.migrations.__main__.engine", engine)
+
+    cli(["upgrade", "--target", "2"])
+    assert current_version(engine) == 2
+
+    cli(["status"])
+    out = capsys.readouterr().out
+    assert "[x] 0002" in out
+    assert "[ ] 0003" in out
+
+
+def test_version_7_database_with_messages_upgrades(tmp_path):
+    engine = _engine(tmp_path)
+    migrate(engine, target=7)
+    with engine.begin() as conn:
+        # messages as it was before the pair-key columns
+        conn.execute(text("DROP TABLE messages"))
+        conn.execute(text(
+            "CREATE TABLE messages (id INTEGER PRIMARY KEY, sender_id INTEGER NOT NULL, "
+            "recipient_id INTEGER NOT NULL, content TEXT NOT NULL, created_at DATETIME NOT NULL)"
+        ))
+        conn.execute(text("INSERT INTO users (id, email, password, role) VALUES (1, 'a@x', 'x', 'mentor'), (2, 'b@x', 'x', 'mentee')"))
+        conn.execute(text("INSERT INTO mentorships (mentor_id, mentee_id, status) VALUES (1, 2, 'active')"))
+        conn.execute(text(
+            "INSERT INTO messages (sender_id, recipient_id, content, created_at) VALUES "
+            "(2, 1, 'hello', '2026-01-01 00:00:00'), (1, 2, 'reply', '2026-01-02 00:00:00')"
+        ))
+
+    migrate(engine)
+    assert current_version(engine) == latest_version()
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT pair_low_id, pair_high_id FROM messages")).all() == [(1, 2), (1, 2)]
+        assert conn.execute(text(
+            "SELECT user_low_id, user_high_id, chat_allowed, last_message_preview FROM conversations"
+        )).all() == [(1, 2, 1, "reply")]
@@ -0,0 +1,46 @@
+"""
+Keyset pagination tests (run with pytest from backend/).
+"""
+from datetime import datetime, timedelta
+
+from fastapi import Response
+
+from app.database import SessionLocal
+from app.models.mentorship import MentorshipRequest
+from app.utils.pagination import NEXT_CURSOR_HEADER, PageParams, paginate
+from conftest import make_user
+
+REQUEST_SORT_KEY = [(MentorshipRequest.created_at, True), (MentorshipRequest.id, True)]
+
+
+def test_rows_with_null_sort_column_are_paged_once_and_last():
+    db = SessionLocal()
+    try:
+        mentor = make_user(db, "mentor", "Paging Mentor")
+        mentees = [make_user(db, "mentee", "Paging Mentee") for _ in range(7)]
+        created = [datetime(2026, 1, 1) + timedelta(hours=i) if i % 2 else None for i in range(7)]
+        requests = [
+            MentorshipRequest(mentor_id=mentor, mentee_id=mentee, status="pending", created_at=when)
+            for mentee, when in zip(mentees, created)
+        ]
+        db.add_all(requests)
+        db.commit()
+        # The column default fills created_at on insert; clear it for the legacy rows.
+        for request, when in zip(requests, created):
+            request.created_at = when
+        db.commit()
+
+        query = db.query(MentorshipRequest).filter(MentorshipRequest.mentor_id == mentor)
+        seen, cursor = [], None
+        while True:
+            response = Response()
+            seen.extend(paginate(query, REQUEST_SORT_KEY, PageParams(cursor=cursor, limit=2), response))
+            cursor = response.headers.get(NEXT_CURSOR_HEADER)
+            if cursor is None:
+                break
+
+        expected = sorted(requests, key=lambda r: (r.created_at is not None, r.created_at or datetime.min, r.id), reverse=True)
+        assert [r.id for r in seen] == [r.id for r in expected]
+        assert all(r.created_at is None for r in seen[3:])
+    finally:
+        db.close()
@@ -0,0 +1,67 @@
+"""
+Password hashing profile tests (run with pytest from backend/).
+"""
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth import BCRYPT_ROUNDS, build_crypt_context, password_needs_update, verify_password
+from app.database import SessionLocal
+from app.main import app
+from app.models.user import User
+
+client = TestClient(app)
+
+
+def _user_with_hash(hashed: str) -> tuple:
+    email = f"rehash-{uuid.uuid4().hex[:8]}@example.com"
+    db = SessionLocal()
+    try:
+        user = User(email=email, full_name="Rehash User", role="mentee", password=hashed)
+        db.add(user)
+        db.commit()
+        return user.id, email
+    finally:
+        db.close()
+
+
+def _stored_hash(user_id: int) -> str:
+    db = SessionLocal()
+    try:
+        return db.get(User, user_id).password
+    finally:
+        db.close()
+
+
+def test_bcrypt_cost_changes_in_either_direction_need_update():
+    cheap = build_crypt_context("bcrypt", bcrypt_rounds=4).hash("pw")
+    costly = build_crypt_context("bcrypt", bcrypt_rounds=BCRYPT_ROUNDS + 1).hash("pw")
+    assert password_needs_update(cheap)
+    assert password_needs_update(costly)
+    assert verify_password("pw", cheap)
+
+
+def test_login_rehashes_outdated_hash_in_background():
+    user_id, email = _user_with_hash(build_crypt_context("bcrypt", bcrypt_rounds=4).hash("pw"))
+
+    response = client.post("/auth/login", json={"email": email, "password": "pw"})
+    assert response.status_code == 200
+
+    upgraded = _stored_hash(user_id)
+    assert upgraded.startswith(f"$2b${BCRYPT_ROUNDS:02d}$")
+    assert not password_needs_update(upgraded)
+    assert client.post("/auth/login", json={"email": email, "password": "pw"}).status_code == 200
+    assert _stored_hash(user_id) == upgraded
+
+
+def test_argon2id_profile_verifies_and_upgrades_bcrypt():
+    pytest.importorskip("argon2")
+    context = build_crypt_context("argon2id", argon2_memory_kib=8192, argon2_time_cost=1, argon2_parallelism=1)
+    hashed = context.hash("pw")
+    assert hashed.startswith("$argon2id$")
+    assert not context.needs_update(hashed)
+
+    legacy = build_crypt_context("bcrypt", bcrypt_rounds=4).hash("pw")
+    assert context.verify("pw", legacy)
+    assert context.needs_update(legacy)
@@ -0,0 +1,61 @@
+"""
+Connection pool metrics tests (run with pytest from backend/).
+"""
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from app.database import SessionLocal, engine as app_engine
+from app.main import app
+from app.utils.pool_metrics import PoolMetrics, TimedQueuePool, pool_metrics
+
+client = TestClient(app)
+
+
+def test_health_endpoint_reports_pool_state():
+    before = pool_metrics.snapshot(app_engine)["checkouts"]
+    response = client.get("/health/db")
+    assert response.status_code == 200
+    body = response.json()
+    for key in ("checkouts", "checkout_timeouts", "overflow_connects", "checkout_wait_ms", "status"):
+        assert key in body
+
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+    finally:
+        db.close()
+    after = client.get("/health/db").json()
+    assert after["checkouts"] > before
+    assert after["checkout_wait_ms"]["samples"] > 0
+
+
+def test_overflow_and_timeouts_are_counted(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.1,
+    )
+    metrics = PoolMetrics()
+    metrics.attach(engine)
+    timeouts_before = pool_metrics.checkout_timeouts
+
+    first = engine.connect()
+    second = engine.connect()  # overflow connection
+    stats = metrics.snapshot(engine)
+    assert stats["checked_out"] == 2
+    assert stats["overflow"] == 1
+    assert stats["overflow_connects"] == 1
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    assert pool_metrics.checkout_timeouts == timeouts_before + 1
+
+    released = threading.Timer(0.02, second.close)
+    released.start()
+    with engine.connect() as third:
+        assert third.execute(text("SELECT 1")).scalar() == 1
+    released.join()
+    first.close()
+    engine.dispose()
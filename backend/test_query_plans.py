@@ -0,0 +1,169 @@
+"""
+Query plan regression tests (run with pytest from backend/).
+
+Seeds a migrated SQLite database, runs ANALYZE, and checks with EXPLAIN
+QUERY PLAN that the hot route queries search an index instead of
+scanning the table.
+"""
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import and_, create_engine, event, insert, or_, select
+
+from app.migrations import migrate
+from app.models.booking import Availability, BlockedDate, Booking
+from app.models.conversation import Conversation
+from app.models.feedback import SessionFeedback
+from app.models.mentorship import Mentorship, MentorshipRequest
+from app.models.message import Message
+from app.models.payment import Payment
+from app.models.user import User
+
+MENTORS = 40
+MENTEES = 120
+DAY = date(2026, 1, 5)
+
+
+def _seed(conn):
+    conn.execute(insert(User), [
+        {"id": i, "email": f"plan{i}@example.com", "password": "x", "role": "mentor" if i <= MENTORS else "mentee"}
+        for i in range(1, MENTORS + MENTEES + 1)
+    ])
+    bookings, payments, feedback, mentorships, requests = [], [], [], [], []
+    for n in range(2000):
+        mentor_id, mentee_id = n % MENTORS + 1, MENTORS + n % MENTEES + 1
+        bookings.append({
+            "id": n + 1, "mentor_id": mentor_id, "mentee_id": mentee_id,
+            "session_date": DAY + timedelta(days=n % 60), "start_time": time(9 + n % 8),
+            "end_time": time(10 + n % 8), "duration_minutes": 60, "status": "confirmed",
+            "amount": 50.0, "payment_intent_id": f"pi_{n}",
+        })
+        payments.append({
+            "booking_id": n + 1, "payment_intent_id": f"pi_{n}", "amount": 50.0, "status": "succeeded",
+            "platform_fee": 5.0, "mentor_payout": 45.0, "created_at": datetime(2026, 1, 1) + timedelta(hours=n),
+        })
+        feedback.append({
+            "booking_id": n + 1, "rating": 1 + n % 5, "mentee_id": mentee_id, "mentor_id": mentor_id,
+            "feedback_text": "ok", "created_at": datetime(2026, 1, 1) + timedelta(hours=n),
+        })
+        if n < 600:
+            mentorships.append({"mentor_id": mentor_id, "mentee_id": mentee_id, "status": "active"})
+            requests.append({"mentor_id": mentor_id, "mentee_id": mentee_id, "status": "accepted",
+                             "created_at": datetime(2026, 1, 1) + timedelta(hours=n)})
+    conn.execute(insert(Booking), bookings)
+    conn.execute(insert(Payment), payments)
+    conn.execute(insert(SessionFeedback), feedback)
+    conn.execute(insert(Mentorship), mentorships)
+    conn.execute(insert(MentorshipRequest), requests)
+    conn.execute(insert(Message), [
+        {"sender_id": b["mentor_id"], "recipient_id": b["mentee_id"], "content": "hi",
+         "pair_low_id": b["mentor_id"], "pair_high_id": b["mentee_id"]}
+        for b in bookings
+    ])
+    conn.execute(insert(Availability), [
+        {"mentor_id": m, "day_of_week": d, "start_time": time(9), "end_time": time(17), "is_active": True}
+        for m in range(1, MENTORS + 1) for d in range(7)
+    ])
+    conn.execute(insert(BlockedDate), [
+        {"mentor_id": m, "blocked_date": DAY + timedelta(days=d)}
+        for m in range(1, MENTORS + 1) for d in range(0, 60, 3)
+    ])
+    conn.exec_driver_sql("ANALYZE")
+
+
+@pytest.fixture(scope="module")
+def plan_conn(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+    migrate(engine)
+    with engine.begin() as conn:
+        _seed(conn)
+    with engine.connect() as conn:
+        yield conn
+    engine.dispose()
+
+
+def _plan(conn, stmt):
+    """EXPLAIN QUERY PLAN details for stmt, with binds processed as for a real execute."""
+    def explain(conn_, cursor, statement, parameters, context, executemany):
+        return "EXPLAIN QUERY PLAN " + statement, parameters
+
+    event.listen(conn, "before_cursor_execute", explain, retval=True)
+    try:
+        result = conn.execute(stmt)
+        return [row[3] for row in result.cursor.fetchall()]
+    finally:
+        event.remove(conn, "before_cursor_execute", explain)
+
+
+def _pair(model, a, b):
+    return or_(
+        and_(model.mentor_id == a, model.mentee_id == b),
+        and_(model.mentor_id == b, model.mentee_id == a),
+    )
+
+
+HOT_QUERIES = {
+    "booking conflict check": select(Booking.id).where(
+        Booking.mentor_id == 3, Booking.session_date == DAY, Booking.status.in_(["requested", "confirmed"]),
+        Booking.start_time < time(11), Booking.end_time > time(10),
+    ),
+    "mentee my-bookings page": select(Booking).where(Booking.mentee_id == 50).order_by(
+        Booking.session_date.desc(), Booking.start_time.desc(), Booking.id.desc()
+    ).limit(20),
+    "mentor my-bookings page": select(Booking).where(Booking.mentor_id == 3).order_by(
+        Booking.session_date.desc(), Booking.start_time.desc(), Booking.id.desc()
+    ).limit(20),
+    "bookings in a date range": select(Booking.session_date, Booking.start_time, Booking.end_time).where(
+        Booking.mentor_id == 3, Booking.session_date.between(DAY, DAY + timedelta(days=14)),
+        Booking.status.in_(["requested", "confirmed"]),
+    ),
+    "booking by payment intent": select(Booking).where(Booking.payment_intent_id == "pi_7"),
+    "availability overlap check": select(Availability).where(
+        Availability.mentor_id == 3, Availability.day_of_week == 2, Availability.is_active.is_(True),
+    ),
+    "my availability slots": select(Availability).where(Availability.mentor_id == 3).order_by(
+        Availability.day_of_week, Availability.start_time
+    ),
+    "multi-mentor availability": select(Availability).where(
+        Availability.mentor_id.in_([1, 2, 3]), Availability.is_active.is_(True),
+    ),
+    "blocked date check": select(BlockedDate).where(BlockedDate.mentor_id == 3, BlockedDate.blocked_date == DAY),
+    "blocked dates in range": select(BlockedDate.mentor_id, BlockedDate.blocked_date).where(
+        BlockedDate.mentor_id.in_([1, 2, 3]), BlockedDate.blocked_date.between(DAY, DAY + timedelta(days=14)),
+    ),
+    "mentor feedback page": select(SessionFeedback).where(
+        SessionFeedback.mentor_id == 3, SessionFeedback.rating > 0,
+    ).order_by(SessionFeedback.created_at.desc().nulls_last(), SessionFeedback.id.desc()).limit(20),
+    "feedback for booking": select(SessionFeedback).where(SessionFeedback.booking_id == 7),
+    "chat eligibility (mentorship)": select(Mentorship.id).where(_pair(Mentorship, 3, 50)).limit(1),
+    "chat eligibility (booking)": select(Booking.id).where(_pair(Booking, 3, 50)).limit(1),
+    "chat counterparts": select(Mentorship).where(or_(Mentorship.mentor_id == 3, Mentorship.mentee_id == 3)),
+    "active mentorships (mentee)": select(Mentorship).where(Mentorship.mentee_id == 50, Mentorship.status == "active"),
+    "active mentorships (mentor)": select(Mentorship).where(Mentorship.mentor_id == 3, Mentorship.status == "active"),
+    "pending request check": select(MentorshipRequest).where(
+        MentorshipRequest.mentee_id == 50, MentorshipRequest.mentor_id == 3, MentorshipRequest.status == "pending",
+    ),
+    "received requests page": select(MentorshipRequest).where(MentorshipRequest.mentor_id == 3).order_by(
+        MentorshipRequest.created_at.desc().nulls_last(), MentorshipRequest.id.desc()
+    ).limit(20),
+    "sent requests page": select(MentorshipRequest).where(MentorshipRequest.mentee_id == 50).order_by(
+        MentorshipRequest.created_at.desc().nulls_last(), MentorshipRequest.id.desc()
+    ).limit(20),
+    "conversation list": select(Conversation).where(
+        or_(Conversation.user_low_id == 3, Conversation.user_high_id == 3), Conversation.chat_allowed.is_(True),
+    ).order_by(Conversation.last_message_at.desc().nullslast()),
+    "chat history page": select(Message).where(
+        Message.pair_low_id == 3, Message.pair_high_id == 50, Message.id < 900,
+    ).order_by(Message.id.desc()).limit(100),
+    "payment for booking": select(Payment).where(Payment.booking_id == 7),
+    "mentor payment history": select(Payment).join(Booking).where(Booking.mentor_id == 3).order_by(
+        Payment.created_at.desc().nulls_last(), Payment.id.desc()
+    ).limit(20),
+}
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_an_index(plan_conn, name):
+    plan = _plan(plan_conn, HOT_QUERIES[name])
+    scans = [step for step in plan if step.startswith("SCAN ")]
+    assert not scans, f"{name} scans a table:\n" + "\n".join(plan)
@@ -0,0 +1,130 @@
+"""
+Read-replica routing tests (run with pytest from backend/).
+
+The "replica" is a second SQLite file with the same schema; statements are
+counted per engine to see where each read went.
+"""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import Base, SessionLocal, engine, replicas
+from app.main import app
+from app.utils.replicas import Replica, ReplicaSet
+from conftest import auth_headers, make_user
+
+client = TestClient(app)
+
+
+class _Statements:
+    """Record the SQL each engine runs inside a ``with`` block."""
+
+    def __init__(self, *engines):
+        self.sql = {e: [] for e in engines}
+        self._listeners = [(e, self._recorder(e)) for e in engines]
+
+    def _recorder(self, e):
+        return lambda conn, cursor, statement, *args: self.sql[e].append(statement)
+
+    def __enter__(self):
+        for e, fn in self._listeners:
+            event.listen(e, "before_cursor_execute", fn)
+        return self
+
+    def __exit__(self, *_exc):
+        for e, fn in self._listeners:
+            event.remove(e, "before_cursor_execute", fn)
+
+    def touching(self, e, table: str) -> list:
+        return [sql for sql in self.sql[e] if f"FROM {table}" in sql]
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    path = tmp_path / "replica.db"
+    replica_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=replica_engine)
+    replica = Replica("test-replica", replica_engine, create_async_engine(f"sqlite+aiosqlite:///{path}"))
+    monkeypatch.setattr(replicas, "replicas", [replica])
+    yield replica
+    replica_engine.dispose()
+
+
+def test_reads_go_to_the_replica(replica):
+    with _Statements(engine, replica.engine, replica.async_engine.sync_engine) as statements:
+        assert client.get("/profiles/mentors").status_code == 200
+        assert client.get("/feedback/mentor/1/ratings").status_code == 200
+
+    assert statements.touching(replica.engine, "mentor_profiles")
+    assert statements.touching(replica.async_engine.sync_engine, "session_feedback")
+    assert statements.touching(engine, "mentor_profiles") == []
+
+
+def test_users_read_their_own_writes_from_the_primary(replica):
+    db = SessionLocal()
+    try:
+        writer = make_user(db, "mentee", "Writer")
+        reader = make_user(db, "mentee", "Reader")
+    finally:
+        db.close()
+
+    # Any non-GET request counts as a write, whatever its outcome.
+    client.post("/chat/messages", json={"recipient_id": reader, "content": "hi"}, headers=auth_headers(writer))
+
+    with _Statements(engine, replica.engine) as statements:
+        assert client.get("/bookings/my-bookings", headers=auth_headers(writer)).status_code == 200
+    assert statements.touching(engine, "bookings")
+    assert statements.touching(replica.engine, "bookings") == []
+
+    with _Statements(engine, replica.engine) as statements:
+        assert client.get("/bookings/my-bookings", headers=auth_headers(reader)).status_code == 200
+    assert statements.touching(replica.engine, "bookings")
+    assert statements.touching(engine, "bookings") == []
+
+
+def test_unreachable_replica_falls_back_to_the_primary(tmp_path, monkeypatch):
+    broken = Replica("broken", create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"))
+    monkeypatch.setattr(replicas, "replicas", [broken])
+    db = SessionLocal()
+    try:
+        user_id = make_user(db, "mentor", "Fallback Mentor")
+    finally:
+        db.close()
+
+    with _Statements(engine) as statements:
+        assert client.get("/bookings/my-bookings", headers=auth_headers(user_id)).status_code == 200
+    assert statements.touching(engine, "bookings")
+    assert broken.failures == 1
+
+    health = client.get("/health/db").json()["read_replicas"]
+    assert health["replicas"][0]["healthy"] is False
+    assert health["replicas"][0]["failures"] >= 1
+
+
+def test_health_serves_cached_replica_state_without_probing(tmp_path, monkeypatch):
+    replica = Replica("replica", create_engine(f"sqlite:///{tmp_path / 'replica.db'}"))
+    monkeypatch.setattr(replicas, "replicas", [replica])
+
+    with _Statements(replica.engine) as statements:
+        health = client.get("/health/db").json()["read_replicas"]
+    assert statements.sql[replica.engine] == []
+    assert health["replicas"][0]["healthy"] is True
+
+
+def test_background_probe_takes_failed_replica_out_of_rotation(tmp_path):
+    probing = ReplicaSet(probe_seconds=0.01)
+    broken = probing.add("broken", create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"))
+    probing.start_probing()
+    try:
+        for _ in range(200):
+            if broken.failures:
+                break
+            time.sleep(0.01)
+    finally:
+        probing.stop_probing()
+    assert broken.failures >= 1
+    assert probing.status()["replicas"][0]["healthy"] is False
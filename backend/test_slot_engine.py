@@ -0,0 +1,76 @@
+"""
+Slot engine tests (run with pytest from backend/).
+"""
+import random
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+
+from app.utils.slot_engine import compute_available_slots
+
+
+def _window(dow, start, end):
+    return SimpleNamespace(day_of_week=dow, start_time=start, end_time=end)
+
+
+def _booking(day, start, end):
+    return SimpleNamespace(session_date=day, start_time=start, end_time=end)
+
+
+def _reference(start_date, end_date, windows, blocked, bookings):
+    """Direct per-slot / per-booking scan the engine must agree with."""
+    result = []
+    day = start_date
+    while day <= end_date:
+        if day not in blocked:
+            for w in windows:
+                if w.day_of_week != day.weekday():
+                    continue
+                if not any(b.session_date == day and b.start_time < w.end_time and b.end_time > w.start_time
+                           for b in bookings):
+                    result.append((day, w.start_time, w.end_time))
+        day += timedelta(days=1)
+    return result
+
+
+def test_matches_reference_scan_on_random_calendars():
+    rng = random.Random(7)
+    start = date(2025, 3, 3)
+    for _ in range(25):
+        windows = [
+            _window(rng.randrange(7), time(h, m), time(h + rng.randint(1, 3), m))
+            for h, m in ((rng.randrange(6, 18), rng.choice([0, 30])) for _ in range(10))
+        ]
+        bookings = [
+            _booking(start + timedelta(days=rng.randrange(21)), time(h, m), time(min(h + 1, 23), m))
+            for h, m in ((rng.randrange(6, 22), rng.choice([0, 15, 30, 45])) for _ in range(40))
+        ]
+        blocked = {start + timedelta(days=rng.randrange(21)) for _ in range(3)}
+        end = start + timedelta(days=20)
+
+        slots = compute_available_slots(start, end, windows, blocked, bookings)
+        assert [(s.date, s.start_time, s.end_time) for s in slots] == _reference(start, end, windows, blocked, bookings)
+
+
+def test_splits_windows_into_fixed_slots_around_bookings():
+    monday = date(2025, 3, 3)
+    windows = [_window(0, time(9, 0), time(12, 15))]
+    bookings = [_booking(monday, time(10, 0), time(11, 0))]
+
+    slots = compute_available_slots(monday, monday, windows, set(), bookings, slot_minutes=30)
+
+    assert [(s.start_time, s.end_time) for s in slots] == [
+        (time(9, 0), time(9, 30)),
+        (time(9, 30), time(10, 0)),
+        (time(11, 0), time(11, 30)),
+        (time(11, 30), time(12, 0)),
+    ]
+    assert {s.duration_minutes for s in slots} == {30}
+
+
+def test_blocked_dates_are_skipped():
+    monday = date(2025, 3, 3)
+    windows = [_window(0, time(9, 0), time(10, 0))]
+
+    slots = compute_available_slots(monday, monday + timedelta(days=7), windows, {monday}, [])
+
+    assert [s.date for s in slots] == [monday + timedelta(days=7)]
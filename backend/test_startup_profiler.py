@@ -0,0 +1,38 @@
+"""
+Cold-start tests (run with pytest from backend/).
+"""
+import os
+import subprocess
+import sys
+
+from app.database import DATABASE_URL
+from app.utils.startup_profiler import by_package, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 | app.main
+import time:       500 |        500 |   sqlalchemy.engine
+import time:        80 |         80 |     sqlalchemy.sql
+"""
+
+
+def test_parse_importtime_reads_nesting_and_times():
+    records = parse_importtime(SAMPLE)
+    assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+        ("_io", 120, 120, 1),
+        ("app.main", 300, 900, 0),
+        ("sqlalchemy.engine", 500, 500, 1),
+        ("sqlalchemy.sql", 80, 80, 2),
+    ]
+    assert by_package(records) == [("sqlalchemy", 580), ("app", 300), ("_io", 120)]
+
+
+def test_heavy_modules_are_not_imported_at_startup():
+    code = "import sys, app.main; print(sorted(m for m in ('stripe', 'aiosmtplib', 'numpy') if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        env={**os.environ, "DATABASE_URL": DATABASE_URL}, cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert proc.stdout.strip().splitlines()[-1] == "[]"
@@ -20,3 +20,22 @@ export async function loginUser(data) {
   });
   return res.json();
 }
+
+// List routes return one page per request (see backend app/utils/pagination.py).
+// Follow X-Next-Cursor until X-Has-More is "false" and return every row.
+export async function fetchAllPages(url, options = {}) {
+  const items = [];
+  let cursor = null;
+  for (;;) {
+    const pageUrl = new URL(url);
+    pageUrl.searchParams.set("limit", "200");
+    if (cursor) pageUrl.searchParams.set("cursor", cursor);
+    const res = await fetch(pageUrl, options);
+    if (!res.ok) return { ok: false, status: res.status, items };
+    items.push(...(await res.json()));
+    cursor = res.headers.get("X-Next-Cursor");
+    if (res.headers.get("X-Has-More") !== "true" || !cursor) {
+      return { ok: true, status: res.status, items };
+    }
+  }
+}
@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { API_BASE } from '../api';
+import { API_BASE, fetchAllPages } from '../api';
 import './BookingList.css';
 
 export default function BookingList() {
@@ -22,15 +22,14 @@ export default function BookingList() {
     try {
       const token = localStorage.getItem('token');
       const filterParam = filter !== 'all' ? `?status_filter=${filter}` : '';
-      const response = await fetch(`${API_BASE}/bookings/my-bookings${filterParam}`, {
+      const response = await fetchAllPages(`${API_BASE}/bookings/my-bookings${filterParam}`, {
         headers: {
           'Authorization': `Bearer ${token}`
         }
       });
 
       if (response.ok) {
-        const data = await response.json();
-        setBookings(data);
+        setBookings(response.items);
       } else if (response.status === 401) {
         localStorage.removeItem('token');
         localStorage.removeItem('role');
@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import { API_BASE } from '../api';
+import { API_BASE, fetchAllPages } from '../api';
 import BookingCalendar from '../components/BookingCalendar';
 import './BookMentor.css';
 
@@ -29,13 +29,13 @@ export default function BookMentor() {
         setMentor(data);
       } else if (response.status === 404) {
         // Backward-compatible fallback: older deployments may not have /profiles/mentor/{id}
-        const listRes = await fetch(`${API_BASE}/profiles/mentors`);
+        const listRes = await fetchAllPages(`${API_BASE}/profiles/mentors`);
         if (!listRes.ok) {
           setError('Mentor not found');
           return;
         }
 
-        const mentors = await listRes.json();
+        const mentors = listRes.items;
         const numericMentorId = Number(mentorId);
         const found = Array.isArray(mentors)
           ? mentors.find((m) => Number(m.user_id) === numericMentorId)
@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState } from 'react';
+import { useEffect, useMemo, useRef, useState } from 'react';
 import { API_BASE } from '../api';
 import './Chat.css';
 
@@ -23,20 +23,117 @@ export default function Chat() {
     }
   }, [token]);
 
+  const [socketOpen, setSocketOpen] = useState(false);
+  const selectedRef = useRef(selectedUserId);
+  selectedRef.current = selectedUserId;
+
   useEffect(() => {
     fetchConversations();
   }, []);
 
+  // New messages are pushed over /chat/ws; reconnect with backoff if it drops.
+  useEffect(() => {
+    if (!token) return;
+    let socket = null;
+    let retryTimer = null;
+    let retryDelay = 1000;
+    let stopped = false;
+
+    const connect = () => {
+      socket = new WebSocket(`${API_BASE.replace(/^http/, 'ws')}/chat/ws?token=${encodeURIComponent(token)}`);
+      socket.onopen = () => {
+        retryDelay = 1000;
+        setSocketOpen(true);
+      };
+      socket.onmessage = (e) => {
+        const data = JSON.parse(e.data);
+        if (data.type === 'message') {
+          receiveMessage(data.message);
+        } else if (data.type === 'read' && data.reader_id === myIdFromToken) {
+          // Read in another tab
+          setUnread(data.peer_id, 0);
+        }
+      };
+      socket.onclose = () => {
+        setSocketOpen(false);
+        if (stopped) return;
+        retryTimer = setTimeout(connect, retryDelay);
+        retryDelay = Math.min(retryDelay * 2, 30000);
+      };
+    };
+    connect();
+
+    return () => {
+      stopped = true;
+      clearTimeout(retryTimer);
+      if (socket) socket.close();
+    };
+  }, [token]);
+
+  // X-Sync-Token of the loaded history: later fetches ask only for newer messages.
+  const syncRef = useRef({ userId: null, token: null });
+
   useEffect(() => {
     if (!selectedUserId) return;
-    fetchMessages(selectedUserId);
+    const loaded = syncRef.current.userId === selectedUserId;
+    fetchMessages(selectedUserId, { silent: loaded, sync: loaded });
 
+    // Only poll while the socket is down; catch up once it is back.
+    if (socketOpen) return;
     const t = setInterval(() => {
-      fetchMessages(selectedUserId, { silent: true });
-    }, 5000);
+      fetchMessages(selectedUserId, { silent: true, sync: true });
+    }, 30000);
 
     return () => clearInterval(t);
-  }, [selectedUserId]);
+  }, [selectedUserId, socketOpen]);
+
+  const receiveMessage = (message) => {
+    const otherId = message.sender_id === myIdFromToken ? message.recipient_id : message.sender_id;
+
+    const incoming = message.sender_id !== myIdFromToken;
+    const open = otherId === selectedRef.current;
+
+    if (open) {
+      setMessages((prev) => (prev.some((m) => m.id === message.id) ? prev : [...prev, message]));
+      if (incoming) markRead(otherId, message.id);
+    }
+
+    setConversations((prev) => {
+      const existing = prev.find((c) => c.other_user_id === otherId);
+      if (!existing) {
+        fetchConversations();
+        return prev;
+      }
+      const updated = {
+        ...existing,
+        last_message: message.content,
+        last_message_at: message.created_at,
+        unread_count: incoming && !open ? (existing.unread_count || 0) + 1 : existing.unread_count
+      };
+      return [updated, ...prev.filter((c) => c.other_user_id !== otherId)];
+    });
+  };
+
+  const setUnread = (otherId, count) => {
+    setConversations((prev) => prev.map((c) => (c.other_user_id === otherId ? { ...c, unread_count: count } : c)));
+  };
+
+  // Advance the read watermark; the server caps it and ignores older ids.
+  const markRead = async (otherId, messageId) => {
+    setUnread(otherId, 0);
+    try {
+      await fetch(`${API_BASE}/chat/read`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          Authorization: `Bearer ${token}`
+        },
+        body: JSON.stringify([{ other_user_id: otherId, message_id: messageId }])
+      });
+    } catch {
+      // Retried on the next message or reload
+    }
+  };
 
   const fetchConversations = async () => {
     setLoadingConvos(true);
@@ -73,8 +170,11 @@ export default function Chat() {
     }
     setError('');
 
+    const since = options.sync && syncRef.current.userId === otherUserId ? syncRef.current.token : null;
+    const query = since ? `?since=${encodeURIComponent(since)}` : '';
+
     try {
-      const res = await fetch(`${API_BASE}/chat/messages/${otherUserId}`, {
+      const res = await fetch(`${API_BASE}/chat/messages/${otherUserId}${query}`, {
         headers: {
           Authorization: `Bearer ${token}`
         }
@@ -85,8 +185,17 @@ export default function Chat() {
         return;
       }
 
-      const data = await res.json();
-      setMessages(Array.isArray(data) ? data : []);
+      const body = await res.json();
+      const data = Array.isArray(body) ? body : [];
+      syncRef.current = { userId: otherUserId, token: res.headers.get('X-Sync-Token') };
+      if (since) {
+        setMessages((prev) => [...prev, ...data.filter((m) => !prev.some((p) => p.id === m.id))]);
+      } else {
+        setMessages(data);
+      }
+
+      const lastIncoming = [...data].reverse().find((m) => m.sender_id !== myIdFromToken);
+      if (lastIncoming) markRead(otherUserId, lastIncoming.id);
     } catch (e) {
       setError('Failed to load messages');
     } finally {
@@ -122,8 +231,10 @@ export default function Chat() {
         return;
       }
 
-      await fetchMessages(selectedUserId, { silent: true });
-      await fetchConversations();
+      // With the socket open the new message arrives as a push event.
+      if (!socketOpen) {
+        receiveMessage(await res.json());
+      }
     } catch (e2) {
       setError('Failed to send message');
     }
@@ -150,7 +261,10 @@ export default function Chat() {
                   className={`conversation-item ${selectedUserId === c.other_user_id ? 'active' : ''}`}
                   onClick={() => setSelectedUserId(c.other_user_id)}
                 >
-                  <div className="conversation-name">{c.other_user_name}</div>
+                  <div className="conversation-name">
+                    {c.other_user_name}
+                    {c.unread_count > 0 && <span className="conversation-unread">{c.unread_count}</span>}
+                  </div>
                   {c.last_message && (
                     <div className="conversation-last">{c.last_message}</div>
                   )}
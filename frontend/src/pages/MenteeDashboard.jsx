@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { API_BASE } from '../api';
+import { API_BASE, fetchAllPages } from '../api';
 import './Dashboard.css';
 
 export default function MenteeDashboard() {
@@ -20,12 +20,12 @@ export default function MenteeDashboard() {
     
     try {
       // Fetch bookings
-      const bookingsRes = await fetch(`${API_BASE}/bookings/my-bookings`, {
+      const bookingsRes = await fetchAllPages(`${API_BASE}/bookings/my-bookings`, {
         headers: { 'Authorization': `Bearer ${token}` }
       });
       
       if (bookingsRes.ok) {
-        const bookings = await bookingsRes.json();
+        const bookings = bookingsRes.items;
         const now = new Date();
         
         // Split into upcoming and past
@@ -43,13 +43,12 @@ export default function MenteeDashboard() {
       }
       
       // Fetch payment history
-      const paymentsRes = await fetch(`${API_BASE}/payments/my-payments`, {
+      const paymentsRes = await fetchAllPages(`${API_BASE}/payments/my-payments`, {
         headers: { 'Authorization': `Bearer ${token}` }
       });
       
       if (paymentsRes.ok) {
-        const payments = await paymentsRes.json();
-        setPaymentHistory(payments);
+        setPaymentHistory(paymentsRes.items);
       }
     } catch (error) {
       console.error('Failed to fetch dashboard data:', error);
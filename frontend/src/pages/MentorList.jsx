@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { API_BASE } from '../api';
+import { API_BASE, fetchAllPages } from '../api';
 import './MentorList.css';
 
 function splitList(value) {
@@ -23,10 +23,9 @@ export default function MentorList() {
 
   const fetchMentors = async () => {
     try {
-      const res = await fetch(`${API_BASE}/profiles/mentors`);
+      const res = await fetchAllPages(`${API_BASE}/profiles/mentors`);
       if (res.ok) {
-        const data = await res.json();
-        setMentors(data);
+        setMentors(res.items);
       }
     } catch (err) {
       console.error('Failed to fetch mentors:', err);
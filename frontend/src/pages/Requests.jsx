@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { API_BASE } from '../api';
+import { API_BASE, fetchAllPages } from '../api';
 import './Requests.css';
 
 export default function Requests() {
@@ -21,20 +21,18 @@ export default function Requests() {
     
     try {
       if (role === 'mentee') {
-        const sentRes = await fetch(`${API_BASE}/mentorship/requests/sent`, {
+        const sentRes = await fetchAllPages(`${API_BASE}/mentorship/requests/sent`, {
           headers: { 'Authorization': `Bearer ${token}` }
         });
         if (sentRes.ok) {
-          const data = await sentRes.json();
-          setSentRequests(data);
+          setSentRequests(sentRes.items);
         }
       } else if (role === 'mentor') {
-        const receivedRes = await fetch(`${API_BASE}/mentorship/requests/received`, {
+        const receivedRes = await fetchAllPages(`${API_BASE}/mentorship/requests/received`, {
           headers: { 'Authorization': `Bearer ${token}` }
         });
         if (receivedRes.ok) {
-          const data = await receivedRes.json();
-          setReceivedRequests(data);
+          setReceivedRequests(receivedRes.items);
         }
       }
 